@@ -32,12 +32,13 @@ module.exports = {
     {
       name: 'bist-financial-normal',
       script: 'bash',
-      args: '-c "source .venv/bin/activate && python scripts/financial_scraper_v2.py"',
+      args: '-c "source .venv/bin/activate && python scripts/financial_scraper_v2.py --incremental"', // Sadece yeni çeyrekler
       cron_restart: '0 4 * 1,3,4,6,7,9,10,12 3,6', // Normal aylar: Çarşamba (3) + Cumartesi (6) 04:00
       autorestart: false,
       max_memory_restart: '1000M',
       env: {
-        PYTHONUNBUFFERED: '1'
+        PYTHONUNBUFFERED: '1',
+        FINANCIAL_SCRAPER_JOURNAL: 'logs/financial_scraper_incremental_journal.jsonl'
       },
       error_file: './logs/pm2-financial-normal-error.log',
       out_file: './logs/pm2-financial-normal-out.log',
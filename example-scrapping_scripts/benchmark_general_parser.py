@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+General Page Parser Benchmark - compiled lxml parser vs BeautifulSoup section parsers
+
+Parses saved KAP general pages with both KAPCompaniesAPI._parse_general_sections
+(html.parser BeautifulSoup + CSS selectors, including building the soup, as
+parse_general_page did) and kap_general_parser.parse_general_html, checks that
+the sections are identical (same JSON, key order included) and reports parse
+time per page.
+
+Fixtures are the *.html files in --fixtures. Save real pages with
+    python kap_companies_api.py --fetch selenium general --limit 50 --save-html /tmp/kap_general_pages
+If the directory is empty, synthetic pages with the general page's DOM
+layout (and its awkward cases: missing sections, "-" values, comments,
+scripts, entities, header-less tables, block elements inside <p> as found
+in page_source) are generated there first. The lxml parser stays opt-in
+until real saved pages report identical output here.
+No network or browser needed.
+
+Usage:
+    python benchmark_general_parser.py --fixtures /tmp/kap_general_pages --repeat 5
+"""
+import os
+import sys
+import glob
+import json
+import time
+import random
+import argparse
+from html import escape
+
+from bs4 import BeautifulSoup
+
+from kap_companies_api import KAPCompaniesAPI
+from kap_general_parser import HAVE_LXML, parse_general_html
+
+TABLE_HEAD = '<div class="flex items-center justify-between py-4 company__sgbf-h6-title"><div class="font-semibold text-sm text-danger">{}</div></div>'
+
+
+def _table(rng: random.Random, title: str, columns: list, rows: int) -> str:
+    if rng.random() < 0.1:
+        # Table without thead: rows keyed by index
+        thead = ""
+    else:
+        thead = "<thead><tr>" + "".join(f"<th>{escape(c)}</th>" for c in columns) + "</tr></thead>"
+    body = []
+    for r in range(rows):
+        cells = []
+        for c, col in enumerate(columns):
+            value = _cell_value(rng, col, r)
+            cells.append(f"<td class=\"px-2\">{value}</td>")
+        if rng.random() < 0.05:
+            cells = cells[:-1]  # short row: falls back to index keys
+        body.append("<tr>" + "".join(cells) + "</tr>")
+    # item > div > [title bar, scroll wrapper > table]
+    return (f'<div><div>{TABLE_HEAD.format(escape(title))}'
+            f'<div class="overflow-x-auto w-full"><table class="min-w-full">{thead}<tbody>{"".join(body)}</tbody></table></div></div></div>')
+
+
+def _cell_value(rng: random.Random, column: str, row: int) -> str:
+    pick = rng.random()
+    if pick < 0.08:
+        return "-"
+    if pick < 0.12:
+        return ""
+    if "Date" in column:
+        return f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(1995, 2025)}"
+    if "(%)" in column or "Ratio" in column:
+        return f"{rng.randint(0, 100)},{rng.randint(0, 99):02d}"
+    if "TL" in column or "Capital" in column or "Value" in column:
+        return f"{rng.randint(1, 999)}.{rng.randint(0, 999):03d}.{rng.randint(0, 999):03d},{rng.randint(0, 99):02d}"
+    if "Link" in column:
+        return f'<a href="https://www.kap.org.tr/tr/Bildirim/{rng.randint(1, 10**6)}">https://www.kap.org.tr/tr/Bildirim/{rng.randint(1, 10**6)}</a>'
+    if "Whether" in column or "Traded" in column:
+        return rng.choice(["Yes", "No", "Evet", "Hayır", "Traded"])
+    words = ["ŞİRKET", "Yönetim", "Kurulu", "Üyesi", "A.Ş.", "İstanbul", "Genel&nbsp;Müdür", "<b>Bağımsız</b>", "Çağrı", "ğüşiöç"]
+    text = " ".join(rng.choice(words) for _ in range(rng.randint(1, 6)))
+    if rng.random() < 0.1:
+        text += " <!-- note -->  \n  ek"
+    return text
+
+
+def _p_block(rng: random.Random) -> str:
+    """Block element inside a <p> (rich-text values in page_source): html.parser keeps it, libxml2 closes the <p>"""
+    return rng.choice(["", "", "", "<div>Şube</div>", "<ul><li>ek tesis</li></ul>", "<table><tr><td>ada</td></tr></table>"])
+
+
+def _text_item(title: str, value: str) -> str:
+    """item > div > div > [div > span title, span value]"""
+    return f"<div><div><div><div><span>{escape(title)}</span></div><span>{value}</span></div></div></div>"
+
+
+def _short_item(title: str, value: str) -> str:
+    """item > div > [div > span title, span value]"""
+    return f"<div><div><div><span>{escape(title)}</span></div><span>{value}</span></div></div>"
+
+
+def _danger_item(title: str, value: str) -> str:
+    """item > div > [div > div.font-semibold title, span value]"""
+    return f'<div><div><div><div class="font-semibold text-sm text-danger">{escape(title)}</div></div><span>{value}</span></div></div>'
+
+
+def _section(title: str, body: str, wrap: int = 4) -> str:
+    """#general section: toggle button plus body nested `wrap` divs deep above the items"""
+    inner = body
+    for _ in range(wrap):
+        inner = f"<div>{inner}</div>"
+    return (f'<div class="company__section"><div><button aria-expanded="true" type="button">{escape(title)}</button>'
+            f'{inner}</div></div>')
+
+
+def _value(rng: random.Random, text: str) -> str:
+    pick = rng.random()
+    if pick < 0.06:
+        return "-"
+    if pick < 0.1:
+        return "Info not available"
+    if pick < 0.13:
+        return ""
+    return text
+
+
+def synthetic_general_page(rng: random.Random, code: str, filler_kb: int) -> str:
+    board_cols = ["Name-Surname", "Real Person Acting on Behalf of Legal Person Member", "Gender", "Title", "Profession",
+                  "The First Election Date To Board", "Whether Executive Director or Not",
+                  "Positions Held in the Company in the Last 5 Years", "Current Positions Held Outside the Company",
+                  "Whether the Director has at Least 5 Years’ Experience on Audit, Accounting and/or Finance or not",
+                  "Share in Capital (%)", "The Share Group that the Board Member Representing",
+                  "Independent Board Member or not", "Link To PDP Notification That Includes The Independency Declaration",
+                  "Whether the Independent Director Considered By The Nomination Committee",
+                  "Whether She/He is the Director Who Ceased to Satisfy The Independence or Not", "Committees Charged and Task"]
+    if rng.random() < 0.5:
+        facilities = "".join(f"<p>{i + 1}. Fabrika: OSB {rng.randint(1, 99)}. Cadde No:{rng.randint(1, 200)} &amp; Depo{_p_block(rng)}</p>"
+                             for i in range(rng.randint(1, 4)))
+    else:
+        facilities = "<br>".join(f"Tesis {i + 1} - Gebze / KOCAELİ" for i in range(rng.randint(0, 3)))
+    scope = ("".join(f"<p>{escape(code)} faaliyet alanı {i}: üretim,\n  ithalat{_p_block(rng)} ve ihracat.</p>" for i in range(rng.randint(1, 3)))
+             if rng.random() < 0.7 else f"{escape(code)} holding faaliyetleri <i>ve</i> iştirak yönetimi")
+
+    contact = "".join([
+        _text_item("Head Office Address", _value(rng, f"Büyükdere Cad. No:{rng.randint(1, 300)} Şişli / İSTANBUL")),
+        _table(rng, "Communication Address, Phone and Fax", ["Address", "Phone", "Fax"], rng.randint(0, 2)),
+        _text_item("Production Facilities Address", facilities),
+        _table(rng, "E-mail Address", ["E-mail Address"], rng.randint(0, 2)),
+        _text_item("Web-site", _value(rng, f"<a href='https://{code.lower()}.com.tr'>www.{code.lower()}.com.tr</a>")),
+        _table(rng, "Investor Relations Department or Contact People",
+               ["Name-Surname", "Position", "Assignment Date", "Phone", "Email", "Type of Licence Document", "Licence Document No"],
+               rng.randint(0, 4)),
+    ])
+    scope_items = "".join([
+        _short_item("Scope of Activities of Company", scope),
+        _short_item("Duration of Company", _value(rng, "Süresiz")),
+        _short_item("Independent Audit Company", _value(rng, "PwC Bağımsız Denetim ve SMMM A.Ş.")),
+        _short_item("Sector of Company", _value(rng, "GIDA, İÇECEK VE TÜTÜN")),
+    ])
+    markets = "".join([
+        "<div>" + _short_item("BIST Market where Company's Capital Market Instruments are Traded", _value(rng, "YILDIZ PAZAR"))
+        + _short_item("BIST Indices that the Company is Included", _value(rng, "BIST 100 / BIST 50 / BIST TÜM")) + "</div>",
+        _table(rng, "Current List of Other Exchanges or Organized Markets where the Company's Capital Market Instruments are Listed or Traded",
+               ["Type of The Listed/Trading Capital Market Instrument", "Initial Date of Listing/Trading",
+                "Country of the Market/Stock Exchange", "Name of the Market/Stock Exchange",
+                "Relevant sub-market of the Market or Stock Exchange"], rng.randint(0, 2)),
+        _danger_item("Information About Issued Capital Market Instruments Other Than Shares", _value(rng, "Borçlanma aracı yoktur.")),
+    ])
+    registration = "".join([
+        _short_item("Registry Office", _value(rng, "İstanbul Ticaret Sicili Müdürlüğü")),
+        _short_item("Registration Date", _value(rng, f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(1950, 2020)}")),
+        _short_item("Registration Number", _value(rng, f"{rng.randint(1000, 999999)}")),
+        _short_item("Tax Number", _value(rng, f"{rng.randint(10**9, 10**10 - 1)}")),
+        _short_item("Tax Office", _value(rng, "Büyük Mükellefler")),
+    ])
+    management = "".join([
+        _table(rng, "Board Members", board_cols, rng.randint(3, 12)),
+        _table(rng, "Top Management", ["Name-Surname", "Title", "Profession",
+                                       "Positions Held in the Company in the Last 5 Years",
+                                       "Current Positions Held Outside the Company"], rng.randint(2, 10)),
+    ])
+    capital = "".join([
+        "<div>" + _short_item("Paid-in/Issued Capital", _value(rng, f"{rng.randint(1, 999)}.{rng.randint(0, 999):03d}.000,00"))
+        + _short_item("Authorized Capital", _value(rng, f"{rng.randint(1, 999)}.000.000,00")) + "</div>",
+        _table(rng, "Breakdown of Shareholders Holding More Than 5% of the Capital and Voting Rights",
+               ["Shareholder", "Share in Capital (TL)", "Ratio in Capital (%)", "Voting Right Ratio(%)"], rng.randint(1, 5)),
+        "<div><div>Grafik</div></div>",
+        _danger_item("Current Breakdown of Indirect Shareholders", _value(rng, "Dolaylı pay sahibi <b>yoktur</b>.")),
+        _table(rng, "Actual Shares Outstanding", ["Exchange Code", "Actual Shares Outstanding(TL)", "Actual Outstanding Shares Ratio(%)"],
+               rng.randint(1, 2)),
+        "<div></div>",
+        _table(rng, "Information About Shares Representing the Capital",
+               ["Share Group", "Registered / Bearer Share", "Nominal Value per Share (TL)", "Monetary Unit",
+                "Nominal Value of Shares", "Ratio to Total Capital", "Type of Privilege", "Exchange Traded or Not"],
+               rng.randint(1, 3)),
+    ])
+    subsidiaries = _table(rng, "Subsidiaries, Financial Non-Current Assets and Financial Investments",
+                          ["Company Title", "Scope of Activities of Company", "Paid-in/Issued Capital", "Capital Share of Company",
+                           "Monetary Unit", "Ratio of Capital Share of Company (%)", "Relation with the Company"],
+                          rng.randint(0, 8))
+    misc = "<div>" + _short_item("Miscellaneous", _value(rng, "Ek açıklama <script>track()</script>bulunmamaktadır.")) + "</div>"
+
+    sections = [
+        _section("CONTACT INFORMATION", contact),
+        _section("SCOPE OF ACTIVITIES AND INDEPENDENT AUDIT COMPANY INFORMATION", f"<div>{scope_items}</div>"),
+        _section("MARKETS, INDICES AND CAPITAL MARKET INSTRUMENTS", markets),
+        _section("REGISTRATION AND TAX OFFICE INFORMATION", f"<div>{registration}</div>"),
+        _section("COMPANY MANAGEMENT", management),
+        _section("CAPITAL AND SHAREHOLDER STRUCTURE", capital),
+        _section("SUBSIDIARIES, FINANCIAL NON-CURRENT ASSETS AND FINANCIAL INVESTMENTS", subsidiaries),
+        _section("MISCELLANEOUS", misc),
+    ]
+    if rng.random() < 0.1:
+        sections[rng.randrange(len(sections))] = "<div><!-- section not rendered --></div>"
+
+    toggle = ('<div class="flex gap-3 justify-end items-center w-full h-max text-sm font-medium p-4 company__sgbf-remove">'
+              '<button type="button">Tümünü Aç</button></div>')
+    nav = "".join(f'<li><a href="/tr/sayfa/{i}">Menü öğesi {i}</a></li>' for i in range(200))
+    filler = "".join(f'<script>self.__next_f.push([1,"{"x" * 1000}"])</script>' for _ in range(filler_kb))
+    return (f'<!DOCTYPE html><html lang="en"><head><meta charset="utf-8"><title>{escape(code)} - KAP</title>'
+            f'<link rel="stylesheet" href="/_next/static/css/app.css"></head><body><header><nav><ul>{nav}</ul></nav></header>'
+            f'<main><div id="general"><div><div>{toggle}{"".join(sections)}</div></div></div></main>'
+            f'<footer>Kamuyu Aydınlatma Platformu</footer>{filler}</body></html>')
+
+
+def save_synthetic_fixtures(directory: str, companies: int, filler_kb: int):
+    """Write generated general pages as <code>.html"""
+    rng = random.Random(2025)
+    os.makedirs(directory, exist_ok=True)
+    for idx in range(companies):
+        code = f"SYN{idx:03d}"
+        with open(os.path.join(directory, f"{code}.html"), "w", encoding="utf-8") as f:
+            f.write(synthetic_general_page(rng, code, filler_kb))
+
+
+def best_ms(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark KAP general page section parsing")
+    parser.add_argument("--fixtures", default="/tmp/kap_general_pages", help="Directory of saved general page *.html files")
+    parser.add_argument("--companies", type=int, default=30, help="Synthetic pages to generate when --fixtures is empty")
+    parser.add_argument("--filler-kb", type=int, default=150, help="Script payload per synthetic page (real pages carry large framework payloads)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per page (best is reported)")
+    args = parser.parse_args()
+
+    if not HAVE_LXML:
+        print("lxml and cssselect are required: pip install lxml cssselect")
+        sys.exit(2)
+
+    paths = sorted(glob.glob(os.path.join(args.fixtures, "*.html")))
+    if not paths:
+        save_synthetic_fixtures(args.fixtures, args.companies, args.filler_kb)
+        paths = sorted(glob.glob(os.path.join(args.fixtures, "*.html")))
+
+    api = KAPCompaniesAPI(fetch_backend="http")
+    soup_parse = lambda html: api._parse_general_sections(BeautifulSoup(html, "html.parser"))
+
+    soup_ms, lxml_ms = [], []
+    mismatches = 0
+    total_bytes = 0
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+        total_bytes += len(html.encode("utf-8"))
+
+        expected = json.dumps(soup_parse(html), ensure_ascii=False)
+        actual = json.dumps(parse_general_html(html, api), ensure_ascii=False)
+        if actual != expected:
+            mismatches += 1
+            print(f"✗ {os.path.basename(path)}: lxml output differs from BeautifulSoup")
+
+        soup_ms.append(best_ms(lambda: soup_parse(html), args.repeat))
+        lxml_ms.append(best_ms(lambda: parse_general_html(html, api), args.repeat))
+
+    soup_mean = sum(soup_ms) / len(soup_ms)
+    lxml_mean = sum(lxml_ms) / len(lxml_ms)
+    print("=" * 78)
+    print(f"Fixtures:         {len(paths)} pages, {total_bytes / len(paths) / 1024:.0f} KiB average ({args.fixtures})")
+    print(f"BeautifulSoup:    {soup_mean:8.2f} ms/page (max {max(soup_ms):.2f})")
+    print(f"lxml compiled:    {lxml_mean:8.2f} ms/page (max {max(lxml_ms):.2f}) -> {soup_mean / lxml_mean:.1f}x faster")
+    print(f"Identical output: {len(paths) - mismatches}/{len(paths)}")
+    print("=" * 78)
+    api.close()
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
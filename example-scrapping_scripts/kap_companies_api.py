@@ -21,32 +21,52 @@ Quick start / Hızlı başlangıç
 - Persist previously exported JSON with the unified CLI:
     zsh: python persist_cli.py general sample_general.json --dry-run --batch-size 100
 
+- Choose how pages are fetched (default: Selenium). Plain HTTP with Selenium fallback
+  is opt-in until the server-rendered pages have been checked against real ones:
+    zsh: python kap_companies_api.py --fetch auto general --limit 10
+
+- Parse general pages in parallel on a browser pool (see kap_browser_pool.py):
+    zsh: python kap_companies_api.py general --workers 4 --pages-per-driver 50 --max-rps 4
+
+- General pages are parsed with the BeautifulSoup parsers by default. The compiled lxml
+  parser (kap_general_parser.py) builds the same tree as html.parser (a <div> inside a <p>
+  stays there); it is opt-in until saved real pages pass the parity benchmark:
+    zsh: python kap_companies_api.py --save-html /tmp/kap_general_pages general --limit 50
+    zsh: python benchmark_general_parser.py --fixtures /tmp/kap_general_pages
+    zsh: python kap_companies_api.py --parser lxml general --limit 10
+
 See README:
 - Quick Start: README.md#quick-start-macos-zsh
 - Commands Reference: README.md#commands-reference
 - DB/Schema: README.md#database-and-schema
 
-Requirements: Python 3.10.17 venv, Chrome + matching ./chromedriver
+Requirements: Python 3.10.17 venv, Chrome + matching ./chromedriver (only needed
+unless --fetch http; with --fetch auto only when a page has to be rendered)
 """
 
 import time
 import json
+import threading
 import os
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any
 import argparse
 import sys
 import argparse
 
+import requests
 from bs4 import BeautifulSoup
 from pydantic import BaseModel, Field, HttpUrl, ValidationError
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from datetime import datetime
 
+from kap_browser_pool import BrowserPool, RateLimiter
+from kap_waits import PageWaiter, WAIT_STATS
+from kap_resource_blocking import DEFAULT_POLICY, ResourceBlocker
+from kap_general_parser import HAVE_LXML, parse_general_html
+
 # --- Pydantic Data Model ---
 
 class CompanySummary(BaseModel):
@@ -60,63 +80,220 @@ class CompanySummary(BaseModel):
 # --- Main API Class ---
 
 class KAPCompaniesAPI:
-    """A client to fetch company information from KAP."""
+    """
+    A client to fetch company information from KAP.
+
+    Pages are fetched according to `fetch_backend`:
+    - "selenium": headless Chrome only (default)
+    - "auto": plain HTTP first; a page whose server-rendered HTML lacks any of the
+      data is rendered with Selenium instead (the driver is only started when needed)
+    - "http": plain HTTP only
+    HTTP is opt-in until it has been checked against real pages.
+    """
     BASE_URL = "https://www.kap.org.tr"
     COMPANIES_LIST_URL = f"{BASE_URL}/tr/bist-sirketler"
-
-    def __init__(self, driver_path: str = 'chromedriver', driver: Optional[webdriver.Chrome] = None):
-        """Initializes the API, using a shared driver if provided."""
-        if driver:
+    FETCH_BACKENDS = ("auto", "http", "selenium")
+    GENERAL_PARSERS = ("lxml", "soup")
+    # Upper bound (s) for the settle wait when there is no selector to wait for
+    FALLBACK_WAIT = 2.0
+
+    # Plain HTTP fetches. English, like headless Chrome's default Accept-Language,
+    # so section and column titles match TABLE_SCHEMAS.
+    HTTP_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+    }
+    HTTP_MIN_INTERVAL = 2.0  # seconds between requests, the Selenium pace (unless a shared rate limiter is given)
+    HTTP_MAX_INCOMPLETE = 3  # consecutive incomplete HTTP pages before "auto" stops trying HTTP
+
+    # Sections every listed company fills in; if all of them come back empty the
+    # server-rendered HTML did not contain the (collapsed) section bodies
+    GENERAL_REQUIRED_SECTIONS = ("contact_information", "scope_and_audit", "registration_tax", "capital_shareholders")
+    GENERAL_SECTION_KEYS = (
+        "contact_information", "scope_and_audit", "markets_indices_instruments", "registration_tax",
+        "company_management", "capital_shareholders", "subsidiaries_investments", "miscellaneous",
+    )
+    # Tables every listed company fills in
+    GENERAL_REQUIRED_TABLES = ("Board Members", "Top Management")
+    # The BIST list has ~590 companies; fewer rows means a partially rendered list
+    COMPANIES_MIN_ROWS = 500
+
+    def __init__(
+        self,
+        driver_path: str = 'chromedriver',
+        driver: Optional[webdriver.Chrome] = None,
+        fetch_backend: str = "selenium",
+        driver_source: Optional[Callable[[], Optional[webdriver.Chrome]]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        block_resources: bool = True,
+        general_parser: str = "soup",
+        save_html_dir: Optional[str] = None,
+    ):
+        """
+        Initializes the API, using a shared driver if provided.
+        `driver_source` is asked for the driver whenever one is needed (a browser pool
+        lease, whose driver may be recycled between pages); `rate_limiter` is shared
+        with other clients to cap the overall KAP request rate. `block_resources`
+        blocks images, fonts, stylesheets, trackers and third-party hosts in the
+        drivers this client starts (see kap_resource_blocking.py). `general_parser`
+        "lxml" opts into kap_general_parser (BeautifulSoup parsers if lxml is missing);
+        `save_html_dir` keeps each parsed general page's HTML there.
+        """
+        if fetch_backend not in self.FETCH_BACKENDS:
+            raise ValueError(f"fetch_backend must be one of {self.FETCH_BACKENDS}")
+        if general_parser not in self.GENERAL_PARSERS:
+            raise ValueError(f"general_parser must be one of {self.GENERAL_PARSERS}")
+        self.general_parser = general_parser if HAVE_LXML else "soup"
+        self.save_html_dir = save_html_dir
+        self.fetch_backend = fetch_backend
+        self.driver_path = driver_path
+        self.fetch_stats = {"http": 0, "selenium": 0, "http_incomplete": 0}
+        self._http_session: Optional[requests.Session] = None
+        self._http_incomplete_streak = 0
+        self.rate_limiter = rate_limiter or RateLimiter(1.0 / self.HTTP_MIN_INTERVAL)
+        self._own_rate_limiter = rate_limiter is None
+        self._driver_source = driver_source
+        self.resource_blocker = ResourceBlocker(DEFAULT_POLICY if block_resources else None)
+        if driver or driver_source:
             self.driver = driver
             self._shared_driver = True
         else:
             self._shared_driver = False
-            chrome_options = Options()
-            # Step A optimizations: new headless, disable images, eager load, fewer extras
-            chrome_options.add_argument("--headless=new")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--disable-notifications")
-            chrome_options.add_argument("--window-size=1920,1080")
-            # Do not load images to save bandwidth/CPU
-            prefs = {
-                "profile.managed_default_content_settings.images": 2,
-                "profile.default_content_setting_values.images": 2,
-            }
-            chrome_options.add_experimental_option("prefs", prefs)
-            # Faster page load strategy
-            chrome_options.page_load_strategy = 'eager'
-            
-            if not os.path.exists(driver_path):
-                raise FileNotFoundError(f"ChromeDriver not found at {driver_path}")
+            self.driver = None
+            # Without a driver to share, Chrome is started lazily unless it is the only backend
+            if fetch_backend == "selenium":
+                self.driver = self._create_driver()
+
+    def _create_driver(self) -> Optional[webdriver.Chrome]:
+        """Start headless Chrome with the page-load optimizations below."""
+        driver_path = self.driver_path
+        chrome_options = Options()
+        # Step A optimizations: new headless, disable images, eager load, fewer extras
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-notifications")
+        chrome_options.add_argument("--window-size=1920,1080")
+        # Do not load images to save bandwidth/CPU
+        prefs = {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.images": 2,
+        }
+        chrome_options.add_experimental_option("prefs", prefs)
+        # Faster page load strategy
+        chrome_options.page_load_strategy = 'eager'
+        # Block fonts, stylesheets, trackers and third-party hosts; log network events per page
+        self.resource_blocker.configure(chrome_options)
+        
+        if not os.path.exists(driver_path):
+            raise FileNotFoundError(f"ChromeDriver not found at {driver_path}")
 
+        try:
+            service = Service(executable_path=driver_path)
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+            self.resource_blocker.apply(driver)
+            return driver
+        except Exception as e:
+            print(f"Failed to initialize Chrome Driver: {e}")
+            return None
+
+    def _ensure_driver(self) -> Optional[webdriver.Chrome]:
+        """The Selenium driver, started on first use."""
+        if self.fetch_backend == "http":
+            return self.driver
+        if self._driver_source is not None:
+            self.driver = self._driver_source()
+        elif self.driver is None:
             try:
-                service = Service(executable_path=driver_path)
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            except Exception as e:
-                print(f"Failed to initialize Chrome Driver: {e}")
-                self.driver = None
+                self.driver = self._create_driver()
+            except FileNotFoundError as e:
+                print(e)
+        return self.driver
+
+    @property
+    def _http_enabled(self) -> bool:
+        if self.fetch_backend == "selenium":
+            return False
+        return self.fetch_backend == "http" or self._http_incomplete_streak < self.HTTP_MAX_INCOMPLETE
+
+    def _get_soup_with_http(self, url: str, **kwargs) -> Optional[BeautifulSoup]:
+        """Fetches the server-rendered HTML of a URL and returns a BeautifulSoup object."""
+        html = self._get_html_with_http(url, **kwargs)
+        return BeautifulSoup(html, "html.parser") if html is not None else None
+
+    def _get_html_with_http(self, url: str, timeout: int = 15, attempts: int = 3, backoff: float = 1.6) -> Optional[str]:
+        """Fetches the server-rendered HTML of a URL (with retry/backoff)."""
+        if self._http_session is None:
+            self._http_session = requests.Session()
+            self._http_session.headers.update(self.HTTP_HEADERS)
+        for attempt in range(1, attempts + 1):
+            self.rate_limiter.acquire()
+            try:
+                response = self._http_session.get(url, timeout=timeout)
+                if response.status_code == 429 or response.status_code >= 500:
+                    raise requests.HTTPError(f"HTTP {response.status_code}", response=response)
+                response.raise_for_status()
+                return response.text
+            except requests.RequestException as e:
+                status = e.response.status_code if e.response is not None else None
+                if status is not None and status < 500 and status != 429:
+                    print(f"HTTP fetch of {url} failed: {e}")
+                    return None
+                print(f"Attempt {attempt}/{attempts} failed fetching {url} over HTTP: {e}")
+                if attempt < attempts:
+                    time.sleep(backoff ** attempt)
+        print(f"Giving up on {url} over HTTP")
+        return None
 
-    def _get_soup_with_selenium(self, url: str, wait_selector: Optional[str] = None, timeout: int = 8, attempts: int = 3, backoff: float = 1.6) -> Optional[BeautifulSoup]:
-        """Fetches a URL using Selenium (with retry/backoff) and returns a BeautifulSoup object."""
-        if not self.driver:
+    def _get_soup(
+        self,
+        url: str,
+        wait_selector: Optional[str] = None,
+        complete: Optional[Callable[[BeautifulSoup], bool]] = None,
+    ) -> Optional[BeautifulSoup]:
+        """
+        Fetches a URL with the configured backend. Over HTTP the page only counts
+        if `wait_selector` is already present in the server-rendered HTML and
+        `complete(soup)` (if given) holds; otherwise ("auto") it is rendered with Selenium.
+        """
+        if self._http_enabled:
+            soup = self._get_soup_with_http(url)
+            if (soup is not None and (not wait_selector or soup.select_one(wait_selector))
+                    and (complete is None or complete(soup))):
+                self.fetch_stats["http"] += 1
+                return soup
+            if self.fetch_backend == "http":
+                return None
+        self.fetch_stats["selenium"] += 1
+        soup = self._get_soup_with_selenium(url, wait_selector=wait_selector)
+        self.resource_blocker.record_page(self.driver, url)
+        return soup
+
+    def _get_soup_with_selenium(self, url: str, wait_selector: Optional[str] = None, timeout: Optional[float] = None, attempts: int = 3, backoff: float = 1.6) -> Optional[BeautifulSoup]:
+        """
+        Fetches a URL using Selenium (with retry/backoff) and returns a BeautifulSoup object.
+        Returns as soon as `wait_selector` is present (timeout per selector, see kap_waits).
+        If it never shows up, waits at most 2 s more for the DOM to settle; without a
+        selector, at most 2 s for the network to go idle (pages that keep polling XHR
+        never do), i.e. no longer than the fixed 2 s sleep these replaced.
+        """
+        if not self._ensure_driver():
             return None
+        waiter = PageWaiter(self.driver)
         for attempt in range(1, attempts + 1):
             try:
+                if self._driver_source is None:
+                    # Pooled drivers are throttled by the pool's limiter on driver.get
+                    self.rate_limiter.acquire()
                 self.driver.get(url)
                 if wait_selector:
-                    try:
-                        WebDriverWait(self.driver, timeout).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector))
-                        )
-                    except Exception:
-                        # Fallback static wait (short)
-                        time.sleep(min(2.0, float(timeout)))
+                    if not waiter.for_selector(wait_selector, timeout):
+                        waiter.for_dom_stable(timeout=self.FALLBACK_WAIT)
                 else:
-                    # Short generic wait
-                    time.sleep(2.0)
+                    waiter.for_network_idle(timeout=self.FALLBACK_WAIT)
                 return BeautifulSoup(self.driver.page_source, "html.parser")
             except Exception as e:
                 print(f"Attempt {attempt}/{attempts} failed fetching {url}: {e}")
@@ -127,44 +304,63 @@ class KAPCompaniesAPI:
                     print(f"Giving up on {url}")
                     return None
 
-    def _get_general_soup_and_expand(self, url: str, timeout: int = 8) -> Optional[BeautifulSoup]:
+    # General page: "expand all" toggle and the per-section toggles
+    EXPAND_ALL_SELECTOR = "#general > div > div > div.flex.gap-3.justify-end.items-center.w-full.h-max.text-sm.font-medium.p-4.company__sgbf-remove > button"
+    SECTION_BUTTON_SELECTOR = "#general > div > div > div > div > button"
+
+    def _get_general_soup_and_expand(self, url: str, timeout: Optional[float] = None) -> Optional[BeautifulSoup]:
+        """_get_general_html_and_expand as a BeautifulSoup."""
+        html = self._get_general_html_and_expand(url, timeout=timeout)
+        return BeautifulSoup(html, "html.parser") if html is not None else None
+
+    def _get_general_html_and_expand(self, url: str, timeout: Optional[float] = None) -> Optional[str]:
         """
         Navigate to the company's general info page, ensure the General tab is open
-        and sections are expanded, then return a BeautifulSoup of the page.
+        and sections are expanded, then return the page HTML.
+        Each click waits for the section toggles to report aria-expanded="true";
+        where that state is not exposed, for the section DOM to stop changing.
         """
-        if not self.driver:
+        if not self._ensure_driver():
             return None
         try:
             # Use retry-enabled loader
             soup_dummy = self._get_soup_with_selenium(url, wait_selector="#general", timeout=timeout)
             if not soup_dummy:
                 return None
+            waiter = PageWaiter(self.driver)
 
             # Attempt to expand all sections via the toggle button if present
             try:
-                btn = self.driver.find_element(By.CSS_SELECTOR, "#general > div > div > div.flex.gap-3.justify-end.items-center.w-full.h-max.text-sm.font-medium.p-4.company__sgbf-remove > button")
+                btn = self.driver.find_element(By.CSS_SELECTOR, self.EXPAND_ALL_SELECTOR)
                 # Click up to 2 times to reach 'expanded' state if it's a toggle
                 for _ in range(2):
                     btn.click()
-                    time.sleep(0.4)
+                    expanded = waiter.for_attribute_all(self.SECTION_BUTTON_SELECTOR, "aria-expanded", "true", timeout=1.5)
+                    if expanded is None:
+                        waiter.for_dom_stable("#general", timeout=1.5)
+                        break
+                    if expanded:
+                        break
             except Exception:
                 # Fallback: try to open each section by clicking its button
                 try:
-                    section_buttons = self.driver.find_elements(By.CSS_SELECTOR, "#general > div > div > div > div > button")
+                    section_buttons = self.driver.find_elements(By.CSS_SELECTOR, self.SECTION_BUTTON_SELECTOR)
                     for b in section_buttons:
                         try:
                             # Click if aria-expanded is false or missing
                             expanded = b.get_attribute("aria-expanded")
                             if expanded is None or expanded == "false":
                                 b.click()
-                                time.sleep(0.4)
                         except Exception:
                             continue
+                    if waiter.for_attribute_all(self.SECTION_BUTTON_SELECTOR, "aria-expanded", "true", timeout=2.0) is None:
+                        waiter.for_dom_stable("#general", timeout=2.0)
                 except Exception:
                     pass
 
-            time.sleep(0.8)
-            return BeautifulSoup(self.driver.page_source, "html.parser")
+            # Section bodies render after the toggle flips; wait for them to settle
+            waiter.for_dom_stable("#general", quiet=0.2, timeout=2.0)
+            return self.driver.page_source
         except Exception as e:
             print(f"Error preparing General Info page at {url}: {e}")
             return None
@@ -182,7 +378,7 @@ class KAPCompaniesAPI:
             "fetched_at": ISO-8601 timestamp string
         }
         """
-        soup = self._get_soup_with_selenium(url, wait_selector=wait_selector)
+        soup = self._get_soup(url, wait_selector=wait_selector)
         if not soup:
             return None
 
@@ -204,8 +400,12 @@ class KAPCompaniesAPI:
         Fetches the list of all BIST companies with their code, name, city, 
         and auditor information.
         """
-        print("Fetching company list using Selenium...")
-        soup = self._get_soup_with_selenium(self.COMPANIES_LIST_URL, wait_selector="tbody")
+        print(f"Fetching company list ({self.fetch_backend})...")
+        soup = self._get_soup(
+            self.COMPANIES_LIST_URL,
+            wait_selector="tbody tr.border-b",
+            complete=lambda s: len(s.select("tbody tr.border-b")) >= self.COMPANIES_MIN_ROWS,
+        )
         if not soup:
             return []
 
@@ -771,16 +971,25 @@ class KAPCompaniesAPI:
         })
         return out
 
-    def parse_general_page(self, url: str) -> dict:
-        """
-        Parse the general info page to a structured, hierarchical JSON-friendly dict
-        using only the given general 'detail_url'. All empty values become None.
-        """
-        soup = self._get_general_soup_and_expand(url)
+    def _parse_general_html(self, html: str, url: Optional[str] = None) -> tuple:
+        """Parse a general page's HTML with the configured parser. Returns (sections, errors)."""
+        if self.save_html_dir and url:
+            self._save_html(url, html)
+        if self.general_parser == "lxml":
+            return parse_general_html(html, self)
+        return self._parse_general_sections(BeautifulSoup(html, "html.parser"))
+
+    def _save_html(self, url: str, html: str):
+        os.makedirs(self.save_html_dir, exist_ok=True)
+        name = url.rstrip("/").rsplit("/", 1)[-1] or "index"
+        if not name.endswith(".html"):
+            name += ".html"
+        with open(os.path.join(self.save_html_dir, name), "w", encoding="utf-8") as f:
+            f.write(html)
+
+    def _parse_general_sections(self, soup: BeautifulSoup) -> tuple:
+        """Run all section parsers on a general page. Returns (sections, errors)."""
         entry_errors: List[str] = []
-        if not soup:
-            return {"detail_url": url, "fetched_at": datetime.utcnow().isoformat() + "Z", "sections": [], "errors": ["Failed to load page"]}
-
         sections = []
         try:
             sections.append(self._parse_contact_information(soup))
@@ -830,22 +1039,179 @@ class KAPCompaniesAPI:
             msg = f"Miscellaneous parse error: {e}"
             print(msg)
             entry_errors.append(msg)
+        return [s for s in sections if s], entry_errors
+
+    @staticmethod
+    def _section_has_content(section: dict) -> bool:
+        for sub in section.get("subsections", []):
+            if sub.get("text") is not None or sub.get("items") or (sub.get("table") or {}).get("rows"):
+                return True
+        return False
 
+    def _general_content_complete(self, sections: List[dict]) -> bool:
+        """
+        True if every section was parsed, every always-filled section has a value,
+        every table was rendered (has its header) and the always-filled tables have rows.
+        """
+        by_key = {s.get("section_key"): s for s in sections}
+        if any(key not in by_key for key in self.GENERAL_SECTION_KEYS):
+            return False
+        if not all(self._section_has_content(by_key[key]) for key in self.GENERAL_REQUIRED_SECTIONS):
+            return False
+        for section in sections:
+            for sub in section.get("subsections", []):
+                if sub.get("content_type") != "table":
+                    continue
+                table = sub.get("table") or {}
+                if not table.get("columns"):
+                    return False
+                if sub.get("title") in self.GENERAL_REQUIRED_TABLES and not table.get("rows"):
+                    return False
+        return True
+
+    def _get_general_sections_http(self, url: str) -> Optional[tuple]:
+        """
+        Parse the general page from its server-rendered HTML.
+        Returns (sections, errors), or None if the HTML lacks the section contents.
+        """
+        html = self._get_html_with_http(url)
+        if html is None:
+            return None
+        sections, entry_errors = self._parse_general_html(html, url)
+        if not self._general_content_complete(sections):
+            self.fetch_stats["http_incomplete"] += 1
+            self._http_incomplete_streak += 1
+            if self.fetch_backend == "auto" and self._http_incomplete_streak == self.HTTP_MAX_INCOMPLETE:
+                print(f"Server-rendered general pages are incomplete ({self.HTTP_MAX_INCOMPLETE} in a row); "
+                      f"using Selenium for the rest of the run")
+            return None
+        self._http_incomplete_streak = 0
+        return sections, entry_errors
+
+    def parse_general_page(self, url: str) -> dict:
+        """
+        Parse the general info page to a structured, hierarchical JSON-friendly dict
+        using only the given general 'detail_url'. All empty values become None.
+        """
+        parsed = None
+        if self._http_enabled:
+            parsed = self._get_general_sections_http(url)
+            if parsed is not None:
+                self.fetch_stats["http"] += 1
+        if parsed is None and self.fetch_backend != "http":
+            html = self._get_general_html_and_expand(url)
+            self.resource_blocker.record_page(self.driver, url)
+            if html:
+                self.fetch_stats["selenium"] += 1
+                parsed = self._parse_general_html(html, url)
+        if parsed is None:
+            return {"detail_url": url, "fetched_at": datetime.utcnow().isoformat() + "Z", "sections": [], "errors": ["Failed to load page"]}
+
+        sections, entry_errors = parsed
         result = {
             "detail_url": url,
             "fetched_at": datetime.utcnow().isoformat() + "Z",
-            "sections": [s for s in sections if s],
+            "sections": sections,
         }
         if entry_errors:
             result["errors"] = entry_errors
         return result
 
-    def export_general_pages_structured_to_json(self, output_path: str, limit: int = 10) -> str:
+    def _parse_general_entry(self, company: CompanySummary) -> dict:
+        """Parse one company's general page into its export entry (code and name first)."""
+        detail_url = str(company.detail_url)
+        general_url = detail_url.replace("ozet", "genel") if "ozet" in detail_url else detail_url
+        try:
+            page_content = self.parse_general_page(general_url)
+            return {
+                "code": company.code,
+                "name": company.name,
+                **page_content,
+            }
+        except Exception as e:
+            msg = f"Error parsing company at {company.detail_url}: {e}"
+            print(msg)
+            return {
+                "code": company.code,
+                "name": company.name,
+                "detail_url": detail_url,
+                "fetched_at": datetime.utcnow().isoformat() + "Z",
+                "sections": [],
+                "errors": [msg]
+            }
+
+    def _parse_general_entries_pooled(self, companies: List[CompanySummary], workers: int,
+                                      pages_per_driver: int, max_rps: float) -> List[dict]:
+        """
+        Parse general pages on a pool of `workers` browsers. Each worker gets its own
+        client bound to its pool slot; all of them, and this client, share one rate limiter.
+        """
+        def make_driver() -> Optional[webdriver.Chrome]:
+            try:
+                return self._create_driver()
+            except FileNotFoundError as e:
+                print(e)
+                return None
+
+        worker_apis: List[KAPCompaniesAPI] = []
+        lock = threading.Lock()
+        done = [0]
+        pool = BrowserPool(size=workers, driver_factory=make_driver, pages_per_driver=pages_per_driver,
+                           max_rps=max_rps, rate_limiter=self.rate_limiter)
+
+        def parse(lease, company):
+            api = lease.state.get("api")
+            if api is None:
+                api = KAPCompaniesAPI(
+                    driver_path=self.driver_path,
+                    fetch_backend=self.fetch_backend,
+                    driver_source=lambda: lease.driver,
+                    rate_limiter=self.rate_limiter,
+                    general_parser=self.general_parser,
+                    save_html_dir=self.save_html_dir,
+                )
+                api.resource_blocker = self.resource_blocker
+                lease.state["api"] = api
+                with lock:
+                    worker_apis.append(api)
+            return api._parse_general_entry(company)
+
+        def report(index, company, entry):
+            with lock:
+                done[0] += 1
+                print(f"[{done[0]}/{len(companies)}] Parsed: {entry['detail_url'] if entry else company.detail_url}")
+
+        try:
+            results = pool.map(parse, companies, on_result=report)
+        finally:
+            pool.close()
+            for api in worker_apis:
+                api.close()
+                for key, value in api.fetch_stats.items():
+                    self.fetch_stats[key] += value
+        print(f"Browser pool: {pool.stats['drivers_started']} drivers started, {pool.stats['recycled']} recycled, "
+              f"{pool.stats['crashes']} crashed ({pool.stats['retried']} pages retried)")
+        # A page whose worker raised outright still gets an entry
+        return [entry if entry is not None else self._parse_general_entry(company)
+                for company, entry in zip(companies, results)]
+
+    def export_general_pages_structured_to_json(
+        self,
+        output_path: str,
+        limit: int = 10,
+        workers: int = 1,
+        pages_per_driver: int = BrowserPool.DEFAULT_PAGES_PER_DRIVER,
+        max_rps: float = BrowserPool.DEFAULT_MAX_RPS,
+    ) -> str:
         """
         Use only companies' detail_url (switching 'ozet' to 'genel'), parse the general
         page into a hierarchical JSON structure, and export for the first `limit` companies.
+        With workers > 1 the pages are parsed on a browser pool (see kap_browser_pool.py);
+        this client's own requests then share the pool's `max_rps` limit (or, if one was
+        passed in, the client's `rate_limiter` caps all of them).
         """
-        results = []
+        if workers > 1 and self._own_rate_limiter:
+            self.rate_limiter = RateLimiter(max_rps)
         companies = self.get_companies_list()
         if not companies:
             with open(output_path, "w", encoding="utf-8") as f:
@@ -853,36 +1219,24 @@ class KAPCompaniesAPI:
             return output_path
 
         print(f"Parsing structured data for first {limit if limit > 0 else 'ALL'} companies...")
-        for idx, company in enumerate(companies[:max(0, limit)] if limit > 0 else companies, start=1):
-            try:
-                detail_url = str(company.detail_url)
-                general_url = detail_url.replace("ozet", "genel") if "ozet" in detail_url else detail_url
-                # parse structured
-                page_content = self.parse_general_page(general_url)
-                # Build entry with code and name first
-                entry = {
-                    "code": company.code,
-                    "name": company.name,
-                    **page_content,
-                }
+        selected = companies[:max(0, limit)] if limit > 0 else companies
+        if workers > 1:
+            results = self._parse_general_entries_pooled(selected, workers, pages_per_driver, max_rps)
+        else:
+            results = []
+            for idx, company in enumerate(selected, start=1):
+                entry = self._parse_general_entry(company)
                 results.append(entry)
-                total = len(companies) if limit <= 0 else min(limit, len(companies))
-                print(f"[{idx}/{total}] Parsed: {general_url}")
-            except Exception as e:
-                msg = f"Error parsing company at {company.detail_url}: {e}"
-                print(msg)
-                results.append({
-                    "code": company.code,
-                    "name": company.name,
-                    "detail_url": str(company.detail_url),
-                    "fetched_at": datetime.utcnow().isoformat() + "Z",
-                    "sections": [],
-                    "errors": [msg]
-                })
+                print(f"[{idx}/{len(selected)}] Parsed: {entry['detail_url']}")
 
         with open(output_path, "w", encoding="utf-8") as f:
             json.dump(results, f, ensure_ascii=False, indent=2)
         print(f"Structured JSON exported to {output_path}")
+        print(f"Pages fetched: {self.fetch_stats['http']} over HTTP, {self.fetch_stats['selenium']} with Selenium "
+              f"({self.fetch_stats['http_incomplete']} incomplete server-rendered pages)")
+        if self.fetch_stats["selenium"]:
+            print(WAIT_STATS.report())
+            print(self.resource_blocker.report())
         return output_path
 
     def export_general_pages_to_json(self, output_path: str) -> str:
@@ -953,11 +1307,22 @@ class KAPCompaniesAPI:
         """Closes the Selenium WebDriver only if it's not a shared instance."""
         if self.driver and not self._shared_driver:
             self.driver.quit()
+        if self._http_session is not None:
+            self._http_session.close()
 
 # --- Main Execution Block ---
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="KAP Companies Exporters")
+    parser.add_argument("--fetch", choices=KAPCompaniesAPI.FETCH_BACKENDS, default="selenium",
+                        help="Page fetching: Selenium only (default), plain HTTP with Selenium fallback (auto, "
+                             "opt-in), or HTTP only")
+    parser.add_argument("--no-resource-blocking", action="store_true",
+                        help="Let the browser load images, fonts, stylesheets, trackers and third-party hosts")
+    parser.add_argument("--parser", choices=KAPCompaniesAPI.GENERAL_PARSERS, default="soup",
+                        help="General page parser: BeautifulSoup (default) or compiled lxml (opt-in, needs lxml; "
+                             "check saved pages with benchmark_general_parser.py first)")
+    parser.add_argument("--save-html", metavar="DIR", help="Also save each general page's HTML to DIR (parser fixtures)")
     sub = parser.add_subparsers(dest="cmd", required=False)
 
     # legacy general exporters
@@ -965,6 +1330,12 @@ if __name__ == "__main__":
     p_gen.add_argument("--mode", choices=["structured", "raw"], default="structured")
     p_gen.add_argument("--limit", type=int, default=0)
     p_gen.add_argument("--output", default="kap_companies_general_info.json")
+    p_gen.add_argument("--workers", type=int, default=1, help="Browsers in the pool (1 = sequential)")
+    p_gen.add_argument("--pages-per-driver", type=int, default=BrowserPool.DEFAULT_PAGES_PER_DRIVER,
+                       help="Recycle each pooled browser after this many pages")
+    p_gen.add_argument("--max-rps", type=float, default=BrowserPool.DEFAULT_MAX_RPS,
+                       help="Global KAP request rate across all workers "
+                            "(default: 0.5, the sequential export's pace; raise explicitly)")
 
     # companies list exporter
     p_comp = sub.add_parser("companies", help="Export companies list JSON (for persist_cli companies)")
@@ -977,6 +1348,9 @@ if __name__ == "__main__":
     p_gen_persist.add_argument("--limit", type=int, default=0)
     p_gen_persist.add_argument("--dry-run", action="store_true")
     p_gen_persist.add_argument("--batch-size", type=int, default=0)
+    p_gen_persist.add_argument("--workers", type=int, default=1)
+    p_gen_persist.add_argument("--pages-per-driver", type=int, default=BrowserPool.DEFAULT_PAGES_PER_DRIVER)
+    p_gen_persist.add_argument("--max-rps", type=float, default=BrowserPool.DEFAULT_MAX_RPS)
 
     # default for backward-compat: general structured
     parser.add_argument("--output", help=argparse.SUPPRESS)
@@ -986,8 +1360,9 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     driver_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '.', 'chromedriver'))
-    api = KAPCompaniesAPI(driver_path=driver_path)
-    if not api.driver:
+    api = KAPCompaniesAPI(driver_path=driver_path, fetch_backend=args.fetch, block_resources=not args.no_resource_blocking,
+                          general_parser=args.parser, save_html_dir=args.save_html)
+    if args.fetch == "selenium" and not api.driver:
         sys.exit(1)
     try:
         # Backward compatible path if no subcommand given
@@ -1015,14 +1390,16 @@ if __name__ == "__main__":
             out = os.path.abspath(os.path.join(os.path.dirname(__file__), args.output))
             if args.mode == "structured":
                 print(f"Starting structured export of general pages ({'all' if args.limit == 0 else f'first {args.limit}'} companies)...")
-                api.export_general_pages_structured_to_json(out, limit=args.limit)
+                api.export_general_pages_structured_to_json(out, limit=args.limit, workers=args.workers,
+                                                            pages_per_driver=args.pages_per_driver, max_rps=args.max_rps)
             else:
                 print(f"Starting RAW export of general pages ({'all' if args.limit == 0 else f'first {args.limit}'} companies)...")
                 api.export_general_pages_to_json(out)
         elif args.cmd == "general-persist":
             out = os.path.abspath(os.path.join(os.path.dirname(__file__), args.output))
             print(f"Exporting structured general info to {out} ...")
-            api.export_general_pages_structured_to_json(out, limit=args.limit)
+            api.export_general_pages_structured_to_json(out, limit=args.limit, workers=args.workers,
+                                                        pages_per_driver=args.pages_per_driver, max_rps=args.max_rps)
             # Persist via persist_cli
             try:
                 from persist_cli import persist_general
@@ -1035,5 +1412,6 @@ if __name__ == "__main__":
             print("Unknown command")
             sys.exit(2)
     finally:
-        print("Closing Selenium driver...")
+        if api.driver:
+            print("Closing Selenium driver...")
         api.close()
\ No newline at end of file
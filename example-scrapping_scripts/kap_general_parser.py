@@ -0,0 +1,356 @@
+"""Quick start / Hızlı başlangıç
+
+Compiled lxml parser for KAP general pages, an opt-in alternative to the
+BeautifulSoup section parsers in KAPCompaniesAPI (`_parse_contact_information`
+... `_parse_miscellaneous`), used with general_parser="lxml" (--parser lxml).
+The tree is built from html.parser events with BeautifulSoup's nesting rules
+(no implicit closing, so e.g. a <div> inside a <p> stays there, where libxml2
+would close the <p>), so malformed markup gives the same output too; check
+saved pages with benchmark_general_parser.py.
+
+    sections, errors = parse_general_html(html, api)   # api: a KAPCompaniesAPI
+
+Why it is faster:
+- html.parser only tokenizes; the tree is built by lxml's TreeBuilder (C)
+  instead of as bs4 Tag objects
+- every field selector below is translated to XPath once, at import
+- `#general` is located once per page and each field is resolved with a
+  child-axis-only XPath from it, so no lookup scans the rest of the document
+  (html.parser + soupsieve re-match each long CSS selector over the tree)
+
+The field selectors are the ones the BeautifulSoup parsers use; text is
+collected like bs4's get_text (comments, <script> and <style> skipped) and
+values go through the same KAPCompaniesAPI helpers (_clean_text, _parse_int,
+_apply_table_schema, ...). Parity and speed are checked by
+benchmark_general_parser.py.
+
+Requires lxml and cssselect (optional; KAPCompaniesAPI falls back to the
+BeautifulSoup parsers without them).
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import Callable, List, Optional, Tuple
+
+from bs4.dammit import EntitySubstitution, UnicodeDammit
+
+try:
+    from lxml import etree
+    from cssselect import HTMLTranslator
+    HAVE_LXML = True
+except ImportError:  # optional dependency
+    HAVE_LXML = False
+
+# Text of these elements is not part of bs4's get_text()
+_SKIP_TEXT = {"script", "style"}
+
+# bs4's HTMLTreeBuilder.empty_element_tags: closed right after their start tag
+_VOID = {
+    "area", "base", "basefont", "bgsound", "br", "col", "command", "embed", "frame", "hr", "image",
+    "img", "input", "isindex", "keygen", "link", "menuitem", "meta", "nextid", "param", "source",
+    "spacer", "track", "wbr",
+}
+# Characters libxml2 cannot store in a tree (html.parser passes them through)
+_XML_INVALID = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+_DEC_REF = re.compile("^([0-9]+)(.*)")
+_HEX_REF = re.compile("^([0-9a-f]+)(.*)")
+
+# Shared selector fragments (as in the BeautifulSoup parsers)
+_TABLE_TITLE = " > div > div.flex.items-center.justify-between.py-4.company__sgbf-h6-title > div.font-semibold.text-sm.text-danger"
+_TABLE = " > div > div.overflow-x-auto.w-full > table"
+_DANGER_TITLE = " > div > div > div.font-semibold.text-sm.text-danger"
+_TITLE = " > div > div > span"
+_VALUE = " > div > span"
+_ITEM = " > div > div > div > div > div > div:nth-child({})"
+_DEEP_ITEM = " > div > div > div > div > div > div > div:nth-child({})"
+
+
+def _text(title_css: str, value_css: str, default_title: str, cast: str = "clean") -> tuple:
+    return ("text", title_css, value_css, default_title, cast)
+
+
+def _table(item: str, default_title: str) -> tuple:
+    return ("table", item + _TABLE_TITLE, item + _TABLE, default_title)
+
+
+# section_key, title, error label, nth-child of #general > div > div, fields
+SECTIONS = [
+    ("contact_information", "CONTACT INFORMATION", "Contact information", 2, [
+        _text(_ITEM.format(1) + " > div > div > div > span", _ITEM.format(1) + " > div > div > span", "Head Office Address"),
+        _table(_ITEM.format(2), "Communication Address, Phone and Fax"),
+        ("lines", _ITEM.format(3) + " > div > div > div > span", _ITEM.format(3) + " > div > div > span", "Production Facilities Address"),
+        _table(_ITEM.format(4), "E-mail Address"),
+        _text(_ITEM.format(5) + " > div > div > div > span", _ITEM.format(5) + " > div > div > span", "Web-site"),
+        _table(_ITEM.format(6), "Investor Relations Department or Contact People"),
+    ]),
+    ("scope_and_audit", "SCOPE OF ACTIVITIES AND INDEPENDENT AUDIT COMPANY INFORMATION", "Scope & audit", 3, [
+        ("paragraphs", _DEEP_ITEM.format(1) + _TITLE, _DEEP_ITEM.format(1) + _VALUE, "Scope of Activities of Company"),
+        _text(_DEEP_ITEM.format(2) + _TITLE, _DEEP_ITEM.format(2) + _VALUE, "Duration of Company"),
+        _text(_DEEP_ITEM.format(3) + _TITLE, _DEEP_ITEM.format(3) + _VALUE, "Independent Audit Company"),
+        _text(_DEEP_ITEM.format(4) + _TITLE, _DEEP_ITEM.format(4) + _VALUE, "Sector of Company"),
+    ]),
+    ("markets_indices_instruments", "MARKETS, INDICES AND CAPITAL MARKET INSTRUMENTS", "Markets & indices", 4, [
+        _text(_ITEM.format(1) + " > div:nth-child(1)" + _TITLE, _ITEM.format(1) + " > div:nth-child(1)" + _VALUE,
+              "BIST Market where Company's Capital Market Instruments are Traded"),
+        _text(_ITEM.format(1) + " > div:nth-child(2)" + _TITLE, _ITEM.format(1) + " > div:nth-child(2)" + _VALUE,
+              "BIST Indices that the Company is Included"),
+        _table(_ITEM.format(2), "Current List of Other Exchanges or Organized Markets where the Company's Capital Market Instruments are Listed or Traded"),
+        _text(_ITEM.format(3) + _DANGER_TITLE, _ITEM.format(3) + _VALUE,
+              "Information About Issued Capital Market Instruments Other Than Shares"),
+    ]),
+    ("registration_tax", "REGISTRATION AND TAX OFFICE INFORMATION", "Registration & tax", 5, [
+        _text(_DEEP_ITEM.format(1) + _TITLE, _DEEP_ITEM.format(1) + _VALUE, "Registry Office"),
+        _text(_DEEP_ITEM.format(2) + _TITLE, _DEEP_ITEM.format(2) + _VALUE, "Registration Date", "date"),
+        _text(_DEEP_ITEM.format(3) + _TITLE, _DEEP_ITEM.format(3) + _VALUE, "Registration Number", "int"),
+        _text(_DEEP_ITEM.format(4) + _TITLE, _DEEP_ITEM.format(4) + _VALUE, "Tax Number", "int"),
+        _text(_DEEP_ITEM.format(5) + _TITLE, _DEEP_ITEM.format(5) + _VALUE, "Tax Office"),
+    ]),
+    ("company_management", "COMPANY MANAGEMENT", "Company management", 6, [
+        _table(_ITEM.format(1), "Board Members"),
+        _table(_ITEM.format(2), "Top Management"),
+    ]),
+    ("capital_shareholders", "CAPITAL AND SHAREHOLDER STRUCTURE", "Capital & shareholder", 7, [
+        _text(_ITEM.format(1) + " > div:nth-child(1)" + _TITLE, _ITEM.format(1) + " > div:nth-child(1)" + _VALUE,
+              "Paid-in/Issued Capital", "int"),
+        _text(_ITEM.format(1) + " > div:nth-child(2)" + _TITLE, _ITEM.format(1) + " > div:nth-child(2)" + _VALUE,
+              "Authorized Capital", "int"),
+        _table(_ITEM.format(2), "Breakdown of Shareholders Holding More Than 5% of the Capital and Voting Rights"),
+        _text(_ITEM.format(4) + _DANGER_TITLE, _ITEM.format(4) + _VALUE, "Current Breakdown of Indirect Shareholders"),
+        _table(_ITEM.format(5), "Actual Shares Outstanding"),
+        _table(_ITEM.format(7), "Information About Shares Representing the Capital"),
+    ]),
+    ("subsidiaries_investments", "SUBSIDIARIES, FINANCIAL NON-CURRENT ASSETS AND FINANCIAL INVESTMENTS", "Subsidiaries", 8, [
+        _table(" > div > div > div > div > div > div", "Subsidiaries, Financial Non-Current Assets and Financial Investments"),
+    ]),
+    ("miscellaneous", "MISCELLANEOUS", "Miscellaneous", 9, [
+        _text(" > div > div > div > div > div > div > div > div > div > span",
+              " > div > div > div > div > div > div > div > div > span", "Miscellaneous"),
+    ]),
+]
+
+
+class _TreeParser(HTMLParser):
+    """
+    html.parser events -> lxml tree, nested the way bs4's html.parser builder does:
+    an end tag closes up to the most recent open tag of that name (and is ignored
+    if there is none), nothing is closed implicitly, void elements close at once.
+    Entities and character references are decoded as bs4 does; comments are kept
+    as nodes so they split text like bs4's Comment strings. Control characters
+    lxml cannot store are dropped.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.builder = etree.TreeBuilder()
+        self.builder.start("document", {})
+        self.open = []
+        self.closed_void = []
+        self.names = {}
+
+    def _name(self, name: str) -> Optional[str]:
+        """`name` if lxml accepts it as a tag/attribute name, else None (cached)."""
+        if name not in self.names:
+            try:
+                etree.Element(name)
+                self.names[name] = name
+            except ValueError:
+                self.names[name] = None
+        return self.names[name]
+
+    def handle_starttag(self, tag, attrs, close_void=True):
+        attrib = {}
+        for key, value in attrs:
+            if self._name(key):
+                attrib[key] = "" if value is None else value
+        self.builder.start(self._name(tag) or "invalid", attrib)
+        self.open.append(tag)
+        if close_void and tag in _VOID:
+            self._close(tag)
+            # a later </tag> for it is ignored (and does not end the current string)
+            self.closed_void.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs, close_void=False)
+        self._close(tag)
+
+    def handle_endtag(self, tag):
+        if tag in self.closed_void:
+            self.closed_void.remove(tag)
+        else:
+            self._close(tag)
+
+    def _close(self, tag):
+        """bs4's _popToTag: close up to the most recent open `tag`, if any."""
+        if tag not in self.open:
+            self._split()
+            return
+        while True:
+            name = self.open.pop()
+            self.builder.end(self._name(name) or "invalid")
+            if name == tag:
+                break
+
+    def handle_data(self, data):
+        self.builder.data(data)
+
+    def handle_entityref(self, name):
+        character = EntitySubstitution.HTML_ENTITY_TO_CHARACTER.get(name)
+        self.builder.data(character if character is not None else "&" + name)
+
+    def handle_charref(self, name):
+        base, reg = (16, _HEX_REF) if name[:1] in ("x", "X") else (10, _DEC_REF)
+        digits = name[1:] if base == 16 else name
+        try:
+            code, extra = int(digits, base), ""
+        except ValueError:
+            match = reg.search(digits)
+            if match is None:
+                self.builder.data(digits)
+                return
+            code, extra = int(match.group(1), base), match.group(2)
+        self.builder.data(UnicodeDammit.numeric_character_reference(code)[0] + extra)
+
+    def handle_comment(self, data):
+        self.builder.comment(data)
+
+    def _split(self):
+        """bs4 ends the current string at every event; an empty comment keeps the texts apart."""
+        self.builder.comment("")
+
+    def handle_decl(self, decl):
+        self._split()
+
+    def unknown_decl(self, data):
+        self._split()
+
+    def handle_pi(self, data):
+        self._split()
+
+    def parse(self, html: str):
+        self.feed(_XML_INVALID.sub("", html))
+        self.close()
+        while self.open:
+            self.builder.end(self._name(self.open.pop()) or "invalid")
+        self.builder.end("document")
+        return self.builder.close()
+
+
+def _compile(css: str) -> Callable:
+    """CSS (rooted at #general) -> compiled XPath evaluated on the #general element."""
+    xpath = HTMLTranslator().css_to_xpath(css, prefix="self::")
+    return etree.XPath(xpath)
+
+
+def _compile_sections() -> list:
+    compiled = []
+    for key, title, label, nth, fields in SECTIONS:
+        base = f"#general > div > div > div:nth-child({nth})"
+        compiled.append((key, title, label, [
+            (kind, _compile(base + a), _compile(base + b), *rest) for kind, a, b, *rest in fields
+        ]))
+    return compiled
+
+
+_COMPILED = _compile_sections() if HAVE_LXML else []
+
+
+def _first(xpath: Callable, general) -> Optional[object]:
+    if general is None:
+        return None
+    found = xpath(general)
+    return found[0] if found else None
+
+
+def _strings(el):
+    """Text nodes under `el` in document order, as bs4 yields them for get_text()."""
+    if el.text and el.tag not in _SKIP_TEXT:
+        yield el.text
+    for child in el:
+        if isinstance(child.tag, str) and child.tag not in _SKIP_TEXT:
+            yield from _strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def get_text(el, separator: str = "") -> str:
+    """bs4's el.get_text(separator, strip=True)."""
+    return separator.join(s for s in (s.strip() for s in _strings(el)) if s)
+
+
+def _parse_table(table, clean: Callable) -> dict:
+    """KAPCompaniesAPI._parse_table on an lxml element."""
+    if table is None:
+        return {"columns": [], "rows": []}
+    headers = []
+    thead = next(table.iterdescendants("thead"), None)
+    if thead is not None:
+        headers = [clean(get_text(th)) for th in thead.iterdescendants("th")]
+    rows_out = []
+    tbody = next(table.iterdescendants("tbody"), None)
+    if tbody is not None:
+        for tr in tbody.iterdescendants("tr"):
+            values = [clean(get_text(td, " ")) for td in tr.iterdescendants("td", "th")]
+            if headers and len(headers) == len(values):
+                row = {headers[i]: values[i] for i in range(len(headers))}
+            else:
+                row = {str(i): values[i] if i < len(values) else None for i in range(len(values))}
+            rows_out.append(row)
+    return {"columns": headers, "rows": rows_out}
+
+
+def _field(api, general, kind: str, title_xp, value_xp, default_title: str, cast: str = "clean") -> dict:
+    clean = api._clean_text
+    title_node = _first(title_xp, general)
+    node = _first(value_xp, general)
+    title = clean(get_text(title_node) if title_node is not None else default_title)
+
+    if kind == "table":
+        return {
+            "content_type": "table",
+            "title": title,
+            "table": api._apply_table_schema(_parse_table(node, clean), title),
+        }
+    if kind == "lines":
+        items = []
+        if node is not None:
+            paragraphs = list(node.iterdescendants("p"))
+            if paragraphs:
+                for p in paragraphs:
+                    t = clean(get_text(p, " "))
+                    if t:
+                        items.append(t)
+            else:
+                raw = clean(get_text(node, "\n"))
+                if raw:
+                    items.extend(l.strip() for l in raw.split("\n") if l.strip())
+        return {"content_type": "list", "title": title, "items": items if items else None}
+    if kind == "paragraphs":
+        value = None
+        if node is not None:
+            paragraphs = list(node.iterdescendants("p"))
+            if paragraphs:
+                value = "\n".join(filter(None, [clean(get_text(p, " ")) for p in paragraphs])) or None
+            else:
+                value = clean(get_text(node, " "))
+        return {"content_type": "text", "title": title, "text": value}
+
+    caster = {"clean": clean, "int": api._parse_int, "date": api._parse_date_ddmmyyyy}[cast]
+    return {"content_type": "text", "title": title, "text": caster(get_text(node, " ") if node is not None else None)}
+
+
+def parse_general_html(html: str, api) -> Tuple[List[dict], List[str]]:
+    """Parse a general page's HTML into (sections, errors), like KAPCompaniesAPI._parse_general_sections."""
+    root = _TreeParser().parse(html)
+    general = next(iter(root.xpath("//*[@id='general']")), None)
+    sections, errors = [], []
+    for key, title, label, fields in _COMPILED:
+        try:
+            out = {"section_key": key, "title": title, "subsections": []}
+            for field in fields:
+                out["subsections"].append(_field(api, general, *field))
+            sections.append(out)
+        except Exception as e:
+            msg = f"{label} parse error: {e}"
+            print(msg)
+            errors.append(msg)
+    return sections, errors
@@ -32,6 +32,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from kap_resource_blocking import DEFAULT_POLICY, ResourceBlocker
+
 
 class Index(BaseModel):
     """KAP'taki tek bir endeksi temsil eder."""
@@ -54,8 +56,12 @@ class KAPIndicesAPI:
     piyasa endekslerini ve içlerindeki şirketleri getiren ve ayrıştıran bir sınıf.
     """
 
-    def __init__(self, driver_path: str = 'chromedriver', driver: Optional[webdriver.Chrome] = None):
-        """Initializes the API, using a shared driver if provided."""
+    def __init__(self, driver_path: str = 'chromedriver', driver: Optional[webdriver.Chrome] = None, block_resources: bool = True):
+        """
+        Initializes the API, using a shared driver if provided.
+        block_resources: kendi başlattığı sürücüde gereksiz istekleri engeller (bkz. kap_resource_blocking.py).
+        """
+        self.resource_blocker = ResourceBlocker(DEFAULT_POLICY if block_resources else None)
         self.base_url = "https://www.kap.org.tr/tr/Endeksler"
         self._shared_driver = bool(driver)
         
@@ -69,9 +75,12 @@ class KAPIndicesAPI:
             options.add_argument(
                 "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
             )
+            # Gereksiz kaynakları (görsel, font, izleyici, üçüncü taraf alan adları) engelle
+            self.resource_blocker.configure(options)
             service = Service(executable_path=driver_path)
             try:
                 self.driver = webdriver.Chrome(service=service, options=options)
+                self.resource_blocker.apply(self.driver)
             except Exception as e:
                 print(f"WebDriver başlatılırken hata oluştu: {e}")
                 raise
@@ -85,6 +94,7 @@ class KAPIndicesAPI:
             WebDriverWait(self.driver, 20).until(
                 EC.presence_of_element_located((By.ID, "indicesTable"))
             )
+            self.resource_blocker.record_page(self.driver, self.base_url)
             return BeautifulSoup(self.driver.page_source, "html.parser")
         except TimeoutException:
             print("Sayfa içeriğinin yüklenmesi zaman aşımına uğradı.")
@@ -200,6 +210,7 @@ if __name__ == "__main__":
                 with open(out, "w", encoding="utf-8") as f:
                     json.dump(payload, f, ensure_ascii=False, indent=2)
                 print(f"Endeks verileri JSON olarak kaydedildi: {out}")
+                print(api.resource_blocker.report())
             elif args.cmd == "export-persist":
                 with open(out, "w", encoding="utf-8") as f:
                     json.dump(payload, f, ensure_ascii=False, indent=2)
@@ -19,7 +19,6 @@ Gereksinimler: Python 3.10.17 sanal ortam, Chrome + ./chromedriver
 
 import os
 import re
-import time
 import json
 import argparse
 from typing import List, Optional
@@ -33,6 +32,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from kap_waits import PageWaiter
+from kap_resource_blocking import INTERACTIVE_POLICY, ResourceBlocker
+
 
 class Company(BaseModel):
     """Bir pazar veya alt pazar içindeki tek bir şirketi/fonu temsil eder."""
@@ -72,8 +74,13 @@ class KAPMarketsAPI:
     URL: https://www.kap.org.tr/tr/Pazarlar
     """
 
-    def __init__(self, driver_path: str = 'chromedriver', driver: Optional[webdriver.Chrome] = None):
-        """Initializes the API, using a shared driver if provided."""
+    def __init__(self, driver_path: str = 'chromedriver', driver: Optional[webdriver.Chrome] = None, block_resources: bool = True):
+        """
+        Initializes the API, using a shared driver if provided.
+        block_resources: kendi başlattığı sürücüde gereksiz istekleri engeller (bkz. kap_resource_blocking.py).
+        """
+        # Stil dosyaları açık kalır: dropdown beklemeleri CSS görünürlüğüne bağlı
+        self.resource_blocker = ResourceBlocker(INTERACTIVE_POLICY if block_resources else None)
         self.base_url = "https://www.kap.org.tr/tr/Pazarlar"
         self._shared_driver = bool(driver)
 
@@ -87,10 +94,13 @@ class KAPMarketsAPI:
             options.add_argument(
                 "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
             )
+            # Gereksiz kaynakları (görsel, font, izleyici, üçüncü taraf alan adları) engelle
+            self.resource_blocker.configure(options)
             
             try:
                 service = Service(executable_path=driver_path)
                 self.driver = webdriver.Chrome(service=service, options=options)
+                self.resource_blocker.apply(self.driver)
             except Exception as e:
                 print(f"WebDriver başlatılırken hata oluştu: {e}")
                 raise
@@ -107,7 +117,9 @@ class KAPMarketsAPI:
             WebDriverWait(self.driver, 20).until(
                 EC.presence_of_element_located((By.ID, "marketsTable"))
             )
-            time.sleep(3)  # Dinamik içeriğin tam olarak render olması için ek bekleme
+            # Dinamik içerik render olana kadar (tablo değişmeyi bırakana kadar) bekle, en fazla 3 sn
+            PageWaiter(self.driver).for_dom_stable("#marketsTable", quiet=0.3, timeout=3.0)
+            self.resource_blocker.record_page(self.driver, self.base_url)
             return BeautifulSoup(self.driver.page_source, "html.parser")
         except TimeoutException:
             print("Sayfa içeriğinin yüklenmesi zaman aşımına uğradı.")
@@ -138,7 +150,8 @@ class KAPMarketsAPI:
             WebDriverWait(self.driver, 10).until(
                 EC.visibility_of_element_located((By.CSS_SELECTOR, "#stickyDropdown div.select__items"))
             )
-            time.sleep(1)
+            # Seçenekler doldurulana kadar bekle, en fazla 1 sn
+            PageWaiter(self.driver).for_dom_stable("#stickyDropdown", quiet=0.2, timeout=1.0)
             soup = BeautifulSoup(self.driver.page_source, "html.parser")
 
             # Ana pazar ve alt pazar seçeneklerini bul
@@ -286,6 +299,7 @@ if __name__ == "__main__":
             with open(out, "w", encoding="utf-8") as f:
                 json.dump(payload, f, ensure_ascii=False, indent=2)
             print(f"Pazar verileri JSON olarak kaydedildi: {out}")
+            print(api.resource_blocker.report())
         elif args.cmd == "export-persist":
             with open(out, "w", encoding="utf-8") as f:
                 json.dump(payload, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,240 @@
+"""Quick start / Hızlı başlangıç
+
+Request blocking for the headless KAP scrapers. Only the document, its
+scripts and XHR/fetch calls to KAP are needed to read the data; images,
+media, fonts, (optionally) stylesheets, analytics and every third-party
+host are blocked.
+
+- Measure what blocking saves on a few pages (loads each page both ways):
+    zsh: python kap_resource_blocking.py --compare https://www.kap.org.tr/tr/Endeksler https://www.kap.org.tr/tr/Pazarlar
+
+- From code (done by all four KAP API classes for the drivers they start):
+    configure_options(options, DEFAULT_POLICY)   # before webdriver.Chrome(...)
+    apply_blocking(driver, DEFAULT_POLICY)       # after it started
+    blocker.record_page(driver, url)             # after each page; blocker.report() at the end
+
+Two mechanisms:
+- CDP Network.setBlockedURLs with URL patterns (resource types by extension,
+  known trackers)
+- a host allow-list: Chrome resolves every host outside `allowed_hosts` to
+  NOTFOUND (--host-resolver-rules), so third-party requests fail instantly
+
+Per-page accounting comes from Chrome's performance log (CDP Network events):
+requests and bytes actually loaded, and requests blocked by resource type.
+Bytes saved need a page loaded without blocking for comparison: --compare.
+"""
+
+import os
+import json
+import time
+import argparse
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service
+
+IMAGE_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico"]
+FONT_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+MEDIA_PATTERNS = ["*.mp4", "*.webm", "*.mp3", "*.ogg"]
+STYLESHEET_PATTERNS = ["*.css"]
+TRACKER_PATTERNS = [
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*",
+    "*facebook.net*", "*hotjar.com*", "*clarity.ms*", "*yandex.ru*", "*mc.yandex*",
+]
+
+
+def _with_query(patterns: List[str]) -> List[str]:
+    """'*.png' also as '*.png?*' (cache-busting query strings)."""
+    return [p for pattern in patterns for p in (pattern, pattern + "?*")]
+
+
+@dataclass(frozen=True)
+class BlockingPolicy:
+    """What to block. `allowed_hosts=()` turns the host allow-list off."""
+    block_images: bool = True
+    block_media: bool = True
+    block_fonts: bool = True
+    block_stylesheets: bool = True
+    block_trackers: bool = True
+    allowed_hosts: Tuple[str, ...] = ("kap.org.tr", "*.kap.org.tr")
+    extra_patterns: Tuple[str, ...] = ()
+
+    def url_patterns(self) -> List[str]:
+        patterns: List[str] = []
+        if self.block_images:
+            patterns += _with_query(IMAGE_PATTERNS)
+        if self.block_media:
+            patterns += _with_query(MEDIA_PATTERNS)
+        if self.block_fonts:
+            patterns += _with_query(FONT_PATTERNS)
+        if self.block_stylesheets:
+            patterns += _with_query(STYLESHEET_PATTERNS)
+        if self.block_trackers:
+            patterns += TRACKER_PATTERNS
+        return patterns + list(self.extra_patterns)
+
+
+# Parsing-only pages (general pages, indices)
+DEFAULT_POLICY = BlockingPolicy()
+# Pages whose dropdown waits depend on CSS visibility (markets, sectors)
+INTERACTIVE_POLICY = BlockingPolicy(block_stylesheets=False)
+
+
+def configure_options(options: webdriver.ChromeOptions, policy: Optional[BlockingPolicy]):
+    """Launch-time part: host allow-list, image prefs and CDP network events in the performance log."""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    if policy is None:
+        return
+    if policy.block_images:
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.images": 2,
+        })
+    if policy.allowed_hosts:
+        excludes = ", ".join(f"EXCLUDE {host}" for host in (*policy.allowed_hosts, "localhost", "127.0.0.1"))
+        options.add_argument(f"--host-resolver-rules=MAP * ~NOTFOUND, {excludes}")
+
+
+def apply_blocking(driver: webdriver.Chrome, policy: Optional[BlockingPolicy]) -> bool:
+    """Runtime part: CDP URL blocking on the driver's page. False if CDP is unavailable."""
+    if policy is None:
+        return False
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": policy.url_patterns()})
+        return True
+    except (WebDriverException, AttributeError) as e:
+        print(f"Request blocking unavailable: {e}")
+        return False
+
+
+def _is_blocked(params: dict) -> bool:
+    if params.get("blockedReason"):
+        return True
+    return params.get("errorText") in ("net::ERR_BLOCKED_BY_CLIENT", "net::ERR_NAME_NOT_RESOLVED")
+
+
+def page_network_stats(driver: webdriver.Chrome) -> Optional[dict]:
+    """
+    Drain the performance log and summarize the network events since the last
+    call. None if the driver was started without performance logging.
+    """
+    try:
+        entries = driver.get_log("performance")
+    except WebDriverException:
+        return None
+    types: Dict[str, str] = {}
+    stats = {"requests": 0, "bytes": 0, "blocked": 0, "blocked_by_type": {}}
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, ValueError):
+            continue
+        method, params = message.get("method"), message.get("params", {})
+        if method == "Network.requestWillBeSent":
+            types[params.get("requestId")] = params.get("type") or "Other"
+        elif method == "Network.loadingFinished":
+            stats["requests"] += 1
+            stats["bytes"] += int(params.get("encodedDataLength") or 0)
+        elif method == "Network.loadingFailed" and _is_blocked(params):
+            kind = types.get(params.get("requestId")) or params.get("type") or "Other"
+            stats["blocked"] += 1
+            stats["blocked_by_type"][kind] = stats["blocked_by_type"].get(kind, 0) + 1
+    return stats
+
+
+@dataclass
+class ResourceBlocker:
+    """Blocking policy plus per-page network accounting (thread-safe, shareable)."""
+    policy: Optional[BlockingPolicy] = DEFAULT_POLICY
+    pages: List[dict] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def configure(self, options: webdriver.ChromeOptions):
+        configure_options(options, self.policy)
+
+    def apply(self, driver: webdriver.Chrome) -> bool:
+        return apply_blocking(driver, self.policy)
+
+    def record_page(self, driver: Optional[webdriver.Chrome], url: str) -> Optional[dict]:
+        if driver is None:
+            return None
+        stats = page_network_stats(driver)
+        if stats is None:
+            return None
+        stats["url"] = url
+        with self._lock:
+            self.pages.append(stats)
+        return stats
+
+    def report(self) -> str:
+        with self._lock:
+            pages = list(self.pages)
+        if not pages:
+            return "Requests: no pages recorded"
+        n = len(pages)
+        by_type: Dict[str, int] = {}
+        for page in pages:
+            for kind, count in page["blocked_by_type"].items():
+                by_type[kind] = by_type.get(kind, 0) + count
+        blocked = ", ".join(f"{kind} {count / n:.1f}" for kind, count in sorted(by_type.items(), key=lambda kv: -kv[1]))
+        return (f"Requests per page: {sum(p['requests'] for p in pages) / n:.1f} loaded "
+                f"({sum(p['bytes'] for p in pages) / n / 1024:.0f} KiB), "
+                f"{sum(p['blocked'] for p in pages) / n:.1f} blocked{f' ({blocked})' if blocked else ''} over {n} pages")
+
+
+def build_driver(driver_path: str, policy: Optional[BlockingPolicy]) -> webdriver.Chrome:
+    """Headless Chrome with (or, policy=None, without) blocking; used by --compare."""
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    configure_options(options, policy)
+    driver = webdriver.Chrome(service=Service(executable_path=driver_path), options=options)
+    if policy is not None:
+        apply_blocking(driver, policy)
+    else:
+        driver.execute_cdp_cmd("Network.enable", {})
+    # Same disk cache state for both runs: none
+    driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": True})
+    return driver
+
+
+def compare(urls: List[str], driver_path: str, policy: BlockingPolicy, settle: float):
+    """Load every URL without and with blocking and print what blocking saved."""
+    results = {}
+    for label, pol in (("unblocked", None), ("blocked", policy)):
+        driver = build_driver(driver_path, pol)
+        try:
+            for url in urls:
+                started = time.perf_counter()
+                driver.get(url)
+                time.sleep(settle)  # let late XHRs land so both runs see the same page
+                stats = page_network_stats(driver) or {"requests": 0, "bytes": 0, "blocked": 0}
+                stats["seconds"] = time.perf_counter() - started - settle
+                results[(label, url)] = stats
+        finally:
+            driver.quit()
+
+    print("=" * 100)
+    print(f"{'page':<50} {'requests saved':>15} {'KiB saved':>10} {'load s (before/after)':>22}")
+    for url in urls:
+        before, after = results[("unblocked", url)], results[("blocked", url)]
+        print(f"{url[-50:]:<50} {before['requests'] - after['requests']:>15} "
+              f"{(before['bytes'] - after['bytes']) / 1024:>10.0f} "
+              f"{before['seconds']:>10.2f} / {after['seconds']:.2f}")
+    print("=" * 100)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="KAP request blocking - measure savings")
+    parser.add_argument("--compare", nargs="+", metavar="URL", required=True, help="Pages to load with and without blocking")
+    parser.add_argument("--keep-stylesheets", action="store_true", help="Use the interactive policy (stylesheets allowed)")
+    parser.add_argument("--settle", type=float, default=3.0, help="Seconds to wait after each load before reading the network log")
+    args = parser.parse_args()
+
+    driver_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '.', 'chromedriver'))
+    compare(args.compare, driver_path, INTERACTIVE_POLICY if args.keep_stylesheets else DEFAULT_POLICY, args.settle)
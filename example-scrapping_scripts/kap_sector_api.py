@@ -19,7 +19,6 @@ Gereksinimler: Python 3.10.17 sanal ortam, Chrome + ./chromedriver
 
 import os
 import re
-import time
 import json
 import argparse
 from typing import List, Optional
@@ -33,6 +32,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from kap_waits import PageWaiter
+from kap_resource_blocking import INTERACTIVE_POLICY, ResourceBlocker
+
 
 class Company(BaseModel):
     """Bir sektör veya alt sektör içindeki tek bir şirketi temsil eder."""
@@ -70,8 +72,13 @@ class KAPSectorAPI:
     sektörleri ve içlerindeki şirketleri getiren ve ayrıştıran bir sınıf.
     """
 
-    def __init__(self, driver_path: str = 'chromedriver', driver: Optional[webdriver.Chrome] = None):
-        """Initializes the API, using a shared driver if provided."""
+    def __init__(self, driver_path: str = 'chromedriver', driver: Optional[webdriver.Chrome] = None, block_resources: bool = True):
+        """
+        Initializes the API, using a shared driver if provided.
+        block_resources: kendi başlattığı sürücüde gereksiz istekleri engeller (bkz. kap_resource_blocking.py).
+        """
+        # Stil dosyaları açık kalır: dropdown beklemeleri CSS görünürlüğüne bağlı
+        self.resource_blocker = ResourceBlocker(INTERACTIVE_POLICY if block_resources else None)
         self.base_url = "https://www.kap.org.tr/tr/Sektorler"
         self._shared_driver = bool(driver)
 
@@ -85,9 +92,12 @@ class KAPSectorAPI:
             options.add_argument(
                 "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
             )
+            # Gereksiz kaynakları (görsel, font, izleyici, üçüncü taraf alan adları) engelle
+            self.resource_blocker.configure(options)
             
             service = Service(executable_path=driver_path)
             self.driver = webdriver.Chrome(service=service, options=options)
+            self.resource_blocker.apply(self.driver)
 
 
     def _get_soup(self) -> Optional[BeautifulSoup]:
@@ -99,8 +109,9 @@ class KAPSectorAPI:
             WebDriverWait(self.driver, 20).until(
                 EC.presence_of_element_located((By.ID, "sectorsTable"))
             )
-            # Sayfanın tam olarak yüklenmesi için kısa bir bekleme süresi
-            time.sleep(2)
+            # Tablo değişmeyi bırakana kadar bekle (en fazla 2 sn)
+            PageWaiter(self.driver).for_dom_stable("#sectorsTable", quiet=0.3, timeout=2.0)
+            self.resource_blocker.record_page(self.driver, self.base_url)
             return BeautifulSoup(self.driver.page_source, "html.parser")
         except TimeoutException:
             print("Sayfa içeriğinin yüklenmesi zaman aşımına uğradı.")
@@ -277,6 +288,7 @@ if __name__ == "__main__":
             with open(out, "w", encoding="utf-8") as f:
                 json.dump(payload, f, ensure_ascii=False, indent=2)
             print(f"Sektör verileri JSON olarak kaydedildi: {out}")
+            print(api.resource_blocker.report())
         elif args.cmd == "export-persist":
             with open(out, "w", encoding="utf-8") as f:
                 json.dump(payload, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,179 @@
+"""Quick start / Hızlı başlangıç
+
+Event-driven waits for the KAP Selenium scrapers: instead of fixed sleeps,
+wait for the DOM condition that actually means "ready" and move on the
+moment it holds.
+
+    waiter = PageWaiter(driver)
+    waiter.for_selector("#general")                       # element present
+    waiter.for_attribute_all("#general button", "aria-expanded", "true")
+    waiter.for_network_idle()                             # no new requests for a while
+    waiter.for_dom_stable("#general")                     # MutationObserver quiet period
+    print(WAIT_STATS.report())
+
+Timeouts are per selector (WAIT_TIMEOUTS, falling back to DEFAULT_TIMEOUT).
+Every wait is timed under its condition name in WAIT_STATS (shared by all
+threads, e.g. browser pool workers), including how often it timed out.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+DEFAULT_TIMEOUT = 8.0
+
+# Upper bounds per selector (seconds); a page normally returns long before these
+WAIT_TIMEOUTS: Dict[str, float] = {
+    "#general": 8.0,
+    "tbody tr.border-b": 10.0,
+    "#marketsTable": 20.0,
+    "#sectorsTable": 20.0,
+    "#indicesTable": 20.0,
+}
+
+POLL_INTERVAL = 0.05
+
+# Resolves true once `root` has seen no mutation for quietMs, false at timeoutMs
+_DOM_STABLE_JS = """
+const [selector, quietMs, timeoutMs, done] = arguments;
+const root = (selector && document.querySelector(selector)) || document.body;
+let quiet, hard, observer;
+const finish = (stable) => { observer.disconnect(); clearTimeout(quiet); clearTimeout(hard); done(stable); };
+observer = new MutationObserver(() => { clearTimeout(quiet); quiet = setTimeout(() => finish(true), quietMs); });
+observer.observe(root, {subtree: true, childList: true, attributes: true, characterData: true});
+quiet = setTimeout(() => finish(true), quietMs);
+hard = setTimeout(() => finish(false), timeoutMs);
+"""
+
+# null when the state cannot be observed (no matches, or attribute not used)
+_ATTRIBUTE_ALL_JS = """
+const [selector, name, value] = arguments;
+const nodes = Array.from(document.querySelectorAll(selector));
+if (!nodes.length || nodes.some(n => !n.hasAttribute(name))) return null;
+return nodes.every(n => n.getAttribute(name) === value);
+"""
+
+_NETWORK_JS = "return [document.readyState, performance.getEntriesByType('resource').length];"
+
+
+class WaitStats:
+    """Thread-safe timing per wait condition."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, dict] = {}
+
+    def record(self, condition: str, seconds: float, ok: bool):
+        with self._lock:
+            s = self._stats.setdefault(condition, {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+            s["count"] += 1
+            s["total"] += seconds
+            s["max"] = max(s["max"], seconds)
+            if not ok:
+                s["timeouts"] += 1
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            return {k: dict(v) for k, v in self._stats.items()}
+
+    def report(self) -> str:
+        lines = ["Wait conditions (count, mean, max, timeouts):"]
+        for condition, s in sorted(self.snapshot().items(), key=lambda kv: -kv[1]["total"]):
+            mean = s["total"] / s["count"] if s["count"] else 0.0
+            lines.append(f"  {condition:<55} {s['count']:>5}  {mean * 1000:7.0f} ms  {s['max'] * 1000:7.0f} ms  {s['timeouts']:>4}")
+        return "\n".join(lines)
+
+
+WAIT_STATS = WaitStats()
+
+
+def timeout_for(selector: Optional[str], default: float = DEFAULT_TIMEOUT) -> float:
+    return WAIT_TIMEOUTS.get(selector, default) if selector else default
+
+
+class PageWaiter:
+    """Explicit readiness conditions on one driver; each returns True if met before its timeout."""
+
+    def __init__(self, driver: webdriver.Chrome, stats: WaitStats = WAIT_STATS):
+        self.driver = driver
+        self.stats = stats
+
+    def _timed(self, condition: str, func) -> bool:
+        started = time.perf_counter()
+        ok = False
+        try:
+            ok = bool(func())
+        except TimeoutException:
+            ok = False
+        finally:
+            self.stats.record(condition, time.perf_counter() - started, ok)
+        return ok
+
+    def for_selector(self, selector: str, timeout: Optional[float] = None) -> bool:
+        """Element matching the CSS selector is present in the DOM."""
+        timeout = timeout or timeout_for(selector)
+        return self._timed(f"present {selector}", lambda: WebDriverWait(self.driver, timeout, POLL_INTERVAL).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+        ))
+
+    def for_visible(self, selector: str, timeout: Optional[float] = None) -> bool:
+        """Element matching the CSS selector is displayed."""
+        timeout = timeout or timeout_for(selector)
+        return self._timed(f"visible {selector}", lambda: WebDriverWait(self.driver, timeout, POLL_INTERVAL).until(
+            EC.visibility_of_element_located((By.CSS_SELECTOR, selector))
+        ))
+
+    def for_attribute_all(self, selector: str, name: str, value: str, timeout: Optional[float] = None) -> Optional[bool]:
+        """
+        Every element matching `selector` has attribute name == value (e.g. all
+        section toggles aria-expanded="true"). Returns None straight away when
+        the state is not observable: nothing matches or the attribute is absent.
+        """
+        timeout = timeout or timeout_for(selector, 3.0)
+        condition = f"{name}={value} {selector}"
+        started = time.perf_counter()
+        deadline = started + timeout
+        while True:
+            state = self.driver.execute_script(_ATTRIBUTE_ALL_JS, selector, name, value)
+            if state is None or state or time.perf_counter() >= deadline:
+                break
+            time.sleep(POLL_INTERVAL)
+        if state is None:
+            return None
+        self.stats.record(condition, time.perf_counter() - started, bool(state))
+        return bool(state)
+
+    def for_network_idle(self, idle: float = 0.5, timeout: float = DEFAULT_TIMEOUT) -> bool:
+        """
+        Document loaded and no resource request has completed for `idle` seconds
+        (Resource Timing entries, so requests started by scripts count too).
+        """
+        def idle_reached():
+            last_count, last_change = -1, time.perf_counter()
+            deadline = last_change + timeout
+            while time.perf_counter() < deadline:
+                ready_state, count = self.driver.execute_script(_NETWORK_JS)
+                now = time.perf_counter()
+                if count != last_count or ready_state != "complete":
+                    last_count, last_change = count, now
+                elif now - last_change >= idle:
+                    return True
+                time.sleep(POLL_INTERVAL)
+            return False
+        return self._timed("network idle", idle_reached)
+
+    def for_dom_stable(self, selector: Optional[str] = None, quiet: float = 0.25, timeout: float = 3.0) -> bool:
+        """No DOM mutation under `selector` (default: body) for `quiet` seconds."""
+        def stable():
+            self.driver.set_script_timeout(timeout + 2)
+            try:
+                return self.driver.execute_async_script(_DOM_STABLE_JS, selector, int(quiet * 1000), int(timeout * 1000))
+            except WebDriverException:
+                return False
+        return self._timed(f"dom stable {selector or 'body'}", stable)
@@ -1,101 +1,291 @@
 #!/usr/bin/env python3
-"""Monitor financial scraper V2 progress"""
+"""Monitor financial scraper V2 progress
+
+Refresh cost stays constant however large the log and the table get:
+- progress comes from the scraper's JSON-lines run journal (or, for older
+  runs, its log file), read incrementally from the last offset. The
+  offset and counters are saved, so a restarted monitor does not re-read
+  the file either.
+- DB figures are planner estimates (pg_class.reltuples, pg_stats.n_distinct)
+  plus index probes for the watched companies, never full-table counts.
+
+Usage:
+    python monitor_scraper.py                                  # logs/financial_scraper_journal.jsonl
+    python monitor_scraper.py --log logs/financial_scraper_v2_full_20251016_233820.log
+"""
 
 import os
+import json
 import time
-from datetime import datetime
+import argparse
+from typing import Optional, List, Dict
+from dataclasses import dataclass, asdict, field
 from sqlalchemy import create_engine, text
 from dotenv import load_dotenv
 
 load_dotenv()
 
-DATABASE_URL = os.getenv("DATABASE_URL")
-db_url = DATABASE_URL.replace("postgresql://", "postgresql+psycopg2://").split("?")[0]
-engine = create_engine(db_url)
+# Previously missing 16 companies
+MISSING_16 = [
+    "CRDFA", "GARFA", "LIDFA", "ULUFA",  # Faktoring
+    "ISFIN", "QNBFK", "SEKFK", "VAKFN",  # Leasing
+    "BRKVY", "GLCVY", "SMRVA",           # Asset Mgmt
+    "DOCO", "MARMR", "ISKUR", "KTLEV"    # Other
+]
+
+
+@dataclass
+class Progress:
+    """Counters folded from journal events or log lines"""
+    path: str
+    inode: int = 0
+    offset: int = 0
+    head: str = ""  # hex of the file's first bytes, to spot same-inode truncate + regrowth
+    run_id: Optional[str] = None
+    total: int = 0
+    current: int = 0
+    done: int = 0
+    failed: int = 0
+    rows: int = 0
+    last_symbol: str = ""
+    finished: bool = False
+    failed_symbols: List[str] = field(default_factory=list)
+    # Journal only: latest outcome per companyId ({status, symbol, rows}),
+    # in order of last update; the counters above are derived from it
+    statuses: Dict[str, dict] = field(default_factory=dict)
+
+
+class IncrementalTail:
+    """
+    Reads only the lines appended since the previous call.
+
+    Only complete lines are consumed; a half-written last line is picked up
+    on the next tick. If the file was replaced or truncated (new journal
+    run, logrotate, pm2 flush), reading restarts from the beginning. A
+    truncate that regrew past the old offset between two ticks keeps the
+    inode and size checks quiet, so the first bytes are compared as well.
+    """
+
+    HEAD_BYTES = 64
+
+    def __init__(self, progress: Progress):
+        self.progress = progress
+
+    def read_new_lines(self) -> tuple[List[str], bool]:
+        """
+        Returns:
+            (new complete lines, True if the file was reset since the last call)
+        """
+        try:
+            stat = os.stat(self.progress.path)
+        except FileNotFoundError:
+            return [], False
+
+        with open(self.progress.path, "rb") as f:
+            head = f.read(self.HEAD_BYTES)
+            known = bytes.fromhex(self.progress.head)
+            reset = (
+                stat.st_ino != self.progress.inode
+                or stat.st_size < self.progress.offset
+                or head[:len(known)] != known
+            )
+            if reset:
+                self.progress.inode = stat.st_ino
+                self.progress.offset = 0
+            self.progress.head = head.hex()
+            if stat.st_size == self.progress.offset:
+                return [], reset
+
+            f.seek(self.progress.offset)
+            chunk = f.read(stat.st_size - self.progress.offset)
+        complete = chunk[:chunk.rfind(b"\n") + 1]
+        self.progress.offset += len(complete)
+        return complete.decode("utf-8", errors="replace").splitlines(), reset
+
+
+def apply_journal_line(progress: Progress, line: str):
+    """Fold one run-journal event into the counters"""
+    try:
+        event = json.loads(line)
+    except json.JSONDecodeError:
+        return
+    kind = event.get("event")
+    if kind == "start":
+        reset_counters(progress)
+        progress.run_id = event.get("run_id")
+        progress.total = event.get("total", 0)
+    elif kind == "resume":
+        progress.finished = False
+    elif kind == "company":
+        # A company retried after a resume is journaled again: the latest event wins
+        key = str(event.get("companyId", event.get("symbol", "")))
+        progress.statuses.pop(key, None)
+        progress.statuses[key] = {
+            "status": event.get("status"),
+            "symbol": event.get("symbol", ""),
+            "rows": event.get("rows") or 0,
+        }
+        progress.last_symbol = event.get("symbol", "")
+        derive_counters(progress)
+    elif kind == "finish":
+        progress.finished = True
+
+
+def derive_counters(progress: Progress):
+    """Recompute current/done/failed/rows/failed_symbols from the per-company statuses"""
+    statuses = progress.statuses.values()
+    failed = [s["symbol"] for s in statuses if s["status"] == "failed"]
+    progress.current = len(progress.statuses)
+    progress.failed = len(failed)
+    progress.done = progress.current - progress.failed
+    progress.rows = sum(s["rows"] for s in statuses if s["status"] != "failed")
+    progress.failed_symbols = failed[-10:]
+
+
+def apply_log_line(progress: Progress, line: str):
+    """Fold one scraper log line into the counters"""
+    if "Processing:" in line and "[" in line:
+        # Extract [X/592]
+        start = line.find("[") + 1
+        end = line.find("]")
+        try:
+            current, total = (int(part) for part in line[start:end].split("/"))
+        except ValueError:
+            return
+        progress.current, progress.total = current, total
+        progress.last_symbol = line.split("Processing:", 1)[1].split(" - ")[0].strip()
+    elif "✓ Success:" in line:
+        progress.done += 1
+    elif "✗ Failed:" in line:
+        progress.failed += 1
+        symbol = line.split("✗ Failed:", 1)[1].split(":")[0].strip()
+        progress.failed_symbols = (progress.failed_symbols + [symbol])[-10:]
+    elif "SCRAPING COMPLETED" in line:
+        progress.finished = True
+
+
+def reset_counters(progress: Progress):
+    fresh = Progress(path=progress.path, inode=progress.inode, offset=progress.offset)
+    progress.__dict__.update(fresh.__dict__)
 
-# Get log file
-log_file = "/Users/ademcelik/Desktop/kap_bist_data/logs/financial_scraper_v2_full_20251016_233820.log"
 
-def get_progress():
-    """Parse log file for progress"""
+def load_state(state_file: str, path: str) -> Progress:
+    """Saved offset and counters for ``path`` (fresh if missing or for another file)"""
     try:
-        with open(log_file, 'r') as f:
-            lines = f.readlines()
-        
-        # Find last processed company
-        for line in reversed(lines):
-            if "Processing:" in line and "[" in line:
-                # Extract [X/592]
-                start = line.find("[") + 1
-                end = line.find("]")
-                progress = line[start:end]
-                current, total = progress.split("/")
-                return int(current), int(total)
-        
-        return 0, 592
-    except:
-        return 0, 592
-
-def get_db_stats():
-    """Get database statistics"""
+        with open(state_file, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        # States saved before per-company statuses / head fingerprints existed are re-read from the start
+        if saved.get("path") == path and "statuses" in saved and "head" in saved:
+            return Progress(**saved)
+    except (FileNotFoundError, json.JSONDecodeError, TypeError):
+        pass
+    return Progress(path=path)
+
+
+def save_state(state_file: str, progress: Progress):
+    tmp = state_file + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(asdict(progress), f)
+    os.replace(tmp, state_file)
+
+
+def get_db_stats(engine):
+    """Database statistics from planner estimates and index probes (no full scans)"""
     with engine.connect() as conn:
-        # Total records
+        # Row estimate maintained by autovacuum/ANALYZE (-1 = never analyzed)
         total = conn.execute(text(
-            "SELECT COUNT(*) FROM financial_statements"
-        )).scalar()
-        
-        # Companies with data
-        companies = conn.execute(text(
-            "SELECT COUNT(DISTINCT \"companyId\") FROM financial_statements"
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = 'financial_statements'::regclass"
         )).scalar()
-        
-        # Previously missing 16 companies
-        missing_16 = [
-            "CRDFA", "GARFA", "LIDFA", "ULUFA",  # Faktoring
-            "ISFIN", "QNBFK", "SEKFK", "VAKFN",  # Leasing
-            "BRKVY", "GLCVY", "SMRVA",           # Asset Mgmt
-            "DOCO", "MARMR", "ISKUR", "KTLEV"    # Other
-        ]
-        
+
+        # Distinct companies estimate; negative n_distinct is a fraction of the row count
+        n_distinct = conn.execute(text("""
+            SELECT n_distinct FROM pg_stats
+            WHERE tablename = 'financial_statements' AND attname = 'companyId'
+        """)).scalar()
+        companies = None
+        if n_distinct is not None and total is not None and total >= 0:
+            companies = int(-n_distinct * total) if n_distinct < 0 else int(n_distinct)
+
+        # One index probe per watched company
         found_missing = conn.execute(text("""
-            SELECT c.code 
+            SELECT c.code
             FROM companies c
-            JOIN financial_statements fs ON c.id = fs."companyId"
             WHERE c.code = ANY(:codes)
-            GROUP BY c.code
-        """), {"codes": missing_16}).fetchall()
-        
-        found_count = len(found_missing)
+              AND EXISTS (SELECT 1 FROM financial_statements fs WHERE fs."companyId" = c.id)
+        """), {"codes": MISSING_16}).fetchall()
+
         found_symbols = [row[0] for row in found_missing]
-        
-        return total, companies, found_count, found_symbols
-
-# Monitor
-print("=" * 80)
-print("📊 FINANCIAL SCRAPER V2 - LIVE MONITOR")
-print("=" * 80)
-print()
-
-while True:
-    current, total = get_progress()
-    db_total, db_companies, found_16, found_symbols = get_db_stats()
-    
-    percent = (current / total * 100) if total > 0 else 0
-    
-    print(f"\r⏳ Progress: [{current}/{total}] {percent:.1f}% | ", end="")
-    print(f"DB: {db_total:,} records, {db_companies} companies | ", end="")
-    print(f"Missing 16: {found_16}/16 found    ", end="", flush=True)
-    
-    if current >= total:
-        print("\n\n✅ SCRAPING COMPLETED!")
-        print(f"\nFinal Statistics:")
-        print(f"  - Total Records: {db_total:,}")
-        print(f"  - Companies: {db_companies}/592")
-        print(f"  - Previously Missing: {found_16}/16 recovered")
-        if found_symbols:
-            print(f"\n  Found: {', '.join(sorted(found_symbols))}")
-        break
-    
-    time.sleep(10)  # Update every 10 seconds
-
-print("\n" + "=" * 80)
+        return total, companies, len(found_symbols), found_symbols
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monitor financial scraper V2 progress")
+    parser.add_argument(
+        "--journal",
+        default=os.getenv("FINANCIAL_SCRAPER_JOURNAL", "logs/financial_scraper_journal.jsonl"),
+        help="Run journal written by financial_scraper_v2.py (env: FINANCIAL_SCRAPER_JOURNAL)"
+    )
+    parser.add_argument("--log", help="Follow a scraper log file instead of the journal")
+    parser.add_argument("--interval", type=float, default=10.0, help="Seconds between updates")
+    parser.add_argument("--state", default="logs/.monitor_scraper_state.json", help="Saved tail offset and counters")
+    args = parser.parse_args()
+
+    DATABASE_URL = os.getenv("DATABASE_URL")
+    db_url = DATABASE_URL.replace("postgresql://", "postgresql+psycopg2://").split("?")[0]
+    engine = create_engine(db_url)
+
+    path = args.log or args.journal
+    apply_line = apply_log_line if args.log else apply_journal_line
+    state_dir = os.path.dirname(args.state)
+    if state_dir:
+        os.makedirs(state_dir, exist_ok=True)
+    progress = load_state(args.state, path)
+    tail = IncrementalTail(progress)
+
+    # Monitor
+    print("=" * 80)
+    print("📊 FINANCIAL SCRAPER V2 - LIVE MONITOR")
+    print(f"   Source: {path}")
+    print("=" * 80)
+    print()
+
+    while True:
+        lines, reset = tail.read_new_lines()
+        if reset:
+            reset_counters(progress)
+        for line in lines:
+            apply_line(progress, line)
+        save_state(args.state, progress)
+
+        db_total, db_companies, found_16, found_symbols = get_db_stats(engine)
+        current = progress.current
+        total = progress.total or 592
+        percent = (current / total * 100) if total > 0 else 0
+        db_records = f"~{db_total:,}" if db_total is not None and db_total >= 0 else "n/a (not analyzed)"
+        db_company_count = f"~{db_companies}" if db_companies is not None else "n/a"
+
+        print(f"\r⏳ Progress: [{current}/{total}] {percent:.1f}% | ", end="")
+        print(f"✓ {progress.done} ✗ {progress.failed} | ", end="")
+        print(f"DB: {db_records} records, {db_company_count} companies | ", end="")
+        print(f"Missing 16: {found_16}/16 found    ", end="", flush=True)
+
+        if progress.finished or current >= total:
+            print("\n\n✅ SCRAPING COMPLETED!")
+            print(f"\nFinal Statistics:")
+            print(f"  - Total Records: {db_records}")
+            print(f"  - Companies: {db_company_count}/{total}")
+            print(f"  - Successful: {progress.done}, Failed: {progress.failed}")
+            if progress.failed_symbols:
+                print(f"  - Last failures: {', '.join(progress.failed_symbols)}")
+            print(f"  - Previously Missing: {found_16}/16 recovered")
+            if found_symbols:
+                print(f"\n  Found: {', '.join(sorted(found_symbols))}")
+            break
+
+        time.sleep(args.interval)
+
+    print("\n" + "=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+-- AlterTable
+ALTER TABLE "company_financial_groups" ADD COLUMN     "contentHash" VARCHAR(64),
+ADD COLUMN     "etag" VARCHAR(256),
+ADD COLUMN     "lastChangedAt" TIMESTAMP(3),
+ADD COLUMN     "lastModified" VARCHAR(64),
+ADD COLUMN     "lastVerifiedAt" TIMESTAMP(3);
+
+-- Existing rows were last written (and checked) at updatedAt
+UPDATE "company_financial_groups" SET "lastVerifiedAt" = "updatedAt", "lastChangedAt" = "updatedAt";
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Group Extraction Benchmark - streaming ddlMaliTabloGroup extraction vs full BeautifulSoup parse
+
+Runs scrape_financial_groups.extract_group_options (fed in the scraper's
+stream chunk size) and the full-page BeautifulSoup parse over saved
+company card HTML files, checks both return the same options, and reports
+time per page and how much of each page the streaming extractor had to read.
+
+Fixtures are the *.html files in --fixtures. If there are none, company
+cards are generated with the local stub server and saved there first;
+real pages (saved from sirket-karti.aspx) can be dropped in the same way.
+No network or database needed.
+
+Usage:
+    .venv/bin/python scripts/benchmark_group_extraction.py --fixtures /tmp/company_cards --repeat 5
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+from scrape_financial_groups import FinancialGroupScraper, extract_group_options, parse_group_options_soup
+from isyatirim_stub_server import StubIsYatirimServer
+
+import glob
+import time
+import argparse
+import numpy as np
+
+
+def save_stub_fixtures(directory: str, companies: int, page_kb: int):
+    """Write generated company cards as <ticker>.html"""
+    server = StubIsYatirimServer(page_kb=page_kb)
+    os.makedirs(directory, exist_ok=True)
+    for idx in range(companies):
+        ticker = f"STB{idx:03d}"
+        with open(os.path.join(directory, f"{ticker}.html"), "w", encoding="utf-8") as f:
+            f.write(server.company_card(ticker))
+
+
+def streamed(page: bytes, counter: list):
+    """Yield the page in stream-sized chunks, counting bytes handed out"""
+    size = FinancialGroupScraper.STREAM_CHUNK_SIZE
+    for start in range(0, len(page), size):
+        chunk = page[start:start + size]
+        counter[0] += len(chunk)
+        yield chunk
+
+
+def best_ms(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark company card financial group extraction")
+    parser.add_argument("--fixtures", default="/tmp/company_cards", help="Directory of saved company card *.html files")
+    parser.add_argument("--companies", type=int, default=50, help="Stub cards to generate when --fixtures is empty")
+    parser.add_argument("--page-kb", type=int, default=250, help="Generated card size")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per page (best is reported)")
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(args.fixtures, "*.html")))
+    if not paths:
+        save_stub_fixtures(args.fixtures, args.companies, args.page_kb)
+        paths = sorted(glob.glob(os.path.join(args.fixtures, "*.html")))
+
+    soup_ms, stream_ms, read_ratio = [], [], []
+    mismatches = 0
+    total_bytes = 0
+    for path in paths:
+        with open(path, "rb") as f:
+            page = f.read()
+        html = page.decode("utf-8")
+        total_bytes += len(page)
+
+        expected = parse_group_options_soup(html)
+        counter = [0]
+        actual = extract_group_options(streamed(page, counter))
+        if actual != expected:
+            mismatches += 1
+            print(f"✗ {os.path.basename(path)}: streaming {actual} != soup {expected}")
+        read_ratio.append(counter[0] / len(page))
+
+        # The reference parse gets the decoded text, as response.text did
+        soup_ms.append(best_ms(lambda: parse_group_options_soup(html), args.repeat))
+        stream_ms.append(best_ms(lambda: extract_group_options(streamed(page, [0])), args.repeat))
+
+    soup_mean, stream_mean = np.mean(soup_ms), np.mean(stream_ms)
+    print("=" * 78)
+    print(f"Fixtures:         {len(paths)} pages, {total_bytes / len(paths) / 1024:.0f} KiB average ({args.fixtures})")
+    print(f"BeautifulSoup:    {soup_mean:8.2f} ms/page (p95 {np.percentile(soup_ms, 95):.2f})")
+    print(f"Streaming:        {stream_mean:8.2f} ms/page (p95 {np.percentile(stream_ms, 95):.2f}) "
+          f"-> {soup_mean / stream_mean:.1f}x faster")
+    print(f"Page read:        {np.mean(read_ratio):.0%} on average before the select closed")
+    print(f"Identical output: {len(paths) - mismatches}/{len(paths)}")
+    print("=" * 78)
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
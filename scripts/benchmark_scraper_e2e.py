@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+End-to-End Scraper Benchmark - financial_scraper_v2.main() against the local stub
+
+Starts the Is Yatirim stub server in-process with the requested latency
+and fault profile, then runs the full main() path for the first N
+companies: DB mapping, worker pool, rate limiter, retries, batch writer
+and COPY upserts. It reports companies/min, requests/sec and p50/p99
+chunk request latency as seen by the client.
+
+Rows go to a scratch copy of financial_statements
+(financial_statements_bench, dropped afterwards), and the run uses its
+own temporary journal, so production data and resume state are untouched.
+Companies are read from the `companies` table of DATABASE_URL.
+
+Arguments after `--` are passed to main() unchanged.
+
+Usage:
+    .venv/bin/python scripts/benchmark_scraper_e2e.py --companies 40 --latency-ms 80 --jitter-ms 20
+    .venv/bin/python scripts/benchmark_scraper_e2e.py --throttle-rate 0.05 -- --workers 8 --max-rps 20
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+import financial_scraper_v2
+from financial_scraper_v2 import FinancialDataProcessor, RunJournal
+from isyatirim_stub_server import StubIsYatirimServer, parse_outage
+
+import time
+import logging
+import argparse
+import tempfile
+import threading
+import numpy as np
+from typing import Optional
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, text
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+BENCH_TABLE = "financial_statements_bench"
+
+
+class RecordingRateLimiter(financial_scraper_v2.RateLimiter):
+    """RateLimiter that also keeps every request's status and latency"""
+
+    samples: list[tuple[Optional[int], float]] = []
+    _samples_lock = threading.Lock()
+
+    def record_response(self, status_code: Optional[int], latency: float):
+        with self._samples_lock:
+            self.samples.append((status_code, latency))
+        super().record_response(status_code, latency)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark financial_scraper_v2.main() against the local Is Yatirim stub",
+        usage="%(prog)s [options] [-- main() options]"
+    )
+    parser.add_argument("--companies", type=int, default=40, help="Companies to process (main() --limit)")
+    parser.add_argument("--latency-ms", type=float, default=80.0, help="Stub base response delay")
+    parser.add_argument("--jitter-ms", type=float, default=20.0, help="Stub mean extra delay (exponential tail)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 500 responses")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of 429 responses")
+    parser.add_argument("--outage", type=parse_outage, default=None, help="START:END seconds of 503s, e.g. 5:20")
+    parser.add_argument("--verbose", action="store_true", help="Keep the scraper's per-company log lines")
+    argv = sys.argv[1:]
+    main_argv = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, main_argv = argv[:split], argv[split + 1:]
+    args = parser.parse_args(argv)
+
+    DATABASE_URL = os.getenv("DATABASE_URL")
+    if not DATABASE_URL:
+        raise ValueError("DATABASE_URL not set")
+
+    if not args.verbose:
+        logging.getLogger("financial_scraper_v2").setLevel(logging.WARNING)
+
+    db_url = DATABASE_URL.replace("postgresql://", "postgresql+psycopg2://").split("?")[0]
+    engine = create_engine(db_url)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"DROP TABLE IF EXISTS {BENCH_TABLE}")
+        conn.exec_driver_sql(f"CREATE TABLE {BENCH_TABLE} (LIKE financial_statements INCLUDING ALL)")
+        # id is SERIAL: the copied default would draw from the production sequence
+        conn.exec_driver_sql(f"CREATE SEQUENCE {BENCH_TABLE}_id_seq OWNED BY {BENCH_TABLE}.id")
+        conn.exec_driver_sql(f"ALTER TABLE {BENCH_TABLE} ALTER COLUMN id SET DEFAULT nextval('{BENCH_TABLE}_id_seq')")
+
+    original_limiter, original_table = financial_scraper_v2.RateLimiter, FinancialDataProcessor.TARGET_TABLE
+    financial_scraper_v2.RateLimiter = RecordingRateLimiter
+    FinancialDataProcessor.TARGET_TABLE = BENCH_TABLE
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp, StubIsYatirimServer(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            throttle_rate=args.throttle_rate,
+            outage=args.outage
+        ) as server:
+            journal_path = os.path.join(tmp, "journal.jsonl")
+            started = time.perf_counter()
+            financial_scraper_v2.main([
+                "--base-url", server.base_url,
+                "--limit", str(args.companies),
+                "--journal", journal_path,
+                "--fresh",
+                *main_argv,
+            ])
+            wall = time.perf_counter() - started
+            statuses = RunJournal(journal_path).load_last_run()["statuses"]
+            status_counts = dict(sorted(server.status_counts.items()))
+
+        with engine.connect() as conn:
+            rows = conn.execute(text(f"SELECT COUNT(*) FROM {BENCH_TABLE}")).scalar()
+    finally:
+        financial_scraper_v2.RateLimiter = original_limiter
+        FinancialDataProcessor.TARGET_TABLE = original_table
+        with engine.begin() as conn:
+            conn.exec_driver_sql(f"DROP TABLE IF EXISTS {BENCH_TABLE}")
+        engine.dispose()
+
+    done = sum(1 for status in statuses.values() if status == "done")
+    failed = sum(1 for status in statuses.values() if status == "failed")
+    latencies = np.array([latency for _, latency in RecordingRateLimiter.samples]) * 1000
+    requests_made = len(latencies)
+    p50, p99 = np.percentile(latencies, [50, 99]) if requests_made else (0.0, 0.0)
+    http = ", ".join(f"{status}: {count}" for status, count in status_counts.items())
+
+    print("\n" + "=" * 80)
+    print(f"Stub profile:   latency {args.latency_ms:.0f}ms + ~{args.jitter_ms:.0f}ms tail, "
+          f"errors {args.error_rate:.0%}, 429s {args.throttle_rate:.0%}"
+          + (f", outage {args.outage[0]:.0f}-{args.outage[1]:.0f}s" if args.outage else ""))
+    print(f"main() args:    {' '.join(main_argv) or '(defaults)'}")
+    print("-" * 80)
+    print(f"Companies:      {done} done, {failed} failed in {wall:.1f}s "
+          f"-> {(done + failed) / (wall / 60):.1f} companies/min")
+    print(f"Requests:       {requests_made} (HTTP {http}) -> {requests_made / wall:.1f} req/s")
+    print(f"Chunk latency:  p50 {p50:.1f} ms, p99 {p99:.1f} ms")
+    print(f"Rows stored:    {rows:,}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Upsert Benchmark - COPY staging path vs legacy to_sql path
+
+Writes synthetic long-format financial data into a scratch copy of
+financial_statements (financial_statements_bench, dropped afterwards)
+and reports rows/sec for both FinancialDataProcessor upsert paths:
+fresh inserts, ON CONFLICT updates with changed values, and a re-run
+with identical values (skipped as unchanged).
+
+Usage:
+    .venv/bin/python scripts/benchmark_upsert.py --companies 20 --items 250 --years 6
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+from financial_scraper_v2 import FinancialDataProcessor
+
+import time
+import random
+import logging
+import argparse
+import pandas as pd
+from dotenv import load_dotenv
+
+load_dotenv()
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+BENCH_TABLE = "financial_statements_bench"
+STATEMENT_TYPES = {
+    "1": "BALANCE_SHEET_ASSETS",
+    "2": "BALANCE_SHEET_LIABILITIES",
+    "3": "INCOME_STATEMENT",
+    "4": "CASH_FLOW",
+}
+
+
+def build_company_frame(company_id: int, items: int, years: int) -> pd.DataFrame:
+    """Synthetic long-format frame shaped like transform_to_long_format output"""
+    rows = []
+    for item in range(items):
+        prefix = str(item % 4 + 1)
+        item_code = f"{prefix}{item:04d}"
+        for year in range(2020, 2020 + years):
+            for quarter in range(1, 5):
+                rows.append({
+                    "companyId": company_id,
+                    "year": year,
+                    "quarter": quarter,
+                    "itemCode": item_code,
+                    "itemNameTR": f"Kalem {item_code}",
+                    "itemNameEN": f"Item {item_code}",
+                    "value": round(random.uniform(-1e9, 1e9), 2),
+                    "statementType": STATEMENT_TYPES[prefix],
+                    "financialGroup": "XI_29",
+                    "currency": "TRY",
+                })
+    return pd.DataFrame(rows)
+
+
+def run_path(processor: FinancialDataProcessor, frames: list[pd.DataFrame]) -> tuple[int, float]:
+    """Upsert every frame, one call per company; return (rows, seconds)"""
+    started = time.perf_counter()
+    rows = sum(processor.upsert_financial_data(df) for df in frames)
+    return rows, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark financial_statements upsert paths")
+    parser.add_argument("--companies", type=int, default=20, help="Companies (one upsert call each)")
+    parser.add_argument("--items", type=int, default=250, help="Line items per company")
+    parser.add_argument("--years", type=int, default=6, help="Years of quarters per company")
+    args = parser.parse_args()
+
+    DATABASE_URL = os.getenv("DATABASE_URL")
+    if not DATABASE_URL:
+        raise ValueError("DATABASE_URL not set")
+
+    frames = [
+        build_company_frame(company_id, args.items, args.years)
+        for company_id in range(1, args.companies + 1)
+    ]
+    total_rows = sum(len(df) for df in frames)
+    logger.info(f"Synthetic data: {args.companies} companies, {total_rows:,} rows")
+
+    # Silence per-call "Upserted N records" lines
+    logging.getLogger("financial_scraper_v2").setLevel(logging.WARNING)
+
+    changed_frames = [df.assign(value=df["value"] + 1) for df in frames]
+
+    results = {}
+    for label, use_copy in (("to_sql (legacy)", False), ("COPY staging", True)):
+        processor = FinancialDataProcessor(DATABASE_URL, use_copy=use_copy)
+        processor.TARGET_TABLE = BENCH_TABLE
+
+        with processor.engine.begin() as conn:
+            conn.exec_driver_sql(f"DROP TABLE IF EXISTS {BENCH_TABLE}")
+            conn.exec_driver_sql(
+                f"CREATE TABLE {BENCH_TABLE} (LIKE financial_statements INCLUDING ALL)"
+            )
+            # id is SERIAL: the copied default would draw from the production sequence
+            conn.exec_driver_sql(f"CREATE SEQUENCE {BENCH_TABLE}_id_seq OWNED BY {BENCH_TABLE}.id")
+            conn.exec_driver_sql(
+                f"ALTER TABLE {BENCH_TABLE} ALTER COLUMN id SET DEFAULT nextval('{BENCH_TABLE}_id_seq')"
+            )
+
+        try:
+            insert_rows, insert_secs = run_path(processor, frames)
+            update_rows, update_secs = run_path(processor, changed_frames)
+            _, unchanged_secs = run_path(processor, changed_frames)
+        finally:
+            with processor.engine.begin() as conn:
+                conn.exec_driver_sql(f"DROP TABLE IF EXISTS {BENCH_TABLE}")
+            processor.engine.dispose()
+
+        results[label] = (
+            insert_rows / insert_secs,
+            update_rows / update_secs,
+            total_rows / unchanged_secs,
+        )
+        logger.info(
+            f"{label}: insert {insert_rows:,} rows in {insert_secs:.2f}s, "
+            f"update {update_rows:,} rows in {update_secs:.2f}s, "
+            f"unchanged {total_rows:,} rows in {unchanged_secs:.2f}s"
+        )
+
+    print("\n" + "=" * 80)
+    print(f"{'Path':<20} {'Insert rows/s':>18} {'Update rows/s':>18} {'Unchanged rows/s':>20}")
+    print("-" * 80)
+    for label, (insert_rate, update_rate, unchanged_rate) in results.items():
+        print(f"{label:<20} {insert_rate:>18,.0f} {update_rate:>18,.0f} {unchanged_rate:>20,.0f}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Async Client Parity Check - AsyncIsYatirimFinancialAPI vs IsYatirimFinancialAPI
+
+Starts the local Is Yatirim stub server, fetches the same companies with
+the sync client (one request at a time) and the async client (all
+companies in flight at once from one thread), and fails unless every
+DataFrame is identical. Covers full-history and incremental fetches.
+No network or database needed.
+
+Usage:
+    .venv/bin/python scripts/check_async_parity.py --companies 30 --connections 32 --latency-ms 50
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+from financial_scraper_v2 import AsyncIsYatirimFinancialAPI, IsYatirimFinancialAPI, RateLimiter
+from isyatirim_stub_server import StubIsYatirimServer
+
+import time
+import asyncio
+import logging
+import argparse
+from datetime import datetime
+import pandas as pd
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+GROUPS = ["XI_29", "XI_29K", "UFRS", "UFRS_K"]
+
+
+def build_cases(companies: int) -> list[tuple]:
+    """(symbol, group, start_year, end_year, since) per company; every fourth one incremental"""
+    end_year = datetime.now().year
+    cases = []
+    for idx in range(companies):
+        since = (end_year - 2, 6) if idx % 4 == 3 else None
+        cases.append((f"STB{idx:03d}", GROUPS[idx % len(GROUPS)], 2015, end_year, since))
+    return cases
+
+
+def run_sync(host: str, cases: list[tuple]) -> tuple[list[pd.DataFrame], float]:
+    api = IsYatirimFinancialAPI(rate_limiter=RateLimiter(max_rps=10_000, burst=10_000), host=host)
+    started = time.perf_counter()
+    frames = [api.fetch_financials(*case) for case in cases]
+    return frames, time.perf_counter() - started
+
+
+async def run_async(host: str, cases: list[tuple], connections: int) -> tuple[list[pd.DataFrame], float]:
+    async with AsyncIsYatirimFinancialAPI(
+        rate_limiter=RateLimiter(max_rps=10_000, burst=10_000),
+        max_connections=connections,
+        host=host
+    ) as api:
+        started = time.perf_counter()
+        frames = await asyncio.gather(*(api.fetch_financials(*case) for case in cases))
+        return list(frames), time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check async/sync MaliTablo client parity")
+    parser.add_argument("--companies", type=int, default=30)
+    parser.add_argument("--connections", type=int, default=32, help="Async connection pool size")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Stub response delay")
+    args = parser.parse_args()
+
+    # Per-company "Fetching ..." lines would drown the result
+    logging.getLogger("financial_scraper_v2").setLevel(logging.WARNING)
+
+    cases = build_cases(args.companies)
+    with StubIsYatirimServer(latency_ms=args.latency_ms) as server:
+        sync_frames, sync_secs = run_sync(server.base_url, cases)
+        async_frames, async_secs = asyncio.run(run_async(server.base_url, cases, args.connections))
+        requests_served = server.requests_served
+
+    mismatches = 0
+    for (symbol, *_), expected, actual in zip(cases, sync_frames, async_frames):
+        try:
+            pd.testing.assert_frame_equal(actual, expected)
+        except AssertionError as e:
+            mismatches += 1
+            logger.error(f"✗ {symbol}: async result differs from sync\n{e}")
+
+    logger.info(
+        f"{len(cases)} companies, {requests_served} requests: "
+        f"sync {sync_secs:.2f}s, async {async_secs:.2f}s ({sync_secs / async_secs:.1f}x)"
+    )
+    if mismatches:
+        logger.error(f"✗ Parity check failed for {mismatches}/{len(cases)} companies")
+        sys.exit(1)
+    logger.info(f"✓ Parity check passed: {len(cases)}/{len(cases)} identical DataFrames")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ sys.path.insert(0, os.path.dirname(__file__))
 from financial_scraper_v2 import (
     IsYatirimFinancialAPI,
     FinancialDataProcessor,
+    ResponseCache,
     load_financial_group_mapping
 )
 
@@ -61,8 +62,14 @@ def main():
     
     logger.info(f"Found {len(companies)} test companies\n")
     
-    # Initialize API and processor
-    api_client = IsYatirimFinancialAPI(exchange="TRY", financial_group_mapping=financial_group_mapping)
+    # Initialize API and processor (ISYATIRIM_CACHE_PATH enables the response cache)
+    cache_path = os.getenv("ISYATIRIM_CACHE_PATH")
+    cache = ResponseCache(cache_path) if cache_path else None
+    api_client = IsYatirimFinancialAPI(
+        exchange="TRY",
+        financial_group_mapping=financial_group_mapping,
+        cache=cache
+    )
     processor = FinancialDataProcessor(DATABASE_URL)
     
     success_count = 0
@@ -105,6 +112,8 @@ def main():
     logger.info(f"Successful: {success_count}/{len(companies)}")
     logger.info(f"Failed: {len(failed_companies)}")
     logger.info(f"Duration: {duration/60:.1f} minutes")
+    if cache is not None:
+        logger.info(f"Response cache: {cache.hits} hits, {cache.misses} misses")
     
     if failed_companies:
         logger.warning("\nFailed Companies:")
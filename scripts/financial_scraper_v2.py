@@ -16,20 +16,50 @@ Date: October 2025
 
 from __future__ import annotations
 
+import io
 import os
+import sys
+import asyncio
+import json
+import sqlite3
 import time
 import uuid
-import random
 import logging
+import argparse
+import threading
+import queue
+import cProfile
+import pstats
+import tracemalloc
+from contextlib import contextmanager
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from urllib.parse import urlsplit
 from typing import Optional, List, Tuple
 from dataclasses import dataclass
 
 import requests
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
 
+try:
+    import aiohttp  # Optional: only AsyncIsYatirimFinancialAPI needs it
+except ImportError:
+    aiohttp = None
+
+try:
+    import prometheus_client  # Optional: only needed with --metrics-port / --metrics-textfile
+except ImportError:
+    prometheus_client = None
+
+try:
+    from request_policy import RateLimiter, RetryPolicy
+except ImportError:  # imported as scripts.financial_scraper_v2
+    from scripts.request_policy import RateLimiter, RetryPolicy
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -50,6 +80,543 @@ class FinancialGroup:
     applicable_to: List[str]
 
 
+class ScraperMetrics:
+    """
+    Opt-in Prometheus metrics for the scraper.
+    
+    Every hook is a cheap no-op until enable() is called, so the rest of
+    the code can report unconditionally. Metrics live in a private
+    registry and are exposed either on an HTTP port (long-running runs,
+    scraped by Prometheus) or written to a node_exporter textfile-collector
+    file (cron/PM2 runs that exit before they could be scraped).
+    """
+    
+    LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 15.0)
+    UPSERT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+    TEXTFILE_INTERVAL = 15.0  # seconds between textfile rewrites
+    
+    def __init__(self):
+        self.enabled = False
+        self.registry = None
+        self._textfile: Optional[str] = None
+        self._stop = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+    
+    def enable(self, port: Optional[int] = None, textfile: Optional[str] = None):
+        """
+        Create the metrics and start exposing them.
+        
+        Args:
+            port: Serve /metrics on this local port
+            textfile: Rewrite this .prom file periodically and at close()
+        """
+        if prometheus_client is None:
+            raise ImportError("Metrics require prometheus_client (pip install prometheus-client)")
+        
+        from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+        registry = self.registry = CollectorRegistry()
+        namespace = "financial_scraper"
+        
+        self.http_requests = Counter(
+            "http_requests", "MaliTablo requests by HTTP status ('error' = no response)",
+            ["status"], namespace=namespace, registry=registry
+        )
+        self.retries = Counter(
+            "retries", "Chunk request retries by the failed attempt's status",
+            ["status"], namespace=namespace, registry=registry
+        )
+        self.chunk_latency = Histogram(
+            "chunk_request_seconds", "MaliTablo request duration",
+            namespace=namespace, registry=registry, buckets=self.LATENCY_BUCKETS
+        )
+        self.rows_transformed = Counter(
+            "rows_transformed", "Long-format rows produced by transform_to_long_format",
+            namespace=namespace, registry=registry
+        )
+        self.rows_upserted = Counter(
+            "rows_upserted", "Rows sent to the database by result",
+            ["result"], namespace=namespace, registry=registry
+        )
+        self.upsert_latency = Histogram(
+            "upsert_seconds", "Duration of one upsert call (one batch or company)",
+            namespace=namespace, registry=registry, buckets=self.UPSERT_BUCKETS
+        )
+        self.companies = Counter(
+            "companies", "Companies finished by outcome",
+            ["outcome"], namespace=namespace, registry=registry
+        )
+        self.run_finished = Gauge(
+            "last_run_finished_timestamp_seconds", "Unix time the last run finished",
+            namespace=namespace, registry=registry
+        )
+        self.enabled = True
+        
+        if port:
+            prometheus_client.start_http_server(port, registry=registry)
+            logger.info(f"📈 Metrics: http://localhost:{port}/metrics")
+        if textfile:
+            self._textfile = textfile
+            directory = os.path.dirname(textfile)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._writer = threading.Thread(target=self._write_loop, name="metrics-textfile", daemon=True)
+            self._writer.start()
+            logger.info(f"📈 Metrics: textfile {textfile}")
+    
+    def observe_request(self, status_code: Optional[int], latency: float):
+        if self.enabled:
+            self.http_requests.labels(str(status_code) if status_code is not None else "error").inc()
+            self.chunk_latency.observe(latency)
+    
+    def count_retry(self, status_code: Optional[int]):
+        if self.enabled:
+            self.retries.labels(str(status_code) if status_code is not None else "error").inc()
+    
+    def count_rows_transformed(self, rows: int):
+        if self.enabled:
+            self.rows_transformed.inc(rows)
+    
+    def observe_upsert(self, rows_written: int, rows_skipped: int, seconds: float):
+        if self.enabled:
+            self.rows_upserted.labels("written").inc(rows_written)
+            self.rows_upserted.labels("unchanged").inc(rows_skipped)
+            self.upsert_latency.observe(seconds)
+    
+    def count_company(self, failed: bool):
+        if self.enabled:
+            self.companies.labels("failed" if failed else "done").inc()
+    
+    def close(self):
+        """Stamp the run as finished and flush the textfile one last time"""
+        if not self.enabled:
+            return
+        self.run_finished.set_to_current_time()
+        self._stop.set()
+        if self._writer is not None:
+            self._writer.join()
+        if self._textfile:
+            self._write_textfile()
+    
+    def _write_loop(self):
+        while not self._stop.wait(self.TEXTFILE_INTERVAL):
+            self._write_textfile()
+    
+    def _write_textfile(self):
+        try:
+            # Writes a temp file and renames it, so the collector never reads a partial file
+            prometheus_client.write_to_textfile(self._textfile, self.registry)
+        except OSError as e:
+            logger.warning(f"Could not write metrics textfile {self._textfile}: {e}")
+
+
+# Process-wide metrics (disabled unless main() enables them)
+METRICS = ScraperMetrics()
+
+
+class StageProfiler:
+    """
+    Per-stage timing spans aggregated into a run profile.
+    
+    Stages are timed with perf_counter wherever they run (worker threads,
+    the writer thread, the event loop), so per-stage totals are busy time
+    and can add up to more than the wall time. Spans that produce a
+    DataFrame also record its size, to show where memory goes.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._durations: dict[str, List[float]] = {}
+        self._bytes: dict[str, int] = {}
+        self.started = time.perf_counter()
+    
+    @contextmanager
+    def span(self, stage: str):
+        """Time the enclosed block as one occurrence of ``stage``"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._durations.setdefault(stage, []).append(elapsed)
+    
+    def add_frame(self, stage: str, df: Optional[pd.DataFrame]):
+        """Attribute a produced DataFrame's (shallow) memory to ``stage``"""
+        if df is None:
+            return
+        nbytes = int(df.memory_usage(index=True).sum())
+        with self._lock:
+            self._bytes[stage] = self._bytes.get(stage, 0) + nbytes
+    
+    def report(self) -> dict:
+        """Aggregated profile: wall time, peak RSS and per-stage statistics"""
+        with self._lock:
+            durations = {stage: list(values) for stage, values in self._durations.items()}
+            produced = dict(self._bytes)
+        
+        stages = {}
+        for stage, values in durations.items():
+            samples = np.array(values) * 1000
+            stages[stage] = {
+                "count": len(values),
+                "total_s": round(float(samples.sum()) / 1000, 3),
+                "mean_ms": round(float(samples.mean()), 2),
+                "p50_ms": round(float(np.percentile(samples, 50)), 2),
+                "p95_ms": round(float(np.percentile(samples, 95)), 2),
+                "max_ms": round(float(samples.max()), 2),
+                "output_mib": round(produced.get(stage, 0) / (1024 * 1024), 1),
+            }
+        return {
+            "wall_s": round(time.perf_counter() - self.started, 3),
+            "peak_rss_mib": round(peak_rss_bytes() / (1024 * 1024), 1),
+            "stages": dict(sorted(stages.items(), key=lambda item: -item[1]["total_s"])),
+        }
+    
+    def log_table(self, report: Optional[dict] = None):
+        """Log the profile as a table, slowest stage first"""
+        report = report or self.report()
+        busy = sum(stage["total_s"] for stage in report["stages"].values()) or 1.0
+        logger.info(f"\nRun Profile (wall {report['wall_s']:.1f}s, peak RSS {report['peak_rss_mib']:.0f} MiB):")
+        logger.info(
+            f"  {'Stage':<22} {'Count':>7} {'Total(s)':>9} {'Share':>6} "
+            f"{'Mean ms':>8} {'p50 ms':>8} {'p95 ms':>8} {'Max ms':>8} {'Out MiB':>8}"
+        )
+        for name, stage in report["stages"].items():
+            logger.info(
+                f"  {name:<22} {stage['count']:>7} {stage['total_s']:>9.2f} "
+                f"{stage['total_s'] / busy:>6.1%} {stage['mean_ms']:>8.1f} {stage['p50_ms']:>8.1f} "
+                f"{stage['p95_ms']:>8.1f} {stage['max_ms']:>8.1f} {stage['output_mib']:>8.1f}"
+            )
+    
+    def write_json(self, path: str, report: Optional[dict] = None):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report or self.report(), f, indent=2)
+        logger.info(f"Run profile written to {path}")
+
+
+# Process-wide stage profile (always on: a span costs about a microsecond)
+PROFILER = StageProfiler()
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size of this process (0 where unsupported)"""
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # macOS reports bytes, Linux KiB
+
+
+@contextmanager
+def profile_company(symbol: str, output_dir: str = "logs"):
+    """
+    cProfile + tracemalloc around one company's processing.
+    
+    cProfile only sees the calling worker thread; tracemalloc is process
+    wide, so allocations of concurrently running workers are included.
+    Writes <output_dir>/profile_<symbol>.prof (open with snakeviz or pstats)
+    and logs the top functions and allocation sites.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    profiler = cProfile.Profile()
+    tracemalloc.start(10)
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        path = os.path.join(output_dir, f"profile_{symbol}.prof")
+        profiler.dump_stats(path)
+        
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(15)
+        logger.info(f"\ncProfile for {symbol} ({path}):\n{stream.getvalue()}")
+        
+        logger.info(f"tracemalloc for {symbol}: peak {peak / (1024 * 1024):.1f} MiB traced, top allocation sites:")
+        for stat in snapshot.statistics("lineno")[:10]:
+            logger.info(f"  {stat.size / 1024:>10.1f} KiB  {stat.count:>8} blocks  {stat.traceback[0]}")
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker shared by every worker talking to that host.
+    
+    - closed: requests flow; outcomes go into a sliding window
+    - open: the failure ratio of the window crossed the threshold, so all
+      workers pause for ``open_seconds`` instead of hammering a failing upstream
+    - half-open: one probe request at a time; ``probe_successes`` healthy
+      probes close the circuit, a failed probe reopens it for twice as long
+      (up to ``max_open_seconds``)
+    
+    A Retry-After from the server also pauses all workers (hold()), since it
+    applies to the host rather than to one request.
+    """
+    
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+    PROBE_POLL = 0.25  # seconds between checks while another worker probes
+    
+    _registry: dict[str, "CircuitBreaker"] = {}
+    _registry_lock = threading.Lock()
+    
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: float = 0.5,
+        window: int = 20,
+        min_requests: int = 10,
+        open_seconds: float = 30.0,
+        max_open_seconds: float = 300.0,
+        probe_successes: int = 3
+    ):
+        """
+        Args:
+            host: Host name, for log messages
+            failure_threshold: Failure ratio of the window that opens the circuit
+            window: Number of recent request outcomes considered
+            min_requests: Outcomes needed in the window before the circuit can open
+            open_seconds: First pause after the circuit opens
+            max_open_seconds: Upper bound for the pause after repeated failed probes
+            probe_successes: Healthy probes needed to close the circuit again
+        """
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.min_requests = min_requests
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.probe_successes = probe_successes
+        
+        self.state = self.CLOSED
+        self.times_opened = 0
+        self._outcomes: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+        self._current_open = open_seconds
+        self._probe_in_flight = False
+        self._probe_ok = 0
+    
+    @classmethod
+    def for_host(cls, host: str, **kwargs) -> "CircuitBreaker":
+        """Shared breaker for a host (created with kwargs on first use)"""
+        with cls._registry_lock:
+            breaker = cls._registry.get(host)
+            if breaker is None:
+                breaker = cls._registry[host] = cls(host, **kwargs)
+            return breaker
+    
+    def _admit(self) -> float:
+        """0 if the caller may send a request now, else seconds to wait before asking again"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._resume_at:
+                return self._resume_at - now
+            if self.state == self.OPEN:
+                self.state = self.HALF_OPEN
+                self._probe_ok = 0
+                logger.info(f"Circuit half-open for {self.host}: probing upstream")
+            if self.state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    return self.PROBE_POLL
+                self._probe_in_flight = True
+            return 0.0
+    
+    def wait(self):
+        """Block while the circuit is open (or another worker is probing)"""
+        while True:
+            delay = self._admit()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+    
+    async def wait_async(self):
+        """Like wait(), but yields to the event loop"""
+        while True:
+            delay = self._admit()
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+    
+    def hold(self, seconds: float):
+        """Pause every worker for ``seconds`` (server-requested Retry-After)"""
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+    
+    def release(self):
+        """
+        Give back a slot admitted by wait() without an outcome (request
+        cancelled or failed outside the upstream), so a half-open circuit
+        does not wait forever for a probe that will never be recorded.
+        """
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._probe_in_flight = False
+    
+    def record(self, success: bool):
+        """Record the outcome of a request admitted by wait()"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._probe_in_flight = False
+                if not success:
+                    self._current_open = min(self.max_open_seconds, self._current_open * 2)
+                    self._trip("probe failed")
+                    return
+                self._probe_ok += 1
+                if self._probe_ok >= self.probe_successes:
+                    self.state = self.CLOSED
+                    self._outcomes.clear()
+                    self._current_open = self.open_seconds
+                    logger.info(f"✓ Circuit closed for {self.host}: upstream recovered")
+                return
+            
+            self._outcomes.append(success)
+            if self.state == self.CLOSED and len(self._outcomes) >= self.min_requests:
+                failures = self._outcomes.count(False)
+                if failures / len(self._outcomes) >= self.failure_threshold:
+                    self._trip(f"{failures}/{len(self._outcomes)} recent requests failed")
+    
+    def _trip(self, reason: str):
+        """Open the circuit (caller holds the lock)"""
+        self.state = self.OPEN
+        self.times_opened += 1
+        self._resume_at = max(self._resume_at, time.monotonic() + self._current_open)
+        logger.warning(
+            f"⚡ Circuit open for {self.host} ({reason}): "
+            f"pausing all workers for {self._current_open:.0f}s"
+        )
+
+
+class ResponseCache:
+    """
+    Persistent SQLite cache for MaliTablo chunk responses.
+    
+    Entries are keyed by (companyCode, exchange, financialGroup, quarters).
+    Chunks whose quarters are all past the reporting deadline rarely change
+    and get a long TTL; chunks with recent quarters expire quickly. The file
+    is kept under ``max_bytes`` by evicting least recently used entries.
+    
+    In ``offline`` mode expired entries are still served and misses never
+    go to the network, which allows development against a recorded run.
+    """
+    
+    CLOSED_TTL = 30 * 24 * 3600  # seconds
+    OPEN_TTL = 6 * 3600  # seconds
+    REPORTING_LAG_DAYS = 120  # Quarter results are final this long after quarter end
+    
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024, offline: bool = False):
+        """
+        Args:
+            path: SQLite database file (created if missing)
+            max_bytes: Upper bound for stored response bodies
+            offline: Serve expired entries and never fall through to the network
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.hits = 0
+        self.misses = 0
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_access_idx ON responses (last_access)"
+        )
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+    
+    @staticmethod
+    def make_key(
+        symbol: str,
+        exchange: str,
+        financial_group: str,
+        quarters: List[Tuple[int, int]]
+    ) -> str:
+        """Cache key for one chunk request, e.g. 'THYAO|TRY|XI_29|2024/3,2024/6'"""
+        periods = ",".join(f"{year}/{month}" for year, month in quarters)
+        return f"{symbol}|{exchange}|{financial_group}|{periods}"
+    
+    def ttl_for(self, quarters: List[Tuple[int, int]]) -> float:
+        """Long TTL when every quarter in the chunk is closed, short otherwise"""
+        year, month = max(quarters)
+        quarter_end = datetime(year + month // 12, month % 12 + 1, 1)
+        if (datetime.now() - quarter_end).days > self.REPORTING_LAG_DAYS:
+            return self.CLOSED_TTL
+        return self.OPEN_TTL
+    
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached JSON payload, or None on a miss / expired entry"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (row[1] < now and not self.offline):
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return json.loads(row[0])
+    
+    def put(self, key: str, data: dict, quarters: List[Tuple[int, int]]):
+        """Store a JSON payload and evict old entries if the cache is over budget"""
+        body = json.dumps(data, ensure_ascii=False)
+        size = len(body.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, size, fetched_at, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, body, size, now, now + self.ttl_for(quarters), now)
+            )
+            self._total_bytes += size - (old[0] if old else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+    
+    def _evict(self):
+        """Drop least recently used entries down to 90% of max_bytes (caller holds the lock)"""
+        target = self.max_bytes * 0.9
+        while self._total_bytes > target:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_access LIMIT 100"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                break
+            for key, size in rows:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total_bytes -= size
+                if self._total_bytes <= target:
+                    break
+    
+    def close(self):
+        """Close the SQLite connection"""
+        with self._lock:
+            self._conn.close()
+
+
 def load_financial_group_mapping() -> dict[str, str]:
     """
     Load ticker -> financial_group mapping from database.
@@ -90,6 +657,48 @@ def load_financial_group_mapping() -> dict[str, str]:
         return {}
 
 
+def load_latest_quarters(engine) -> dict[int, Tuple[int, int]]:
+    """
+    Load the most recent stored quarter per company from financial_statements.
+    
+    Args:
+        engine: SQLAlchemy engine
+    
+    Returns:
+        Dictionary mapping companyId to (year, quarter) with quarter in 1-4.
+        Example: {12: (2025, 2), 13: (2024, 4), ...}
+    """
+    from sqlalchemy import text
+    
+    query = """
+        SELECT DISTINCT ON ("companyId") "companyId", year, quarter
+        FROM financial_statements
+        ORDER BY "companyId", year DESC, quarter DESC
+    """
+    
+    with engine.connect() as conn:
+        latest = {row[0]: (row[1], row[2]) for row in conn.execute(text(query))}
+    
+    logger.info(f"✅ Loaded latest stored quarter for {len(latest)} companies")
+    return latest
+
+
+def incremental_start(latest: Tuple[int, int], lookback_quarters: int) -> Tuple[int, int]:
+    """
+    First (year, quarter_month) to request for a company in incremental mode.
+    
+    Args:
+        latest: Latest stored (year, quarter) with quarter in 1-4
+        lookback_quarters: Stored quarters to refresh, counting the latest one
+    
+    Returns:
+        (year, quarter_month) tuple in API format (month 3/6/9/12)
+    """
+    year, quarter = latest
+    index = year * 4 + (quarter - 1) - max(lookback_quarters - 1, 0)
+    return index // 4, (index % 4 + 1) * 3
+
+
 class IsYatirimFinancialAPI:
     """
     Professional API client for Is Yatirim financial statements.
@@ -101,7 +710,9 @@ class IsYatirimFinancialAPI:
     - UFRS_K: Alternative IFRS reporting
     """
     
-    BASE_URL = "https://www.isyatirim.com.tr/_layouts/15/IsYatirim.Website/Common/Data.aspx/MaliTablo"
+    HOST = "https://www.isyatirim.com.tr"
+    MALITABLO_PATH = "/_layouts/15/IsYatirim.Website/Common/Data.aspx/MaliTablo"
+    BASE_URL = HOST + MALITABLO_PATH
     
     FINANCIAL_GROUPS = {
         "XI_29": FinancialGroup(
@@ -143,18 +754,42 @@ class IsYatirimFinancialAPI:
     }
     
     QUARTERS = [3, 6, 9, 12]  # Q1, Q2, Q3, Q4
-    MAX_RETRIES = 3
-    RETRY_DELAY = 2  # seconds
+    MAX_RETRIES = 3  # Attempts per chunk for the default RetryPolicy
+    RETRY_DELAY = 2  # seconds; backoff base for the default RetryPolicy
     REQUEST_TIMEOUT = 15  # seconds
-    RATE_LIMIT_DELAY = (0.5, 1.5)  # Random delay between requests (min, max) in seconds
+    DEFAULT_MAX_RPS = 1 / 1.5  # Same average pace as the former 0.5-1.5s jitter + 0.5s chunk pause
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+        "Accept": "*/*",
+        "Accept-Language": "tr,en;q=0.9",
+        "X-Requested-With": "XMLHttpRequest",
+    }
     
-    def __init__(self, exchange: str = "TRY", financial_group_mapping: Optional[dict[str, str]] = None):
+    def __init__(
+        self,
+        exchange: str = "TRY",
+        financial_group_mapping: Optional[dict[str, str]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        host: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
         """
         Initialize API client.
         
         Args:
             exchange: Currency code (TRY or USD)
             financial_group_mapping: Optional ticker -> financial_group mapping from DB
+            rate_limiter: Limiter shared by every thread using this client
+                (default: private limiter at DEFAULT_MAX_RPS)
+            cache: Optional on-disk response cache for MaliTablo chunks
+            host: Optional scheme://host[:port] replacing www.isyatirim.com.tr
+                (e.g. the local stub server)
+            retry_policy: Backoff policy for failed chunk requests
+                (default: MAX_RETRIES attempts, RETRY_DELAY base)
+            circuit_breaker: Breaker pausing all workers when the host fails
+                (default: the process-wide breaker of the host)
         """
         self.exchange = exchange.upper()
         if self.exchange not in ("TRY", "USD"):
@@ -177,13 +812,27 @@ class IsYatirimFinancialAPI:
                     )
                     logger.debug(f"Dynamically added financial group: {group_code}")
         
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-            "Accept": "*/*",
-            "Accept-Language": "tr,en;q=0.9",
-            "X-Requested-With": "XMLHttpRequest",
-        })
+        self.rate_limiter = rate_limiter or RateLimiter(max_rps=self.DEFAULT_MAX_RPS)
+        self.cache = cache
+        if host:
+            self.BASE_URL = host.rstrip("/") + self.MALITABLO_PATH
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_attempts=self.MAX_RETRIES, base_delay=self.RETRY_DELAY
+        )
+        self.circuit_breaker = circuit_breaker or CircuitBreaker.for_host(urlsplit(self.BASE_URL).netloc)
+        
+        # requests.Session is not thread-safe: each worker thread gets its own
+        self._local = threading.local()
+    
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session bound to the calling thread"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.HEADERS)
+            self._local.session = session
+        return session
     
     def get_financial_group_for_ticker(self, ticker: str) -> str:
         """
@@ -212,7 +861,8 @@ class IsYatirimFinancialAPI:
         symbol: str,
         financial_group: str,
         start_year: int,
-        end_year: int
+        end_year: int,
+        since: Optional[Tuple[int, int]] = None
     ) -> pd.DataFrame:
         """
         Fetch financial statements for a company.
@@ -222,6 +872,8 @@ class IsYatirimFinancialAPI:
             financial_group: Financial group code (XI_29, XI_29K, UFRS, UFRS_K, or any from DB)
             start_year: Start year (inclusive)
             end_year: End year (inclusive)
+            since: Optional (year, quarter_month) lower bound for incremental runs.
+                Only quarters from this one up to the last closed quarter are requested.
         
         Returns:
             DataFrame with financial statement data
@@ -230,42 +882,15 @@ class IsYatirimFinancialAPI:
             ValueError: If parameters are invalid
             requests.RequestException: If API call fails
         """
-        # Validate financial group - accept known groups or add dynamically
-        if financial_group not in self.FINANCIAL_GROUPS:
-            # If it's from DB mapping but not in our list, add it dynamically
-            logger.warning(
-                f"Unknown financial_group '{financial_group}' for {symbol}. "
-                f"Adding dynamically and attempting to use it."
-            )
-            self.FINANCIAL_GROUPS[financial_group] = FinancialGroup(
-                code=financial_group,
-                name=f"Dynamic: {financial_group}",
-                description=f"Dynamically discovered during runtime",
-                applicable_to=[symbol]
-            )
-        
-        logger.info(
-            f"Fetching {financial_group} data for {symbol} "
-            f"({start_year}-{end_year}, {self.exchange})"
-        )
-        
-        # Generate all quarters
-        all_quarters = self._generate_quarters(start_year, end_year)
-        
         # Fetch data in chunks (API accepts max 4 quarters per request)
         all_dataframes = []
         
-        for chunk_start in range(0, len(all_quarters), 4):
-            chunk_quarters = all_quarters[chunk_start:chunk_start + 4]
-            
+        for chunk_quarters in self._plan_chunks(symbol, financial_group, start_year, end_year, since):
             try:
                 df_chunk = self._fetch_chunk(symbol, financial_group, chunk_quarters)
                 if df_chunk is not None and not df_chunk.empty:
                     all_dataframes.append(df_chunk)
                 
-                # Rate limiting
-                time.sleep(0.5)
-                
             except Exception as e:
                 logger.warning(
                     f"Failed to fetch chunk for {symbol} "
@@ -276,11 +901,67 @@ class IsYatirimFinancialAPI:
         if not all_dataframes:
             raise ValueError(f"No financial data found for {symbol} ({financial_group})")
         
-        df_final = self._merge_chunks(all_dataframes)
+        with PROFILER.span("merge_chunks"):
+            df_final = self._merge_chunks(all_dataframes)
+        PROFILER.add_frame("merge_chunks", df_final)
         
         logger.info(f"Successfully fetched {len(df_final)} items for {symbol}")
         return df_final
     
+    def _plan_chunks(
+        self,
+        symbol: str,
+        financial_group: str,
+        start_year: int,
+        end_year: int,
+        since: Optional[Tuple[int, int]] = None
+    ) -> List[List[Tuple[int, int]]]:
+        """
+        Validate a fetch_financials call and split its quarters into request chunks.
+        
+        Shared by the sync and async clients so both request exactly the same chunks.
+        
+        Returns:
+            Lists of up to 4 (year, quarter_month) tuples, oldest first
+        """
+        # Validate financial group - accept known groups or add dynamically
+        if financial_group not in self.FINANCIAL_GROUPS:
+            # If it's from DB mapping but not in our list, add it dynamically
+            logger.warning(
+                f"Unknown financial_group '{financial_group}' for {symbol}. "
+                f"Adding dynamically and attempting to use it."
+            )
+            self.FINANCIAL_GROUPS[financial_group] = FinancialGroup(
+                code=financial_group,
+                name=f"Dynamic: {financial_group}",
+                description=f"Dynamically discovered during runtime",
+                applicable_to=[symbol]
+            )
+        
+        # Generate all quarters
+        all_quarters = self._generate_quarters(start_year, end_year)
+        
+        if since is not None:
+            # Incremental: skip stored history and quarters that have not ended yet
+            today = datetime.now()
+            last_closed_month = (today.month - 1) // 3 * 3
+            last_closed = (today.year, last_closed_month) if last_closed_month else (today.year - 1, 12)
+            all_quarters = [q for q in all_quarters if since <= q <= last_closed]
+            if not all_quarters:
+                raise ValueError(f"No quarters to fetch for {symbol} since {since[0]}/{since[1]}")
+            logger.info(
+                f"Fetching {financial_group} data for {symbol} "
+                f"({all_quarters[0][0]}/{all_quarters[0][1]}-{all_quarters[-1][0]}/{all_quarters[-1][1]}, "
+                f"{self.exchange}, incremental)"
+            )
+        else:
+            logger.info(
+                f"Fetching {financial_group} data for {symbol} "
+                f"({start_year}-{end_year}, {self.exchange})"
+            )
+        
+        return [all_quarters[i:i + 4] for i in range(0, len(all_quarters), 4)]
+    
     def _generate_quarters(self, start_year: int, end_year: int) -> List[Tuple[int, int]]:
         """Generate list of (year, quarter_month) tuples"""
         quarters = []
@@ -289,6 +970,25 @@ class IsYatirimFinancialAPI:
                 quarters.append((year, month))
         return quarters
     
+    def _build_params(
+        self,
+        symbol: str,
+        financial_group: str,
+        quarters: List[Tuple[int, int]]
+    ) -> dict[str, str]:
+        """MaliTablo query parameters for one chunk (without the cache buster)"""
+        params = {
+            "companyCode": symbol,
+            "exchange": self.exchange,
+            "financialGroup": financial_group,
+        }
+        
+        # Add quarter parameters (year1-4, period1-4)
+        for idx, (year, month) in enumerate(quarters, start=1):
+            params[f"year{idx}"] = str(year)
+            params[f"period{idx}"] = str(month)
+        return params
+    
     def _fetch_chunk(
         self,
         symbol: str,
@@ -306,106 +1006,219 @@ class IsYatirimFinancialAPI:
         Returns:
             DataFrame with financial data or None if failed
         """
-        # Build request parameters
-        params = {
-            "companyCode": symbol,
-            "exchange": self.exchange,
-            "financialGroup": financial_group,
-        }
+        params = self._build_params(symbol, financial_group, quarters)
         
-        # Add quarter parameters (year1-4, period1-4)
-        for idx, (year, month) in enumerate(quarters, start=1):
-            params[f"year{idx}"] = str(year)
-            params[f"period{idx}"] = str(month)
+        # Serve from the on-disk response cache when possible
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ResponseCache.make_key(symbol, self.exchange, financial_group, quarters)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return self._parse_chunk(cached, symbol, quarters)
+            if self.cache.offline:
+                logger.debug(f"Offline cache miss for {cache_key}")
+                return None
         
         # Add cache buster
         params["_"] = str(int(time.time() * 1000))
         
         # Make request with retry logic
-        for attempt in range(self.MAX_RETRIES):
+        for attempt in range(self.retry_policy.max_attempts):
+            # Circuit breaker first (pauses everyone during an incident), then the rate budget
+            with PROFILER.span("http.wait"):
+                self.circuit_breaker.wait()
+                self.rate_limiter.acquire()
+            
+            request_started = time.monotonic()
+            response = None
+            recorded = False
             try:
-                # Rate limiting: random delay between requests
-                if attempt == 0:  # Only on first attempt, not on retries
-                    delay = random.uniform(*self.RATE_LIMIT_DELAY)
-                    time.sleep(delay)
-                
-                response = self.session.get(
-                    self.BASE_URL,
-                    params=params,
-                    timeout=self.REQUEST_TIMEOUT
-                )
-                response.raise_for_status()
-                
-                # Parse JSON response
-                data = response.json()
-                
-                if not data.get("ok"):
-                    error_msg = data.get("errorDescription", "Unknown error")
-                    logger.warning(f"API returned error: {error_msg}")
-                    return None
+                try:
+                    with PROFILER.span("http.request"):
+                        response = self.session.get(
+                            self.BASE_URL,
+                            params=params,
+                            timeout=self.REQUEST_TIMEOUT
+                        )
+                    response.raise_for_status()
                 
-                if not data.get("value"):
-                    logger.debug(f"No data in response for {symbol}")
-                    return None
+                    # Parse JSON response
+                    with PROFILER.span("http.json_decode"):
+                        data = response.json()
                 
-                # Convert to DataFrame
-                df = pd.DataFrame(data["value"])
-                
-                if df.empty:
-                    return None
-                
-                # Rename columns to standardized format
-                column_mapping = {
-                    "itemCode": "itemCode",
-                    "itemDescTr": "itemDescTr",
-                    "itemDescEng": "itemDescEng",
-                }
-                
-                # Add quarter columns (value1-4 → YYYY/MM format)
-                for idx, (year, month) in enumerate(quarters, start=1):
-                    column_mapping[f"value{idx}"] = f"{year}/{month}"
-                
-                # Rename only existing columns
-                df = df.rename(columns={
-                    k: v for k, v in column_mapping.items() if k in df.columns
-                })
-                
-                return df
-                
-            except requests.exceptions.RequestException as e:
-                if attempt < self.MAX_RETRIES - 1:
+                except requests.exceptions.RequestException as e:
+                    status_code = response.status_code if response is not None else None
+                    retry_after = RetryPolicy.parse_retry_after(
+                        response.headers.get("Retry-After") if response is not None else None
+                    )
+                    self._record_outcome(status_code, time.monotonic() - request_started, retry_after)
+                    recorded = True
+                    delay = self.retry_policy.next_delay(attempt, status_code, retry_after)
+                    if delay is None:
+                        logger.error(f"Giving up on {symbol} after {attempt + 1} attempt(s): {e}")
+                        raise
                     logger.warning(
                         f"Attempt {attempt + 1} failed for {symbol}, "
-                        f"retrying in {self.RETRY_DELAY}s: {e}"
+                        f"retrying in {delay:.1f}s: {e}"
                     )
-                    time.sleep(self.RETRY_DELAY)
-                else:
-                    logger.error(f"All retry attempts failed for {symbol}: {e}")
-                    raise
+                    METRICS.count_retry(status_code)
+                    time.sleep(delay)
+                    continue
+                
+                self._record_outcome(response.status_code, time.monotonic() - request_started)
+                recorded = True
+            finally:
+                if not recorded:
+                    # Interrupted or failed outside the upstream: free the half-open probe slot
+                    self.circuit_breaker.release()
+            
+            if self.cache is not None and data.get("ok"):
+                self.cache.put(cache_key, data, quarters)
+            
+            return self._parse_chunk(data, symbol, quarters)
         
         return None
     
-    def _merge_chunks(self, dataframes: List[pd.DataFrame]) -> pd.DataFrame:
+    def _record_outcome(
+        self,
+        status_code: Optional[int],
+        latency: float,
+        retry_after: Optional[float] = None
+    ):
+        """Feed one request's outcome to the rate limiter and the circuit breaker"""
+        self.rate_limiter.record_response(status_code, latency)
+        METRICS.observe_request(status_code, latency)
+        self.circuit_breaker.record(
+            status_code is not None and status_code != 429 and status_code < 500
+        )
+        if retry_after is not None and status_code in (429, 503):
+            self.circuit_breaker.hold(min(retry_after, self.retry_policy.max_retry_after))
+    
+    def _parse_chunk(
+        self,
+        data: dict,
+        symbol: str,
+        quarters: List[Tuple[int, int]]
+    ) -> Optional[pd.DataFrame]:
         """
-        Merge multiple chunk DataFrames into one.
+        Convert a MaliTablo JSON payload into a chunk DataFrame.
         
         Args:
-            dataframes: List of DataFrames to merge
+            data: Decoded JSON response ({"ok": ..., "value": [...]})
+            symbol: Stock symbol (for logging)
+            quarters: List of (year, quarter_month) tuples requested
         
         Returns:
-            Merged DataFrame
+            DataFrame with YYYY/MM quarter columns or None if no data
         """
-        if len(dataframes) == 1:
+        if not data.get("ok"):
+            error_msg = data.get("errorDescription", "Unknown error")
+            logger.warning(f"API returned error: {error_msg}")
+            return None
+        
+        if not data.get("value"):
+            logger.debug(f"No data in response for {symbol}")
+            return None
+        
+        # Convert to DataFrame
+        with PROFILER.span("parse.dataframe"):
+            df = pd.DataFrame(data["value"])
+        
+        if df.empty:
+            return None
+        
+        # Rename columns to standardized format
+        column_mapping = {
+            "itemCode": "itemCode",
+            "itemDescTr": "itemDescTr",
+            "itemDescEng": "itemDescEng",
+        }
+        
+        # Add quarter columns (value1-4 → YYYY/MM format)
+        for idx, (year, month) in enumerate(quarters, start=1):
+            column_mapping[f"value{idx}"] = f"{year}/{month}"
+        
+        # Rename only existing columns
+        df = df.rename(columns={
+            k: v for k, v in column_mapping.items() if k in df.columns
+        })
+        
+        PROFILER.add_frame("parse.dataframe", df)
+        return df
+    
+    MERGE_KEYS = ["itemCode", "itemDescTr", "itemDescEng"]
+    
+    def _merge_chunks(self, dataframes: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Merge multiple chunk DataFrames into one.
+        
+        All item keys are numbered in one groupby over the stacked key
+        columns, then every chunk's quarter columns are scattered into
+        arrays aligned on that numbering. This replaces folding the chunks
+        with repeated outer merges, whose cost grows with every chunk.
+        Items keep the order in which the API first returned them.
+        
+        Args:
+            dataframes: List of DataFrames to merge
+        
+        Returns:
+            Merged DataFrame
+        """
+        if len(dataframes) == 1:
             return dataframes[0]
         
-        # Merge on item columns
+        value_cols = [
+            [col for col in df.columns if col not in self.MERGE_KEYS] for df in dataframes
+        ]
+        all_value_cols = [col for cols in value_cols for col in cols]
+        if len(set(all_value_cols)) != len(all_value_cols):
+            # Same non-key column in several chunks: keep the merge's suffixing
+            return self._merge_chunks_pairwise(dataframes)
+        
+        keys = pd.concat([df[self.MERGE_KEYS] for df in dataframes], ignore_index=True)
+        ids = keys.groupby(self.MERGE_KEYS, dropna=False, sort=False).ngroup().to_numpy()
+        
+        bounds = [0]
+        for df in dataframes:
+            bounds.append(bounds[-1] + len(df))
+        chunk_ids = [ids[start:end] for start, end in zip(bounds, bounds[1:])]
+        if any(len(pd.unique(item_ids)) != len(item_ids) for item_ids in chunk_ids):
+            # Repeated items in a chunk: keep the outer merge's many-to-many semantics
+            return self._merge_chunks_pairwise(dataframes)
+        
+        first_seen = ~pd.Index(ids).duplicated()
+        df_keys = keys[first_seen].reset_index(drop=True)
+        item_count = len(df_keys)
+        
+        columns = {}
+        for df, cols, item_ids in zip(dataframes, value_cols, chunk_ids):
+            for col in cols:
+                values = df[col].to_numpy()
+                # Items missing from a chunk become NaN, as with an outer merge
+                dtype = values.dtype if values.dtype.kind == "f" else (
+                    "float64" if values.dtype.kind in "iu" else object
+                )
+                aligned = np.full(item_count, np.nan, dtype=dtype)
+                aligned[item_ids] = values
+                columns[col] = aligned
+        
+        df_merged = pd.concat([df_keys, pd.DataFrame(columns)], axis=1)
+        
+        # Remove completely null columns
+        null_cols = df_merged.columns[df_merged.isnull().all()]
+        df_merged = df_merged.drop(columns=null_cols)
+        
+        return df_merged
+    
+    def _merge_chunks_pairwise(self, dataframes: List[pd.DataFrame]) -> pd.DataFrame:
+        """Fold chunks with successive outer merges on the item columns"""
         df_merged = dataframes[0]
         
         for df_chunk in dataframes[1:]:
             df_merged = pd.merge(
                 df_merged,
                 df_chunk,
-                on=["itemCode", "itemDescTr", "itemDescEng"],
+                on=self.MERGE_KEYS,
                 how="outer"
             )
         
@@ -416,18 +1229,268 @@ class IsYatirimFinancialAPI:
         return df_merged
 
 
+class AsyncIsYatirimFinancialAPI(IsYatirimFinancialAPI):
+    """
+    asyncio variant of IsYatirimFinancialAPI built on aiohttp.
+    
+    fetch_financials takes the same arguments and returns the same
+    DataFrame as the sync client, but is a coroutine: the chunks of one
+    company are requested concurrently, and any number of companies can be
+    awaited together from a single thread. All requests share one
+    keep-alive connection pool; the rate limiter and response cache work
+    exactly as in the sync client.
+    
+    Usage:
+        async with AsyncIsYatirimFinancialAPI(rate_limiter=limiter) as api:
+            frames = await asyncio.gather(*(
+                api.fetch_financials(symbol, "XI_29", 2020, 2025) for symbol in symbols
+            ))
+    """
+    
+    DEFAULT_MAX_CONNECTIONS = 32
+    DEFAULT_KEEPALIVE_TIMEOUT = 30.0  # seconds an idle connection stays open
+    
+    def __init__(
+        self,
+        exchange: str = "TRY",
+        financial_group_mapping: Optional[dict[str, str]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        host: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
+        """
+        Initialize API client.
+        
+        Args:
+            exchange: Currency code (TRY or USD)
+            financial_group_mapping: Optional ticker -> financial_group mapping from DB
+            rate_limiter: Limiter shared with other clients (default: private limiter at DEFAULT_MAX_RPS)
+            cache: Optional on-disk response cache for MaliTablo chunks
+            max_connections: Connection pool size (upper bound on requests in flight)
+            keepalive_timeout: Seconds an idle pooled connection is kept for reuse
+            host: Optional scheme://host[:port] replacing www.isyatirim.com.tr
+            retry_policy: Backoff policy for failed chunk requests
+            circuit_breaker: Breaker pausing all requests when the host fails
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncIsYatirimFinancialAPI requires aiohttp (pip install aiohttp)")
+        super().__init__(
+            exchange=exchange,
+            financial_group_mapping=financial_group_mapping,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            host=host,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker
+        )
+        self.max_connections = max_connections
+        self.keepalive_timeout = keepalive_timeout
+        self._http: Optional["aiohttp.ClientSession"] = None
+    
+    async def __aenter__(self) -> "AsyncIsYatirimFinancialAPI":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    def _client(self) -> "aiohttp.ClientSession":
+        """Pooled HTTP session, created on first use inside the running event loop"""
+        if self._http is None or self._http.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300,
+            )
+            self._http = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT),
+            )
+        return self._http
+    
+    async def close(self):
+        """Close the connection pool"""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+    
+    async def fetch_financials(
+        self,
+        symbol: str,
+        financial_group: str,
+        start_year: int,
+        end_year: int,
+        since: Optional[Tuple[int, int]] = None
+    ) -> pd.DataFrame:
+        """
+        Fetch financial statements for a company (see IsYatirimFinancialAPI.fetch_financials).
+        
+        Returns:
+            DataFrame with financial statement data, identical to the sync client's
+            
+        Raises:
+            ValueError: If parameters are invalid or no chunk returned data
+        """
+        chunks = self._plan_chunks(symbol, financial_group, start_year, end_year, since)
+        results = await asyncio.gather(
+            *(self._fetch_chunk(symbol, financial_group, chunk_quarters) for chunk_quarters in chunks),
+            return_exceptions=True
+        )
+        
+        # gather keeps request order, so chunks merge exactly as in the sync client
+        all_dataframes = []
+        for chunk_quarters, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"Failed to fetch chunk for {symbol} "
+                    f"({chunk_quarters[0] if chunk_quarters else 'unknown'}): {result}"
+                )
+            elif result is not None and not result.empty:
+                all_dataframes.append(result)
+        
+        if not all_dataframes:
+            raise ValueError(f"No financial data found for {symbol} ({financial_group})")
+        
+        with PROFILER.span("merge_chunks"):
+            df_final = self._merge_chunks(all_dataframes)
+        PROFILER.add_frame("merge_chunks", df_final)
+        
+        logger.info(f"Successfully fetched {len(df_final)} items for {symbol}")
+        return df_final
+    
+    async def _fetch_chunk(
+        self,
+        symbol: str,
+        financial_group: str,
+        quarters: List[Tuple[int, int]]
+    ) -> Optional[pd.DataFrame]:
+        """
+        Fetch single chunk (up to 4 quarters) from API.
+        
+        Args:
+            symbol: Stock symbol
+            financial_group: Financial group code
+            quarters: List of (year, quarter_month) tuples
+        
+        Returns:
+            DataFrame with financial data or None if failed
+        """
+        params = self._build_params(symbol, financial_group, quarters)
+        
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ResponseCache.make_key(symbol, self.exchange, financial_group, quarters)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return self._parse_chunk(cached, symbol, quarters)
+            if self.cache.offline:
+                logger.debug(f"Offline cache miss for {cache_key}")
+                return None
+        
+        params["_"] = str(int(time.time() * 1000))
+        
+        # Same failures the sync client retries (requests counts bad JSON, including
+        # undecodable bytes, as a RequestException)
+        retryable = (aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError, ValueError)
+        
+        for attempt in range(self.retry_policy.max_attempts):
+            with PROFILER.span("http.wait"):
+                await self.circuit_breaker.wait_async()
+                await self.rate_limiter.acquire_async()
+            
+            request_started = time.monotonic()
+            status_code = None
+            retry_after_header = None
+            recorded = False
+            try:
+                try:
+                    with PROFILER.span("http.request"):
+                        async with self._client().get(self.BASE_URL, params=params) as response:
+                            status_code = response.status
+                            retry_after_header = response.headers.get("Retry-After")
+                            response.raise_for_status()
+                            body = await response.read()
+                    with PROFILER.span("http.json_decode"):
+                        data = json.loads(body)
+                
+                except retryable as e:
+                    retry_after = RetryPolicy.parse_retry_after(retry_after_header)
+                    self._record_outcome(status_code, time.monotonic() - request_started, retry_after)
+                    recorded = True
+                    delay = self.retry_policy.next_delay(attempt, status_code, retry_after)
+                    if delay is None:
+                        logger.error(f"Giving up on {symbol} after {attempt + 1} attempt(s): {e!r}")
+                        raise
+                    logger.warning(
+                        f"Attempt {attempt + 1} failed for {symbol}, "
+                        f"retrying in {delay:.1f}s: {e!r}"
+                    )
+                    METRICS.count_retry(status_code)
+                    await asyncio.sleep(delay)
+                    continue
+                
+                self._record_outcome(status_code, time.monotonic() - request_started)
+                recorded = True
+            finally:
+                if not recorded:
+                    # Cancelled or failed outside the upstream: free the half-open probe slot
+                    self.circuit_breaker.release()
+            
+            if self.cache is not None and data.get("ok"):
+                self.cache.put(cache_key, data, quarters)
+            
+            return self._parse_chunk(data, symbol, quarters)
+        
+        return None
+
+
 class FinancialDataProcessor:
     """Process and store financial statement data in database"""
     
-    def __init__(self, database_url: str):
+    # Item code first character -> StatementType (anything else: INCOME_STATEMENT)
+    STATEMENT_TYPE_BY_PREFIX = {
+        "1": "BALANCE_SHEET_ASSETS",
+        "2": "BALANCE_SHEET_LIABILITIES",
+        "3": "INCOME_STATEMENT",
+        "4": "CASH_FLOW",
+        "A": "BALANCE_SHEET_ASSETS",  # Some codes start with A
+    }
+    STATEMENT_TYPE_DTYPE = pd.CategoricalDtype([
+        "BALANCE_SHEET_ASSETS",
+        "BALANCE_SHEET_LIABILITIES",
+        "INCOME_STATEMENT",
+        "CASH_FLOW",
+    ])
+    
+    TARGET_TABLE = "financial_statements"
+    STAGING_TABLE = "financial_statements_stage"
+    STAGING_COLUMNS = [
+        "companyId", "year", "quarter", "itemCode", "itemNameTR", "itemNameEN",
+        "value", "statementType", "financialGroup", "currency",
+    ]
+    
+    def __init__(self, database_url: str, pool_size: int = 5, use_copy: bool = True):
         """
         Initialize processor with database connection.
         
         Args:
             database_url: PostgreSQL connection string
+            pool_size: Connection pool size (at least one per concurrent worker)
+            use_copy: Stage rows with COPY FROM STDIN (False: legacy to_sql path)
         """
         db_url = database_url.replace("postgresql://", "postgresql+psycopg2://").split("?")[0]
-        self.engine = create_engine(db_url)
+        self.engine = create_engine(db_url, pool_size=pool_size)
+        self.use_copy = use_copy
+        
+        # Run totals (the batch writer and workers may upsert concurrently)
+        self._stats_lock = threading.Lock()
+        self.rows_written = 0
+        self.rows_skipped = 0
         logger.info("Database connection established")
     
     def transform_to_long_format(
@@ -459,27 +1522,32 @@ class FinancialDataProcessor:
             logger.warning(f"No quarterly data found for {symbol}")
             return pd.DataFrame()
         
+        # Determine statement type from the item code's first character,
+        # once per item on the wide frame instead of per row after the melt
+        statement_types = (
+            df_wide["itemCode"].str[0]
+            .map(self.STATEMENT_TYPE_BY_PREFIX)
+            .fillna("INCOME_STATEMENT")
+            .astype(self.STATEMENT_TYPE_DTYPE)
+        )
+        
         # Melt to long format
-        df_long = df_wide.melt(
-            id_vars=["itemCode", "itemDescTr", "itemDescEng"],
+        df_long = df_wide.assign(statementType=statement_types).melt(
+            id_vars=["itemCode", "itemDescTr", "itemDescEng", "statementType"],
             value_vars=quarter_cols,
             var_name="period",
             value_name="value"
         )
         
-        # Parse period (YYYY/MM → year, quarter)
-        period_split = df_long["period"].str.split("/", expand=True)
-        df_long["year"] = period_split[0].astype(int)
-        month = period_split[1].astype(int)
-        df_long["quarter"] = (month // 3).astype(int)
+        # Parse period (YYYY/MM → year, quarter) once per quarter column
+        periods = {col: tuple(int(part) for part in col.split("/")) for col in quarter_cols}
+        df_long["year"] = df_long["period"].map({col: year for col, (year, _) in periods.items()})
+        df_long["quarter"] = df_long["period"].map({col: month // 3 for col, (_, month) in periods.items()})
         
-        # Determine statement type from item code
-        df_long["statementType"] = df_long["itemCode"].apply(self._determine_statement_type)
-        
-        # Add metadata
+        # Add metadata (constant per company: categoricals keep them to one byte per row)
         df_long["companyId"] = company_id
-        df_long["financialGroup"] = financial_group
-        df_long["currency"] = "TRY"
+        df_long["financialGroup"] = pd.Series(financial_group, index=df_long.index, dtype="category")
+        df_long["currency"] = pd.Series("TRY", index=df_long.index, dtype="category")
         
         # Remove null values
         df_long = df_long[df_long["value"].notna()]
@@ -504,78 +1572,177 @@ class FinancialDataProcessor:
             "itemDescEng": "itemNameEN",
         })
         
+        METRICS.count_rows_transformed(len(df_long))
         return df_long
     
-    @staticmethod
-    def _determine_statement_type(item_code: str) -> str:
+    @classmethod
+    def _determine_statement_type(cls, item_code: str) -> str:
         """Map item code to statement type"""
         if not item_code:
             return "INCOME_STATEMENT"
         
-        first_char = item_code[0]
-        mapping = {
-            "1": "BALANCE_SHEET_ASSETS",
-            "2": "BALANCE_SHEET_LIABILITIES",
-            "3": "INCOME_STATEMENT",
-            "4": "CASH_FLOW",
-            "A": "BALANCE_SHEET_ASSETS",  # Some codes start with A
-        }
-        
-        return mapping.get(first_char, "INCOME_STATEMENT")
+        return cls.STATEMENT_TYPE_BY_PREFIX.get(item_code[0], "INCOME_STATEMENT")
     
     def upsert_financial_data(self, df_long: pd.DataFrame) -> int:
         """
         Insert or update financial data in database.
         
+        Rows whose stored values are already identical are skipped.
+        
         Args:
             df_long: Long format DataFrame
         
         Returns:
-            Number of rows affected
+            Number of rows actually inserted or updated
+        """
+        return sum(self.upsert_financial_data_by_company(df_long).values())
+    
+    def upsert_financial_data_by_company(self, df_long: pd.DataFrame) -> dict[int, int]:
+        """
+        Insert or update financial data, skipping unchanged rows.
+        
+        Args:
+            df_long: Long format DataFrame (may hold several companies)
+        
+        Returns:
+            Dictionary mapping companyId to rows inserted or updated
+            (companies with nothing changed are absent)
         """
         if df_long.empty:
-            return 0
+            return {}
         
-        # Create temporary table with UUID for guaranteed uniqueness
-        # This prevents pg_type_typname_nsp_index constraint violations
-        temp_table = f"financial_statements_temp_{uuid.uuid4().hex}"
-        df_long.to_sql(
-            temp_table,
-            self.engine,
-            if_exists="replace",
-            index=False,
-            method="multi"
+        started = time.monotonic()
+        if self.use_copy:
+            written = self._upsert_via_copy(df_long)
+        else:
+            written = self._upsert_via_to_sql(df_long)
+        
+        rows_written = sum(written.values())
+        rows_skipped = len(df_long) - rows_written
+        with self._stats_lock:
+            self.rows_written += rows_written
+            self.rows_skipped += rows_skipped
+        METRICS.observe_upsert(rows_written, rows_skipped, time.monotonic() - started)
+        
+        logger.info(f"Upserted {rows_written} financial records ({rows_skipped} unchanged, skipped)")
+        return written
+    
+    def _merge_query(self, source_table: str) -> str:
+        """
+        INSERT ... ON CONFLICT statement merging a staging table into TARGET_TABLE.
+        
+        Staged rows identical to the stored ones (value compared at the
+        column's numeric(20, 2) scale) are filtered out before the insert,
+        so they cause no new row versions, WAL or index churn, and keep
+        their updatedAt. Returns one (companyId, rows written) row per company.
+        """
+        return f"""
+        WITH upserted AS (
+            INSERT INTO {self.TARGET_TABLE} 
+                ("companyId", year, quarter, "itemCode", "itemNameTR", "itemNameEN", 
+                 value, "statementType", "financialGroup", currency, "createdAt", "updatedAt")
+            SELECT 
+                s."companyId", s.year, s.quarter, s."itemCode", s."itemNameTR", s."itemNameEN",
+                s.value::numeric, s."statementType"::"StatementType", s."financialGroup", s.currency,
+                NOW(), NOW()
+            FROM {source_table} s
+            LEFT JOIN {self.TARGET_TABLE} t
+                ON t."companyId" = s."companyId"
+                AND t.year = s.year
+                AND t.quarter = s.quarter
+                AND t."itemCode" = s."itemCode"
+            WHERE t.id IS NULL
+                OR t.value IS DISTINCT FROM s.value::numeric(20, 2)
+                OR t."itemNameTR" IS DISTINCT FROM s."itemNameTR"
+                OR t."itemNameEN" IS DISTINCT FROM s."itemNameEN"
+                OR t."statementType" IS DISTINCT FROM s."statementType"::"StatementType"
+                OR t."financialGroup" IS DISTINCT FROM s."financialGroup"
+            ON CONFLICT ("companyId", year, quarter, "itemCode")
+            DO UPDATE SET
+                value = EXCLUDED.value,
+                "itemNameTR" = EXCLUDED."itemNameTR",
+                "itemNameEN" = EXCLUDED."itemNameEN",
+                "statementType" = EXCLUDED."statementType",
+                "financialGroup" = EXCLUDED."financialGroup",
+                "updatedAt" = NOW()
+            RETURNING "companyId"
         )
+        SELECT "companyId", COUNT(*) FROM upserted GROUP BY "companyId";
+        """
+    
+    def _upsert_via_copy(self, df_long: pd.DataFrame) -> dict[int, int]:
+        """
+        Fast path: stream rows with COPY FROM STDIN into a session temp table.
         
-        # Upsert query
-        upsert_query = f"""
-        INSERT INTO financial_statements 
-            ("companyId", year, quarter, "itemCode", "itemNameTR", "itemNameEN", 
-             value, "statementType", "financialGroup", currency, "createdAt", "updatedAt")
-        SELECT 
-            "companyId", year, quarter, "itemCode", "itemNameTR", "itemNameEN",
-            value::numeric, "statementType"::"StatementType", "financialGroup", currency,
-            NOW(), NOW()
-        FROM {temp_table}
-        ON CONFLICT ("companyId", year, quarter, "itemCode")
-        DO UPDATE SET
-            value = EXCLUDED.value,
-            "itemNameTR" = EXCLUDED."itemNameTR",
-            "itemNameEN" = EXCLUDED."itemNameEN",
-            "statementType" = EXCLUDED."statementType",
-            "financialGroup" = EXCLUDED."financialGroup",
-            "updatedAt" = NOW();
+        The staging table is created once per pooled connection and emptied
+        on every commit (ON COMMIT DELETE ROWS), so there is no DDL or
+        catalog churn per company.
         """
+        with PROFILER.span("db.csv_encode"):
+            buffer = io.StringIO()
+            df_long[self.STAGING_COLUMNS].to_csv(buffer, index=False, header=False)
+            buffer.seek(0)
+        
+        columns = ", ".join(f'"{col}"' for col in self.STAGING_COLUMNS)
+        conn = self.engine.raw_connection()
+        try:
+            cursor = conn.cursor()
+            with PROFILER.span("db.staging_write"):
+                cursor.execute(f"""
+                    CREATE TEMP TABLE IF NOT EXISTS {self.STAGING_TABLE} (
+                        "companyId" integer,
+                        year integer,
+                        quarter integer,
+                        "itemCode" text,
+                        "itemNameTR" text,
+                        "itemNameEN" text,
+                        value text,
+                        "statementType" text,
+                        "financialGroup" text,
+                        currency text
+                    ) ON COMMIT DELETE ROWS
+                """)
+                # Unquoted empty fields are NULL, except for the NOT NULL text columns
+                cursor.copy_expert(
+                    f"COPY {self.STAGING_TABLE} ({columns}) FROM STDIN "
+                    f"WITH (FORMAT csv, FORCE_NOT_NULL (\"itemCode\", \"itemNameTR\"))",
+                    buffer
+                )
+            with PROFILER.span("db.merge"):
+                cursor.execute(self._merge_query(self.STAGING_TABLE))
+                written = {row[0]: row[1] for row in cursor.fetchall()}
+                conn.commit()
+            cursor.close()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()  # Returns the connection (and its temp table) to the pool
+        
+        return written
+    
+    def _upsert_via_to_sql(self, df_long: pd.DataFrame) -> dict[int, int]:
+        """Legacy path: per-call staging table written with DataFrame.to_sql"""
+        # Create temporary table with UUID for guaranteed uniqueness
+        # This prevents pg_type_typname_nsp_index constraint violations
+        temp_table = f"financial_statements_temp_{uuid.uuid4().hex}"
+        with PROFILER.span("db.staging_write"):
+            df_long.to_sql(
+                temp_table,
+                self.engine,
+                if_exists="replace",
+                index=False,
+                method="multi"
+            )
         
         drop_query = f"DROP TABLE IF EXISTS {temp_table};"
         
-        with self.engine.begin() as conn:
-            result = conn.exec_driver_sql(upsert_query)
+        with PROFILER.span("db.merge"), self.engine.begin() as conn:
+            result = conn.exec_driver_sql(self._merge_query(temp_table))
+            written = {row[0]: row[1] for row in result}
             conn.exec_driver_sql(drop_query)
-            rows_affected = result.rowcount if hasattr(result, 'rowcount') else len(df_long)
         
-        logger.info(f"Upserted {rows_affected} financial records")
-        return rows_affected
+        return written
 
 
 class CompanyFinancialGroupMapper:
@@ -637,19 +1804,644 @@ class CompanyFinancialGroupMapper:
         return "XI_29"
 
 
-def main():
+@dataclass
+class CompanyResult:
+    """Outcome of processing a single company"""
+    symbol: str
+    worker: str
+    rows: int = 0
+    elapsed: float = 0.0
+    error: Optional[str] = None
+    skipped: int = 0  # Rows identical to the stored values
+    company_id: Optional[int] = None
+
+
+class RunJournal:
+    """
+    Append-only JSON-lines journal of per-company progress for resumable runs.
+    
+    Each line is one event: ``start`` (new run), ``resume``, ``company``
+    (companyId, symbol, status done/failed, rows, error) or ``finish``.
+    A company is only journaled as done after its rows are committed, so
+    a run killed mid-way (e.g. by PM2's memory limit) can be resumed by
+    skipping the done companies and retrying everything else. ``start``
+    records the run's settings (mode, limit, host); a run is only resumed
+    by an invocation with the same settings, so e.g. an incremental job
+    never skips companies a killed full run had finished.
+    """
+    
+    RESUME_MAX_AGE_HOURS = 20  # Older unfinished runs are not resumed (< 24h: the next daily cron run starts fresh)
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Journal file (created if missing)
+        """
+        self.path = path
+        self.run_id: Optional[str] = None
+        self._lock = threading.Lock()
+        self._file = None
+    
+    def load_last_run(self) -> Optional[dict]:
+        """
+        Read the most recent run from the journal.
+        
+        Returns:
+            Dict with run_id, started (datetime), finished (bool), settings
+            (dict, None for runs journaled before settings were recorded) and
+            statuses ({companyId: 'done' | 'failed'}), or None if no run exists
+        """
+        if not os.path.exists(self.path):
+            return None
+        
+        run = None
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Partially written last line of a killed run
+                kind = event.get("event")
+                if kind == "start":
+                    run = {
+                        "run_id": event["run_id"],
+                        "started": datetime.fromisoformat(event["ts"]),
+                        "finished": False,
+                        "settings": event.get("settings"),
+                        "statuses": {},
+                    }
+                elif run is None or event.get("run_id") != run["run_id"]:
+                    continue
+                elif kind == "company":
+                    run["statuses"][event["companyId"]] = event["status"]
+                elif kind == "finish":
+                    run["finished"] = True
+                elif kind == "resume":
+                    run["finished"] = False
+        return run
+    
+    def is_resumable(self, run: Optional[dict], settings: dict) -> bool:
+        """True if the run was interrupted recently enough and used the same settings"""
+        if run is None or run["finished"]:
+            return False
+        if run["settings"] != settings:
+            logger.info(
+                f"Not resuming run {run['run_id']}: it was started with {run['settings']}, "
+                f"this run uses {settings}"
+            )
+            return False
+        age_hours = (datetime.now() - run["started"]).total_seconds() / 3600
+        return age_hours <= self.RESUME_MAX_AGE_HOURS
+    
+    def start(self, total: int, settings: dict):
+        """Begin a new run, discarding older journal entries"""
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._open("w")
+        self._write({"event": "start", "total": total, "settings": settings})
+    
+    def resume(self, run_id: str, remaining: int):
+        """Continue an existing run"""
+        self.run_id = run_id
+        self._open("a")
+        self._write({"event": "resume", "remaining": remaining})
+    
+    def record(self, result: CompanyResult):
+        """Journal a company's final outcome"""
+        self._write({
+            "event": "company",
+            "companyId": result.company_id,
+            "symbol": result.symbol,
+            "status": "failed" if result.error else "done",
+            "rows": result.rows,
+            "skipped": result.skipped,
+            "error": result.error,
+        })
+    
+    def finish(self, success: int, failed: int):
+        """Mark the run as completed and close the journal"""
+        self._write({"event": "finish", "success": success, "failed": failed})
+        with self._lock:
+            self._file.close()
+            self._file = None
+    
+    def _open(self, mode: str):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if mode == "a" and os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+            # Terminate a line left half-written by a killed run
+            with open(self.path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    with open(self.path, "a", encoding="utf-8") as fix:
+                        fix.write("\n")
+        self._file = open(self.path, mode, encoding="utf-8")
+    
+    def _write(self, event: dict):
+        event["run_id"] = self.run_id
+        event["ts"] = datetime.now().isoformat(timespec="seconds")
+        with self._lock:
+            self._file.write(json.dumps(event, ensure_ascii=False) + "\n")
+            self._file.flush()
+
+
+def log_company_saved(result: CompanyResult, rows_total: int, journal: Optional[RunJournal] = None):
+    """Record and log how many of a company's rows were written vs unchanged"""
+    result.skipped = rows_total - result.rows
+    logger.info(
+        f"  ✓ Success: {result.rows} records saved, {result.skipped} unchanged ({result.symbol})"
+    )
+    METRICS.count_company(failed=False)
+    if journal is not None:
+        journal.record(result)
+
+
+def log_company_failed(result: CompanyResult, error: Exception, journal: Optional[RunJournal] = None):
+    """Record and log a company failure"""
+    logger.error(f"  ✗ Failed: {result.symbol}: {error}")
+    result.error = str(error)
+    METRICS.count_company(failed=True)
+    if journal is not None:
+        journal.record(result)
+
+
+class WriterError(RuntimeError):
+    """The batch writer thread died; no further frames can be written"""
+
+
+class BatchWriter:
+    """
+    Background writer that decouples database writes from fetching.
+    
+    Fetch workers submit long-format frames to a bounded queue (blocking
+    when it is full, which caps memory). A single writer thread coalesces
+    frames from many companies and upserts them in one transaction once
+    ``batch_rows`` rows are pending or ``batch_seconds`` have passed.
+    
+    If the writer thread dies, submit() and close() raise WriterError
+    instead of blocking on a queue nobody drains.
+    """
+    
+    _STOP = object()
+    PUT_POLL = 0.5  # seconds between writer health checks while the queue is full
+    
+    def __init__(
+        self,
+        processor: FinancialDataProcessor,
+        batch_rows: int = 50000,
+        batch_seconds: float = 5.0,
+        queue_size: int = 8,
+        journal: Optional[RunJournal] = None
+    ):
+        """
+        Args:
+            processor: Processor used for the upserts
+            batch_rows: Flush once this many rows are pending
+            batch_seconds: Flush pending rows at least this often
+            queue_size: Maximum frames waiting in the queue
+            journal: Optional run journal, updated once rows are committed
+        """
+        self.processor = processor
+        self.journal = journal
+        self.batch_rows = batch_rows
+        self.batch_seconds = batch_seconds
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.batches = 0
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="writer", daemon=True)
+    
+    def start(self):
+        """Start the writer thread"""
+        self._thread.start()
+    
+    def submit(self, result: CompanyResult, df_long: pd.DataFrame):
+        """
+        Queue a company's frame for writing (blocks while the queue is full).
+        
+        ``result.rows`` / ``result.error`` are filled in once the batch is written.
+        
+        Raises:
+            WriterError: The writer thread died
+        """
+        self._put((result, df_long))
+    
+    def close(self):
+        """
+        Flush everything still queued and stop the writer thread.
+        
+        Raises:
+            WriterError: The writer thread died (frames still queued were not written)
+        """
+        if self._thread.is_alive():
+            try:
+                self._put(self._STOP)
+            except WriterError:
+                pass
+            self._thread.join()
+        self._raise_if_failed()
+    
+    def _raise_if_failed(self):
+        if self._error is not None:
+            raise WriterError(f"Batch writer stopped: {self._error!r}") from self._error
+    
+    def _put(self, item):
+        """queue.put that gives up once the writer thread is gone"""
+        while True:
+            self._raise_if_failed()
+            try:
+                self.queue.put(item, timeout=self.PUT_POLL)
+                return
+            except queue.Full:
+                continue
+    
+    def _run(self):
+        try:
+            self._loop()
+        except BaseException as e:
+            logger.error(f"Batch writer stopped: {e!r}")
+            self._error = e
+    
+    def _loop(self):
+        """Writer loop: collect frames until the batch is full or its time window ends"""
+        pending: List[Tuple[CompanyResult, pd.DataFrame]] = []
+        pending_rows = 0
+        deadline = None
+        
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            
+            if item is not None and item is not self._STOP:
+                pending.append(item)
+                pending_rows += len(item[1])
+                if deadline is None:
+                    deadline = time.monotonic() + self.batch_seconds
+            
+            if pending and (
+                item is None or item is self._STOP
+                or pending_rows >= self.batch_rows
+                or time.monotonic() >= deadline
+            ):
+                self._flush(pending)
+                pending, pending_rows, deadline = [], 0, None
+            
+            if item is self._STOP:
+                return
+    
+    def _flush(self, pending: List[Tuple[CompanyResult, pd.DataFrame]]):
+        """Upsert a batch in one transaction; on failure retry company by company"""
+        frames = [df for _, df in pending if not df.empty]
+        try:
+            written = {}
+            if frames:
+                with PROFILER.span("db.batch_concat"):
+                    batch = pd.concat(frames, ignore_index=True)
+                written = self.processor.upsert_financial_data_by_company(batch)
+            self.batches += 1
+        except Exception as e:
+            logger.warning(f"Batch of {len(pending)} companies failed ({e}), retrying one by one")
+            for result, df_long in pending:
+                try:
+                    result.rows = self.processor.upsert_financial_data(df_long)
+                    log_company_saved(result, len(df_long), self.journal)
+                except Exception as company_error:
+                    log_company_failed(result, company_error, self.journal)
+            return
+        
+        for result, df_long in pending:
+            company_id = df_long["companyId"].iat[0] if not df_long.empty else None
+            result.rows = written.get(company_id, 0)
+            log_company_saved(result, len(df_long), self.journal)
+
+
+def process_company(
+    api_client: IsYatirimFinancialAPI,
+    processor: FinancialDataProcessor,
+    company: Tuple,
+    idx: int,
+    total: int,
+    start_year: int,
+    end_year: int,
+    since: Optional[Tuple[int, int]] = None,
+    writer: Optional[BatchWriter] = None,
+    journal: Optional[RunJournal] = None,
+    profile_dir: Optional[str] = None
+) -> CompanyResult:
+    """
+    Fetch, transform and store financial statements for one company.
+    
+    Safe to call from worker threads; failures are logged and returned
+    in the result instead of being raised.
+    
+    Args:
+        api_client: Shared API client
+        processor: Shared data processor
+        company: (id, code, name, main_sector) row from the companies query
+        idx: 1-based position in the run (for progress logs)
+        total: Total number of companies in the run
+        start_year: First year to fetch
+        end_year: Last year to fetch
+        since: Optional (year, quarter_month) to start from in incremental mode
+        writer: Optional batch writer; when given, the frame is queued and
+            the result's rows/error are completed by the writer thread
+        journal: Optional run journal for the company's final outcome
+        profile_dir: When given, run this company under cProfile/tracemalloc
+            and write the results there (see profile_company)
+    
+    Returns:
+        CompanyResult with row count or error message
+    """
+    if profile_dir is not None:
+        with profile_company(company[1], profile_dir):
+            return process_company(
+                api_client, processor, company, idx, total, start_year, end_year, since, writer, journal
+            )
+    
+    company_id, symbol, name = company[0], company[1], company[2]
+    result = CompanyResult(
+        symbol=symbol, worker=threading.current_thread().name, company_id=company_id
+    )
+    started = time.monotonic()
+    
+    logger.info(f"\n[{idx}/{total}] Processing: {symbol} - {name}")
+    
+    # Determine financial group using DB mapping or fallback
+    financial_group = api_client.get_financial_group_for_ticker(symbol)
+    
+    # Show if using DB mapping or fallback
+    if symbol in api_client.financial_group_mapping:
+        logger.info(f"  Financial Group: {financial_group} (from DB mapping)")
+    else:
+        logger.info(f"  Financial Group: {financial_group} (fallback)")
+    
+    try:
+        # Fetch from API
+        df_wide = api_client.fetch_financials(
+            symbol=symbol,
+            financial_group=financial_group,
+            start_year=start_year,
+            end_year=end_year,
+            since=since
+        )
+        
+        # Transform to long format
+        with PROFILER.span("transform"):
+            df_long = processor.transform_to_long_format(
+                df_wide=df_wide,
+                company_id=company_id,
+                symbol=symbol,
+                financial_group=financial_group
+            )
+        PROFILER.add_frame("transform", df_long)
+        
+        result.elapsed = time.monotonic() - started
+        
+        # Save to database
+        if writer is not None:
+            # Blocks while the writer is behind (time spent here is backpressure)
+            with PROFILER.span("writer.queue_wait"):
+                writer.submit(result, df_long)
+            return result
+        
+        result.rows = processor.upsert_financial_data(df_long)
+        log_company_saved(result, len(df_long), journal)
+        
+    except WriterError:
+        raise  # Not this company's failure: abort the run
+    except Exception as e:
+        log_company_failed(result, e, journal)
+    
+    result.elapsed = time.monotonic() - started
+    return result
+
+
+def log_worker_throughput(results: List[CompanyResult], wall_seconds: float):
+    """Log a per-worker throughput table for the finished run"""
+    per_worker: dict[str, List[CompanyResult]] = {}
+    for result in results:
+        per_worker.setdefault(result.worker, []).append(result)
+    
+    logger.info("\nWorker Throughput:")
+    logger.info(f"  {'Worker':<12} {'Done':>6} {'Failed':>7} {'Rows':>10} {'Busy(s)':>9} {'Comp/min':>9}")
+    for worker in sorted(per_worker):
+        worker_results = per_worker[worker]
+        failed = sum(1 for r in worker_results if r.error)
+        rows = sum(r.rows for r in worker_results)
+        busy = sum(r.elapsed for r in worker_results)
+        per_minute = len(worker_results) / (wall_seconds / 60) if wall_seconds > 0 else 0.0
+        logger.info(
+            f"  {worker:<12} {len(worker_results):>6} {failed:>7} {rows:>10} "
+            f"{busy:>9.1f} {per_minute:>9.2f}"
+        )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options (defaults can be set via environment)"""
+    parser = argparse.ArgumentParser(description="Is Yatirim financial statements scraper")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("FINANCIAL_SCRAPER_WORKERS", "4")),
+        help="Number of companies processed concurrently (env: FINANCIAL_SCRAPER_WORKERS)"
+    )
+    parser.add_argument(
+        "--max-rps",
+        type=float,
+        default=float(os.getenv("ISYATIRIM_MAX_RPS", IsYatirimFinancialAPI.DEFAULT_MAX_RPS)),
+        help="Global request budget towards Is Yatirim, requests/sec; the adaptive limiter backs off "
+             "below it and climbs back up to it (default: one request per 1.5s, the sequential pace; "
+             "env: ISYATIRIM_MAX_RPS)"
+    )
+    parser.add_argument(
+        "--burst",
+        type=int,
+        default=int(os.getenv("ISYATIRIM_BURST", "2")),
+        help="Requests allowed back to back after idle time (env: ISYATIRIM_BURST)"
+    )
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=IsYatirimFinancialAPI.MAX_RETRIES,
+        help="Attempts per chunk request, including the first (default: 3)"
+    )
+    parser.add_argument(
+        "--retry-base-delay",
+        type=float,
+        default=IsYatirimFinancialAPI.RETRY_DELAY,
+        help="Backoff cap for the first retry in seconds, doubled per attempt, full jitter (default: 2)"
+    )
+    parser.add_argument(
+        "--breaker-threshold",
+        type=float,
+        default=0.5,
+        help="Failure ratio of recent requests that pauses all workers (default: 0.5)"
+    )
+    parser.add_argument(
+        "--breaker-open-seconds",
+        type=float,
+        default=30.0,
+        help="Pause before probing a failing upstream again; doubles per failed probe (default: 30s)"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        default=os.getenv("FINANCIAL_SCRAPER_INCREMENTAL", "").lower() in ("1", "true", "yes"),
+        help="Only fetch quarters newer than the latest stored one (env: FINANCIAL_SCRAPER_INCREMENTAL)"
+    )
+    parser.add_argument(
+        "--lookback-quarters",
+        type=int,
+        default=1,
+        help="Incremental mode: stored quarters to refresh, counting the latest one (default: 1)"
+    )
+    parser.add_argument(
+        "--batch-rows",
+        type=int,
+        default=int(os.getenv("FINANCIAL_SCRAPER_BATCH_ROWS", "50000")),
+        help="Rows coalesced into one upsert transaction (env: FINANCIAL_SCRAPER_BATCH_ROWS)"
+    )
+    parser.add_argument(
+        "--batch-seconds",
+        type=float,
+        default=5.0,
+        help="Maximum time rows wait before being written (default: 5s)"
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=None,
+        help="Company frames waiting for the writer before fetchers block (default: 2 x workers)"
+    )
+    parser.add_argument(
+        "--cache",
+        default=os.getenv("ISYATIRIM_CACHE_PATH"),
+        help="SQLite response cache file, e.g. .cache/isyatirim-malitablo.sqlite (env: ISYATIRIM_CACHE_PATH)"
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=512,
+        help="Response cache size limit in MB (default: 512)"
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Serve only from the response cache, never hit the network (requires --cache)"
+    )
+    parser.add_argument(
+        "--base-url",
+        default=os.getenv("ISYATIRIM_BASE_URL"),
+        help="Is Yatirim scheme://host[:port], e.g. a local stub server (env: ISYATIRIM_BASE_URL)"
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Only process the first N companies (smoke tests and benchmarks)"
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=int(os.getenv("FINANCIAL_SCRAPER_METRICS_PORT", "0")) or None,
+        help="Expose Prometheus metrics on this port (env: FINANCIAL_SCRAPER_METRICS_PORT)"
+    )
+    parser.add_argument(
+        "--metrics-textfile",
+        default=os.getenv("FINANCIAL_SCRAPER_METRICS_TEXTFILE"),
+        help="Write Prometheus metrics to a node_exporter textfile-collector file, "
+             "e.g. /var/lib/prometheus/node-exporter/financial_scraper.prom (env: FINANCIAL_SCRAPER_METRICS_TEXTFILE)"
+    )
+    parser.add_argument(
+        "--profile-json",
+        default=os.getenv("FINANCIAL_SCRAPER_PROFILE_JSON"),
+        help="Write the per-stage run profile as JSON (env: FINANCIAL_SCRAPER_PROFILE_JSON)"
+    )
+    parser.add_argument(
+        "--profile-company",
+        default=None,
+        help="Run this ticker under cProfile + tracemalloc (results in --profile-dir)"
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default="logs",
+        help="Directory for --profile-company output (default: logs)"
+    )
+    parser.add_argument(
+        "--journal",
+        default=os.getenv("FINANCIAL_SCRAPER_JOURNAL", "logs/financial_scraper_journal.jsonl"),
+        help="Per-company progress journal used to resume interrupted runs (env: FINANCIAL_SCRAPER_JOURNAL)"
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Start a new run even if the previous one was interrupted"
+    )
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="Only process the companies that failed in the last journaled run"
+    )
+    args = parser.parse_args(argv)
+    if args.fresh and args.retry_failed:
+        parser.error("--fresh and --retry-failed are mutually exclusive")
+    if args.offline and not args.cache:
+        parser.error("--offline requires --cache")
+    if args.queue_size is None:
+        args.queue_size = 2 * args.workers
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.lookback_quarters < 1:
+        parser.error("--lookback-quarters must be at least 1")
+    if args.limit is not None and args.limit < 1:
+        parser.error("--limit must be at least 1")
+    if args.max_retries < 1:
+        parser.error("--max-retries must be at least 1")
+    if not 0 < args.breaker_threshold <= 1:
+        parser.error("--breaker-threshold must be in (0, 1]")
+    return args
+
+
+def run_settings(args: argparse.Namespace) -> dict:
+    """Settings that decide what a journaled "done" means; a run only resumes with equal settings"""
+    return {
+        "incremental": args.incremental,
+        "lookback_quarters": args.lookback_quarters if args.incremental else None,
+        "limit": args.limit,
+        "base_url": args.base_url,
+        "offline": args.offline,
+    }
+
+
+def main(argv: Optional[List[str]] = None):
     """Main execution function - Scrape all companies"""
+    args = parse_args(argv)
+    
     logger.info("=" * 80)
     logger.info("Financial Scraper V2 - FULL PRODUCTION RUN")
+    logger.info(f"Workers: {args.workers} | Request budget: {args.max_rps:.2f} req/s")
+    logger.info(f"Write batches: {args.batch_rows} rows / {args.batch_seconds:.0f}s, queue: {args.queue_size}")
+    if args.cache:
+        logger.info(f"Response cache: {args.cache}{' (offline)' if args.offline else ''}")
+    if args.incremental:
+        logger.info(f"Mode: INCREMENTAL (lookback: {args.lookback_quarters} quarter(s))")
+    if args.base_url:
+        logger.info(f"Is Yatirim host: {args.base_url}")
     logger.info("=" * 80)
     
     DATABASE_URL = os.getenv("DATABASE_URL")
     if not DATABASE_URL:
         raise ValueError("DATABASE_URL environment variable not set")
     
+    if args.metrics_port or args.metrics_textfile:
+        METRICS.enable(port=args.metrics_port, textfile=args.metrics_textfile)
+    
     # Load financial group mapping from database
     logger.info("\n📋 Loading financial group mapping...")
-    financial_group_mapping = load_financial_group_mapping()
+    with PROFILER.span("db.mapping_load"):
+        financial_group_mapping = load_financial_group_mapping()
     
     # Database connection for fetching companies
     db_url = DATABASE_URL.replace("postgresql://", "postgresql+psycopg2://").split("?")[0]
@@ -665,62 +2457,124 @@ def main():
         ORDER BY c.code
     """
     
-    with engine.connect() as conn:
+    with PROFILER.span("db.company_query"), engine.connect() as conn:
         from sqlalchemy import text
         result = conn.execute(text(query))
         companies = [(row[0], row[1], row[2], row[3]) for row in result]
     
+    logger.info(f"✓ Found {len(companies)} companies in database")
+    if args.limit is not None:
+        companies = companies[:args.limit]
+    
+    # Resume an interrupted run (or retry failures) from the journal
+    journal = RunJournal(args.journal)
+    last_run = journal.load_last_run()
+    settings = run_settings(args)
+    if args.retry_failed:
+        if last_run is None:
+            raise ValueError(f"--retry-failed: no run found in journal {args.journal}")
+        if last_run["settings"] != settings:
+            logger.warning(
+                f"--retry-failed: run {last_run['run_id']} was started with {last_run['settings']}, "
+                f"retrying its failures with {settings}"
+            )
+        companies = [c for c in companies if last_run["statuses"].get(c[0]) == "failed"]
+        journal.resume(last_run["run_id"], remaining=len(companies))
+        logger.info(f"↻ Retrying {len(companies)} failed companies of run {last_run['run_id']}")
+    elif not args.fresh and journal.is_resumable(last_run, settings):
+        statuses = last_run["statuses"]
+        done = sum(1 for status in statuses.values() if status == "done")
+        retried = sum(1 for status in statuses.values() if status == "failed")
+        companies = [c for c in companies if statuses.get(c[0]) != "done"]
+        journal.resume(last_run["run_id"], remaining=len(companies))
+        logger.info(
+            f"↻ Resuming interrupted run {last_run['run_id']}: {done} done, "
+            f"{len(companies)} remaining ({retried} failed will be retried)"
+        )
+    else:
+        journal.start(total=len(companies), settings=settings)
+    
     total_companies = len(companies)
-    logger.info(f"✓ Found {total_companies} companies to process\n")
+    logger.info(f"✓ {total_companies} companies to process\n")
+    
+    # Incremental mode: start each company at its latest stored quarter
+    latest_quarters = {}
+    if args.incremental:
+        with PROFILER.span("db.latest_quarters"):
+            latest_quarters = load_latest_quarters(engine)
     
     # Initialize API client and processor with mapping
-    api_client = IsYatirimFinancialAPI(exchange="TRY", financial_group_mapping=financial_group_mapping)
-    processor = FinancialDataProcessor(DATABASE_URL)
+    rate_limiter = RateLimiter(max_rps=args.max_rps, burst=args.burst)
+    cache = (
+        ResponseCache(args.cache, max_bytes=args.cache_max_mb * 1024 * 1024, offline=args.offline)
+        if args.cache else None
+    )
+    retry_policy = RetryPolicy(max_attempts=args.max_retries, base_delay=args.retry_base_delay)
+    circuit_breaker = CircuitBreaker.for_host(
+        urlsplit(args.base_url or IsYatirimFinancialAPI.HOST).netloc,
+        failure_threshold=args.breaker_threshold,
+        open_seconds=args.breaker_open_seconds
+    )
+    api_client = IsYatirimFinancialAPI(
+        exchange="TRY",
+        financial_group_mapping=financial_group_mapping,
+        rate_limiter=rate_limiter,
+        cache=cache,
+        host=args.base_url,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker
+    )
+    processor = FinancialDataProcessor(DATABASE_URL, pool_size=max(5, args.workers))
     
     # Statistics
-    success_count = 0
-    failed_companies = []
+    results: List[CompanyResult] = []
     start_time = datetime.now()
+    end_year = datetime.now().year
     
-    # Process each company
-    for idx, company_tuple in enumerate(companies, 1):
-        company_id, symbol, name = company_tuple[0], company_tuple[1], company_tuple[2]
-        logger.info(f"\n[{idx}/{total_companies}] Processing: {symbol} - {name}")
-        
-        # Determine financial group using DB mapping or fallback
-        financial_group = api_client.get_financial_group_for_ticker(symbol)
-        
-        # Show if using DB mapping or fallback
-        if symbol in financial_group_mapping:
-            logger.info(f"  Financial Group: {financial_group} (from DB mapping)")
-        else:
-            logger.info(f"  Financial Group: {financial_group} (fallback)")
-        
-        try:
-            # Fetch from API
-            df_wide = api_client.fetch_financials(
-                symbol=symbol,
-                financial_group=financial_group,
-                start_year=2020,
-                end_year=datetime.now().year
-            )
-            
-            # Transform to long format
-            df_long = processor.transform_to_long_format(
-                df_wide=df_wide,
-                company_id=company_id,
-                symbol=symbol,
-                financial_group=financial_group
-            )
-            
-            # Save to database
-            rows = processor.upsert_financial_data(df_long)
-            logger.info(f"  ✓ Success: {rows} records saved")
-            success_count += 1
-            
-        except Exception as e:
-            logger.error(f"  ✗ Failed: {e}")
-            failed_companies.append((symbol, str(e)))
+    # Fetch workers feed a single batch writer through a bounded queue
+    writer = BatchWriter(
+        processor,
+        batch_rows=args.batch_rows,
+        batch_seconds=args.batch_seconds,
+        queue_size=args.queue_size,
+        journal=journal
+    )
+    writer.start()
+    
+    # Process companies with a bounded worker pool
+    try:
+        with ThreadPoolExecutor(max_workers=args.workers, thread_name_prefix="worker") as executor:
+            futures = [
+                executor.submit(
+                    process_company,
+                    api_client, processor, company_tuple, idx, total_companies, 2020, end_year,
+                    incremental_start(latest_quarters[company_tuple[0]], args.lookback_quarters)
+                    if company_tuple[0] in latest_quarters else None,
+                    writer,
+                    journal,
+                    args.profile_dir if company_tuple[1] == args.profile_company else None
+                )
+                for idx, company_tuple in enumerate(companies, 1)
+            ]
+            for future in as_completed(futures):
+                try:
+                    results.append(future.result())
+                except WriterError:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+    finally:
+        writer.close()
+    
+    logger.info(
+        f"Database writes: {writer.batches} batch transaction(s), "
+        f"{processor.rows_written:,} rows written, {processor.rows_skipped:,} unchanged (skipped)"
+    )
+    
+    success_count = sum(1 for r in results if not r.error)
+    failed_companies = sorted((r.symbol, r.error) for r in results if r.error)
+    journal.finish(success_count, len(failed_companies))
+    METRICS.close()
     
     # Final statistics
     end_time = datetime.now()
@@ -730,10 +2584,24 @@ def main():
     logger.info("SCRAPING COMPLETED")
     logger.info("=" * 80)
     logger.info(f"Total Companies: {total_companies}")
-    logger.info(f"Successful: {success_count} ({success_count/total_companies*100:.1f}%)")
+    logger.info(f"Successful: {success_count} ({success_count/max(total_companies, 1)*100:.1f}%)")
     logger.info(f"Failed: {len(failed_companies)}")
     logger.info(f"Duration: {duration/60:.1f} minutes")
     
+    log_worker_throughput(results, duration)
+    
+    profile = PROFILER.report()
+    PROFILER.log_table(profile)
+    if args.profile_json:
+        PROFILER.write_json(args.profile_json, profile)
+    
+    if circuit_breaker.times_opened:
+        logger.info(f"\nCircuit breaker: opened {circuit_breaker.times_opened} time(s) for {circuit_breaker.host}")
+    
+    if cache is not None:
+        logger.info(f"\nResponse cache: {cache.hits} hits, {cache.misses} misses ({cache.path})")
+        cache.close()
+    
     if failed_companies:
         logger.warning("\nFailed Companies:")
         for symbol, error in failed_companies:
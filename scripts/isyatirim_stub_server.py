@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Local Is Yatirim Stub Server
+============================
+
+Stands in for the two Is Yatirim pages the scrapers use, so they can be
+exercised and benchmarked without network access:
+
+- MaliTablo JSON ({"ok": true, "value": [...]}) for financial_scraper_v2.py.
+  The same symbol/group/quarter always yields the same numbers, some items
+  only exist in later years, and quarters that have not closed yet come
+  back as null, like the real API.
+- sirket-karti.aspx HTML with the ddlMaliTabloGroup select for
+  scrape_financial_groups.py, padded to a realistic page weight.
+
+Company cards can carry ETag/Last-Modified validators and answer
+conditional requests with 304 (--card-etags). Latency, 5xx errors, 429
+throttling (with Retry-After) and a timed outage window can be injected
+to see how the scrapers behave when the upstream degrades.
+
+Usage:
+    .venv/bin/python scripts/isyatirim_stub_server.py --port 8765 --latency-ms 80 --throttle-rate 0.02
+
+    # In another shell
+    ISYATIRIM_BASE_URL=http://127.0.0.1:8765 .venv/bin/python scripts/financial_scraper_v2.py --limit 20
+    ISYATIRIM_BASE_URL=http://127.0.0.1:8765 .venv/bin/python scripts/scrape_financial_groups.py
+
+    # In-process (tests and benchmarks)
+    with StubIsYatirimServer(latency_ms=80) as server:
+        api = IsYatirimFinancialAPI(host=server.base_url)
+
+Author: KAP BIST Data Project
+Date: October 2025
+"""
+
+import json
+import time
+import zlib
+import random
+import logging
+import argparse
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, List
+from urllib.parse import urlsplit, parse_qs
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+MALITABLO_PATH = "/_layouts/15/IsYatirim.Website/Common/Data.aspx/MaliTablo"
+CARD_PATH = "/tr-tr/analiz/hisse/Sayfalar/sirket-karti.aspx"
+SELECTED = ' selected="selected"'
+CARD_LAST_MODIFIED = "Wed, 01 Oct 2025 06:00:00 GMT"
+
+STATEMENT_NAMES = {
+    "1": ("Varlıklar", "ASSETS"),
+    "2": ("Kaynaklar", "LIABILITIES"),
+    "3": ("Gelir Tablosu", "INCOME STATEMENT"),
+    "4": ("Nakit Akış", "CASH FLOW"),
+}
+
+# ddlMaliTabloGroup options as listed on the real company cards
+GROUP_OPTIONS = {
+    "XI_29": [("XI_29", "Seri XI No:29 Konsolide Olmayan"), ("XI_29K", "Seri XI No:29 Konsolide")],
+    "UFRS": [("UFRS", "Konsolide Olmayan UFRS"), ("UFRS_K", "Konsolide UFRS")],
+}
+
+
+def _stable_hash(*parts) -> int:
+    """Process-independent hash (str hash() is salted per interpreter)"""
+    return zlib.crc32("|".join(str(part) for part in parts).encode("utf-8"))
+
+
+def _last_closed_quarter() -> tuple[int, int]:
+    today = datetime.now()
+    month = (today.month - 1) // 3 * 3
+    return (today.year, month) if month else (today.year - 1, 12)
+
+
+class StubIsYatirimServer:
+    """
+    Threaded HTTP server standing in for www.isyatirim.com.tr.
+
+    Starts on an ephemeral port by default; pass ``base_url`` as the
+    client's host. Faults are drawn from a seeded generator, so a run with
+    the same settings and request order sees the same faults.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        items_per_statement: int = 40,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 1,
+        page_kb: int = 250,
+        outage: Optional[tuple[float, float]] = None,
+        card_etags: bool = False,
+        seed: int = 0
+    ):
+        """
+        Args:
+            host: Interface to bind
+            port: TCP port (0 picks a free one)
+            items_per_statement: Line items per statement type (4 types per company)
+            latency_ms: Base response delay
+            jitter_ms: Mean of an extra exponentially distributed delay (gives a long tail)
+            error_rate: Fraction of requests answered with 500
+            throttle_rate: Fraction of requests answered with 429
+            retry_after: Retry-After seconds sent with 429 responses
+            page_kb: Approximate size of the sirket-karti.aspx page
+            outage: (start, end) seconds after start() during which every request gets 503
+            card_etags: Send ETag/Last-Modified with company cards and honour If-None-Match / If-Modified-Since
+            seed: Seed for latency and fault sampling
+        """
+        if not 0 <= error_rate + throttle_rate <= 1:
+            raise ValueError("error_rate + throttle_rate must be between 0 and 1")
+        self.items_per_statement = items_per_statement
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.outage = outage
+        self.card_etags = card_etags
+        self.requests_served = 0
+        self.status_counts: dict[int, int] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._page_head, self._page_tail = self._page_shell(page_kb)
+        self._started = time.monotonic()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real server
+            disable_nagle_algorithm = True  # headers and body are separate writes
+
+            def do_GET(self):
+                stub._handle(self)
+
+            def log_message(self, format, *args):
+                logger.debug("%s - %s", self.address_string(), format % args)
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def malitablo_url(self) -> str:
+        return self.base_url + MALITABLO_PATH
+
+    def start(self) -> "StubIsYatirimServer":
+        """Serve from a background thread"""
+        self._started = time.monotonic()
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="isyatirim-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StubIsYatirimServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _handle(self, request: BaseHTTPRequestHandler):
+        url = urlsplit(request.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        with self._lock:
+            self.requests_served += 1
+            delay = self.latency_ms
+            if self.jitter_ms > 0:
+                delay += self._random.expovariate(1 / self.jitter_ms)
+            draw = self._random.random()
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        uptime = time.monotonic() - self._started
+        if url.path not in (MALITABLO_PATH, CARD_PATH):
+            self._send(request, 404, "text/plain; charset=utf-8", "Not Found")
+        elif self.outage and self.outage[0] <= uptime < self.outage[1]:
+            self._send(request, 503, "text/html; charset=utf-8", "<html><body>Service Unavailable</body></html>")
+        elif draw < self.throttle_rate:
+            self._send(
+                request, 429, "text/plain; charset=utf-8", "Too Many Requests",
+                {"Retry-After": str(self.retry_after)}
+            )
+        elif draw < self.throttle_rate + self.error_rate:
+            self._send(request, 500, "text/html; charset=utf-8", "<html><body>Runtime Error</body></html>")
+        elif url.path == MALITABLO_PATH:
+            self._send(request, 200, "application/json; charset=utf-8", json.dumps(self.malitablo(params)))
+        else:
+            self._send_card(request, params.get("hisse", ""))
+
+    def _send_card(self, request: BaseHTTPRequestHandler, ticker: str):
+        card = self.company_card(ticker)
+        if not self.card_etags:
+            self._send(request, 200, "text/html; charset=utf-8", card)
+            return
+        # The card only changes with its select, so validators are fixed per ticker
+        validators = {"ETag": f'"{zlib.crc32(card.encode("utf-8")):08x}"', "Last-Modified": CARD_LAST_MODIFIED}
+        if request.headers.get("If-None-Match") == validators["ETag"] or (
+            request.headers.get("If-None-Match") is None
+            and request.headers.get("If-Modified-Since") == CARD_LAST_MODIFIED
+        ):
+            with self._lock:
+                self.status_counts[304] = self.status_counts.get(304, 0) + 1
+            request.send_response(304)
+            for name, value in validators.items():
+                request.send_header(name, value)
+            request.end_headers()
+            return
+        self._send(request, 200, "text/html; charset=utf-8", card, validators)
+
+    def _send(
+        self,
+        request: BaseHTTPRequestHandler,
+        status: int,
+        content_type: str,
+        body: str,
+        headers: Optional[dict[str, str]] = None
+    ):
+        with self._lock:
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        payload = body.encode("utf-8")
+        request.send_response(status)
+        request.send_header("Content-Type", content_type)
+        request.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            request.send_header(name, value)
+        request.end_headers()
+        request.wfile.write(payload)
+
+    def item_codes(self, financial_group: str) -> List[str]:
+        """Line item codes of a financial group, in the order the API lists them"""
+        codes = []
+        for prefix in STATEMENT_NAMES:
+            for idx in range(self.items_per_statement):
+                codes.append(f"{prefix}{chr(65 + idx // 26)}{chr(65 + idx % 26)}")
+        # Groups report slightly different item sets
+        return [code for code in codes if _stable_hash(financial_group, code) % 10]
+
+    def malitablo(self, params: dict[str, str]) -> dict:
+        """MaliTablo response body for one request"""
+        symbol = params.get("companyCode", "")
+        financial_group = params.get("financialGroup", "")
+        exchange = params.get("exchange", "TRY")
+        if not symbol or not financial_group:
+            return {"ok": False, "errorCode": "", "errorDescription": "Parametre eksik", "value": None}
+
+        quarters = []
+        for idx in range(1, 5):
+            if f"year{idx}" in params:
+                quarters.append((int(params[f"year{idx}"]), int(params[f"period{idx}"])))
+        last_closed = _last_closed_quarter()
+
+        items = []
+        for position, code in enumerate(self.item_codes(financial_group)):
+            # Every seventh item was introduced in 2022, so older chunks lack it
+            if position % 7 == 3 and all(year < 2022 for year, _ in quarters):
+                continue
+            name_tr, name_en = STATEMENT_NAMES[code[0]]
+            item = {
+                "itemCode": code,
+                "itemDescTr": f"{name_tr} {code}",
+                "itemDescEng": f"{name_en} {code}",
+            }
+            for idx, (year, month) in enumerate(quarters, start=1):
+                seed = _stable_hash(symbol, financial_group, exchange, code, year, month)
+                if (year, month) > last_closed or seed % 11 == 0:
+                    item[f"value{idx}"] = None
+                else:
+                    item[f"value{idx}"] = float(seed % 2_000_000_000 - 500_000_000)
+            items.append(item)
+
+        return {"ok": True, "errorCode": "", "errorDescription": "", "value": items}
+
+    def financial_group_options(self, ticker: str) -> List[tuple[str, str, bool]]:
+        """(value, display, selected) options of a company's ddlMaliTabloGroup select"""
+        bucket = _stable_hash("card", ticker) % 10
+        if bucket == 9:
+            return []  # Some cards (e.g. ISKUR, MARMR) list no statement groups
+        options = GROUP_OPTIONS["XI_29" if bucket < 7 else "UFRS"]
+        selected = _stable_hash("selected", ticker) % 2
+        return [(value, display, idx == selected) for idx, (value, display) in enumerate(options)]
+
+    def company_card(self, ticker: str) -> str:
+        """sirket-karti.aspx page for one ticker"""
+        options = "".join(
+            f'<option{SELECTED if selected else ""} value="{value}">{display}</option>'
+            for value, display, selected in self.financial_group_options(ticker)
+        )
+        select = (
+            f'<div class="mali-tablo-filtre"><label>{ticker} Mali Tablolar</label>'
+            f'<select name="ctl00$ctl58$g_76ae4504_9743_4791_98df_dce2ca95cc0d$ddlMaliTabloGroup" '
+            f'id="ddlMaliTabloGroup" class="form-control">{options}</select></div>'
+        )
+        return self._page_head + select + self._page_tail
+
+    @staticmethod
+    def _page_shell(page_kb: int) -> tuple[str, str]:
+        """
+        Static markup around the select: a large __VIEWSTATE and script
+        block before it and price tables after it, like the real page.
+        """
+        rng = random.Random(page_kb)
+        scripts = "".join(
+            f'<script type="text/javascript">var _spPageContext{i} = {{"id": {i}, "rev": "{rng.random():.8f}"}};</script>\n'
+            for i in range(page_kb // 4)
+        )
+        rows = "".join(
+            f"<tr><td>{day % 28 + 1:02d}.{day // 28 % 12 + 1:02d}.2025</td><td>{rng.uniform(10, 500):.2f}</td>"
+            f"<td>{rng.randint(10_000, 9_000_000)}</td></tr>"
+            for day in range(page_kb * 2)
+        )
+        # The viewstate fills the rest of the page weight
+        alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+        viewstate_len = max(0, page_kb * 1024 - len(scripts) - len(rows) - 1024)
+        viewstate = "".join(rng.choice(alphabet) for _ in range(viewstate_len))
+        head = (
+            '<!DOCTYPE html>\n<html dir="ltr" lang="tr-TR"><head><meta charset="utf-8" />'
+            '<title>Şirket Kartı | İş Yatırım</title>'
+            '<link rel="stylesheet" type="text/css" href="/_layouts/15/IsYatirim.Website/css/main.css" />'
+            f'{scripts}</head><body><form method="post" action="./sirket-karti.aspx" id="aspnetForm">'
+            f'<input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="{viewstate}" />'
+            '<div id="s4-workspace"><div class="container">'
+        )
+        tail = (
+            f'<table class="dataTable"><thead><tr><th>Tarih</th><th>Kapanış</th><th>Hacim</th></tr></thead>'
+            f'<tbody>{rows}</tbody></table></div></div></form></body></html>'
+        )
+        return head, tail
+
+
+def parse_outage(value: str) -> tuple[float, float]:
+    """argparse type for START:END outage windows"""
+    try:
+        start, end = (float(part) for part in value.split(":"))
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected START:END in seconds, e.g. 30:90")
+    return start, end
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Is Yatirim endpoints")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--items", type=int, default=40, help="Line items per statement type")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Base response delay")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Mean extra delay (exponential tail)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 500 responses")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of 429 responses")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds on 429")
+    parser.add_argument("--page-kb", type=int, default=250, help="Approximate company card page size")
+    parser.add_argument("--outage", type=parse_outage, default=None, help="START:END seconds of 503s, e.g. 30:90")
+    parser.add_argument("--card-etags", action="store_true", help="Company cards send validators and answer 304")
+    args = parser.parse_args()
+
+    server = StubIsYatirimServer(
+        args.host,
+        args.port,
+        items_per_statement=args.items,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        page_kb=args.page_kb,
+        outage=args.outage,
+        card_etags=args.card_etags
+    )
+    logger.info(f"Serving Is Yatirim stub at {server.base_url}")
+    logger.info(f"  MaliTablo:    {server.malitablo_url}")
+    logger.info(f"  Company card: {server.base_url}{CARD_PATH}?hisse=THYAO")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+Shared request pacing and retry policy for the Is Yatirim scrapers.
+
+Kept out of financial_scraper_v2 so lightweight scripts (e.g.
+scrape_financial_groups.py) can use them without importing the full
+scraper and its pandas/sqlalchemy/aiohttp/metrics setup.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Thread-safe adaptive token bucket shared by all workers.
+    
+    Tokens refill at ``rate`` per second up to ``burst``; every request
+    takes one token and only waits when the bucket is empty, so there are
+    no idle gaps while the upstream has spare capacity.
+    
+    The refill rate adapts to the server (AIMD):
+    - 429 / 5xx / connection errors halve the rate (down to ``min_rps``)
+    - responses slower than ``slow_threshold`` reduce it by 20%
+    - healthy responses add it back step by step up to ``max_rps``
+    """
+    
+    BACKOFF_FACTOR = 0.5  # Rate multiplier on 429/5xx/connection errors
+    SLOW_FACTOR = 0.8  # Rate multiplier on slow responses
+    RECOVERY_STEPS = 20  # Healthy responses needed to climb from 0 back to max_rps
+    DECREASE_COOLDOWN = 1.0  # seconds; in-flight failures of one incident count once
+    
+    def __init__(
+        self,
+        max_rps: float,
+        burst: int = 1,
+        min_rps: Optional[float] = None,
+        slow_threshold: float = 5.0
+    ):
+        """
+        Args:
+            max_rps: Maximum number of requests per second across all threads
+            burst: Bucket capacity (requests allowed back to back after idle time)
+            min_rps: Lower bound for the adaptive rate (default: max_rps / 10)
+            slow_threshold: Response time in seconds considered a slowdown
+        """
+        if max_rps <= 0:
+            raise ValueError("max_rps must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.max_rps = max_rps
+        self.min_rps = min_rps if min_rps is not None else max_rps / 10
+        self.burst = burst
+        self.slow_threshold = slow_threshold
+        self.rate = max_rps
+        
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._last_decrease = 0.0
+    
+    def _refill(self, now: float):
+        """Add tokens earned since the last update (caller holds the lock)"""
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def reserve(self) -> float:
+        """
+        Take one token and return how long the caller must wait before using it.
+        
+        Tokens are reserved under the lock (the balance may go negative),
+        so concurrent callers queue up fairly and wait outside the lock.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+    
+    def acquire(self) -> float:
+        """
+        Block until the caller may issue its next request.
+        
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+    
+    async def acquire_async(self) -> float:
+        """Like acquire(), but yields to the event loop instead of blocking the thread"""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+    
+    def record_response(self, status_code: Optional[int], latency: float):
+        """
+        Adapt the refill rate to the server's behaviour.
+        
+        Args:
+            status_code: HTTP status, or None when the request failed without a response
+            latency: Request duration in seconds
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            
+            if status_code is None or status_code == 429 or status_code >= 500:
+                factor = self.BACKOFF_FACTOR
+            elif latency > self.slow_threshold:
+                factor = self.SLOW_FACTOR
+            else:
+                if self.rate < self.max_rps:
+                    self.rate = min(self.max_rps, self.rate + self.max_rps / self.RECOVERY_STEPS)
+                return
+            
+            if now - self._last_decrease < self.DECREASE_COOLDOWN:
+                return
+            self._last_decrease = now
+            old_rate = self.rate
+            self.rate = max(self.min_rps, self.rate * factor)
+            # Pause the whole pool briefly instead of spending saved-up burst
+            self._tokens = min(self._tokens, 0.0)
+        
+        logger.warning(
+            f"Upstream pressure (status={status_code}, {latency:.1f}s): "
+            f"request rate {old_rate:.2f} -> {self.rate:.2f} req/s"
+        )
+
+
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a failed request.
+    
+    Delays use exponential backoff with full jitter (uniform between 0 and
+    base_delay * 2**attempt, capped at max_delay), so workers that failed
+    together do not retry together. A Retry-After header from the server
+    is used as the minimum delay. Connection errors, timeouts, 429 and 5xx
+    are retried; other 4xx responses are not, since repeating them cannot
+    help.
+    """
+    
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 2.0,
+        max_delay: float = 30.0,
+        max_retry_after: float = 120.0
+    ):
+        """
+        Args:
+            max_attempts: Total attempts per request, including the first one
+            base_delay: Backoff cap for the first retry in seconds (doubles per attempt)
+            max_delay: Upper bound for a single backoff delay
+            max_retry_after: Upper bound for honouring a server's Retry-After
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+    
+    def is_retryable(self, status_code: Optional[int]) -> bool:
+        """None (no response), 429, 5xx and malformed 2xx bodies are worth retrying"""
+        return status_code is None or status_code < 400 or status_code in self.RETRY_STATUSES
+    
+    def next_delay(
+        self,
+        attempt: int,
+        status_code: Optional[int],
+        retry_after: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        Seconds to wait before the next attempt, or None to give up.
+        
+        Args:
+            attempt: 0-based index of the attempt that just failed
+            status_code: HTTP status of the failed attempt (None without a response)
+            retry_after: Parsed Retry-After header, if the server sent one
+        """
+        if attempt + 1 >= self.max_attempts or not self.is_retryable(status_code):
+            return None
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_retry_after))
+        return delay
+    
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Retry-After header (delta seconds or HTTP date) in seconds from now"""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
@@ -4,21 +4,41 @@ Financial Group Scraper - Scrape correct financial group for each company from I
 This scraper extracts the financial group selection from the company card page,
 which tells us exactly which format (XI_29, UFRS, UFRS_K, etc.) each company uses.
 
-Updated: Uses BeautifulSoup for speed, fetches all tradable tickers from DB,
-and upserts to company_financial_groups table.
+Updated: Streams each company card and reads only the ddlMaliTabloGroup select
+(no full-page parse), fetches all tradable tickers from DB,
+and upserts to company_financial_groups table. Company cards are fetched by a
+bounded worker pool sharing one adaptive request budget (see
+request_policy.RateLimiter) instead of one page every 0.5s. Results are
+written in batches over a single connection (staging table + one ON CONFLICT
+merge per batch), flushed every few seconds so partial progress is durable.
+
+Groups rarely change, so each card's ETag/Last-Modified and a hash of its
+select markup are stored: known tickers are requested conditionally, and a
+304 or an unchanged hash only bumps "lastVerifiedAt" ("lastChangedAt" moves
+only when the group or its display name does).
 """
 
 import os
+import re
 import sys
 import time
+import codecs
+import hashlib
 import logging
-from typing import Optional, Dict, List
+import argparse
+import threading
+from typing import Optional, Dict, List, Tuple, Iterable
 from datetime import datetime
+from html.parser import HTMLParser
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import psycopg2
+from psycopg2.extras import execute_values
 import requests
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 
+from request_policy import RateLimiter
+
 # Load environment variables
 load_dotenv()
 
@@ -29,21 +49,204 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+SELECT_START = re.compile(r'<select\b[^>]*ddlMaliTabloGroup', re.IGNORECASE)
+SELECT_END = re.compile(r'</select\s*>', re.IGNORECASE)
+LOOKBEHIND = 1024  # chars kept between chunks so a split opening tag still matches
+
+
+def read_group_select(chunks: Iterable[bytes], encoding: str = 'utf-8') -> Optional[str]:
+    """
+    Raw <select id="ddlMaliTabloGroup">...</select> markup from a page delivered in chunks.
+    
+    Text before the select is only searched for its opening tag, never
+    tokenized, and no more chunks are pulled once the select is closed,
+    so the rest of the page need not be downloaded.
+    
+    Args:
+        chunks: Raw page bytes, e.g. response.iter_content()
+        encoding: Page encoding
+        
+    Returns:
+        The select markup, or None if the page has no such select
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    buffer = ""
+    found = False
+    for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        if not found:
+            match = SELECT_START.search(buffer)
+            if not match:
+                buffer = buffer[-LOOKBEHIND:]
+                continue
+            found = True
+            buffer = buffer[match.start():]
+        end = SELECT_END.search(buffer)
+        if end:
+            return buffer[:end.end()]
+    # Truncated page: whatever part of the select arrived
+    return buffer + decoder.decode(b'', final=True) if found else None
+
+
+class GroupSelectParser(HTMLParser):
+    """Options of one ddlMaliTabloGroup select, read the way BeautifulSoup's html.parser tree would"""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.done = False
+        self.options: List[Tuple[Optional[str], List[str], bool]] = []
+        self._open_options: List[int] = []  # html.parser nests unclosed options, like BeautifulSoup does
+        self._in_text = False  # consecutive data callbacks belong to one text node
+    
+    def handle_starttag(self, tag, attrs):
+        self._in_text = False
+        if self.done or tag != 'option':
+            return
+        attrs = dict(attrs)
+        self._open_options.append(len(self.options))
+        self.options.append((attrs.get('value'), [], 'selected' in attrs))
+    
+    def handle_endtag(self, tag):
+        self._in_text = False
+        if self.done:
+            return
+        if tag == 'option':
+            if self._open_options:
+                self._open_options.pop()
+        elif tag == 'select':
+            self.done = True
+    
+    def handle_data(self, data):
+        if self.done:
+            return
+        for idx in self._open_options:
+            text = self.options[idx][1]
+            if self._in_text:
+                text[-1] += data
+            else:
+                text.append(data)
+        self._in_text = True
+    
+    def result(self) -> List[Tuple[Optional[str], str, bool]]:
+        """(value, display, selected) per option"""
+        # Same display text as BeautifulSoup's get_text(strip=True)
+        return [
+            (value, "".join(piece.strip() for piece in text), selected)
+            for value, text, selected in self.options
+        ]
+
+
+def parse_group_select(markup: str) -> List[Tuple[Optional[str], str, bool]]:
+    """(value, display, selected) per option of markup returned by read_group_select"""
+    parser = GroupSelectParser()
+    parser.feed(markup)
+    parser.close()
+    return parser.result()
+
+
+def extract_group_options(chunks: Iterable[bytes], encoding: str = 'utf-8') -> Optional[List[Tuple[Optional[str], str, bool]]]:
+    """
+    Read ddlMaliTabloGroup options from a page delivered in chunks.
+    
+    Returns:
+        (value, display, selected) per option, or None if the select was not found
+    """
+    markup = read_group_select(chunks, encoding)
+    return None if markup is None else parse_group_select(markup)
+
+
+def parse_group_options_soup(html: str) -> Optional[List[Tuple[Optional[str], str, bool]]]:
+    """
+    Full-page BeautifulSoup parse, same result as extract_group_options.
+    
+    Kept as the reference for scripts/benchmark_group_extraction.py.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    # Find select element
+    select = soup.find('select', id='ddlMaliTabloGroup')
+    if not select:
+        # Try alternative selector
+        select = soup.find('select', attrs={'name': lambda x: x and 'ddlMaliTabloGroup' in x})
+    
+    if not select:
+        return None
+    return [
+        (option.get('value'), option.get_text(strip=True), option.has_attr('selected'))
+        for option in select.find_all('option')
+    ]
+
+
 class FinancialGroupScraper:
     """
     Scraper to extract financial group information from IsYatirim website.
     """
     
-    BASE_URL = "https://www.isyatirim.com.tr/tr-tr/analiz/hisse/Sayfalar/sirket-karti.aspx"
+    HOST = "https://www.isyatirim.com.tr"
+    CARD_PATH = "/tr-tr/analiz/hisse/Sayfalar/sirket-karti.aspx"
+    BASE_URL = HOST + CARD_PATH
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+    }
+    DEFAULT_WORKERS = 8
+    DEFAULT_MAX_RPS = 4.0
+    DEFAULT_BATCH_SIZE = 100
+    DEFAULT_FLUSH_SECONDS = 10.0
+    STREAM_CHUNK_SIZE = 16 * 1024
+    DRAIN_LIMIT = 64 * 1024  # unread bytes still worth reading to keep the connection alive
+    STAGING_TABLE = "company_financial_groups_stage"
     
-    def __init__(self, database_url: str):
-        """Initialize with database connection."""
+    def __init__(
+        self,
+        database_url: str,
+        host: Optional[str] = None,
+        workers: int = DEFAULT_WORKERS,
+        rate_limiter: Optional[RateLimiter] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_seconds: float = DEFAULT_FLUSH_SECONDS,
+        conditional: bool = True
+    ):
+        """
+        Initialize with database connection.
+        
+        Args:
+            database_url: PostgreSQL connection URL
+            host: Optional scheme://host[:port] replacing www.isyatirim.com.tr (e.g. a local stub server)
+            workers: Company cards fetched concurrently
+            rate_limiter: Request budget shared by all workers (default: DEFAULT_MAX_RPS)
+            batch_size: Results written per upsert transaction
+            flush_seconds: Maximum time a scraped result waits before being written
+            conditional: Reuse stored validators and content hashes (False re-parses every card)
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
         # psycopg2 doesn't support 'schema' query parameter - remove it
         self.database_url = database_url.split('?')[0]
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        if host:
+            self.BASE_URL = host.rstrip('/') + self.CARD_PATH
+        self.workers = workers
+        self.rate_limiter = rate_limiter or RateLimiter(max_rps=self.DEFAULT_MAX_RPS, burst=2)
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.conditional = conditional
+        self._conn = None
+        self._known: Dict[str, Dict[str, Optional[str]]] = {}
+        
+        # requests.Session is not thread-safe: each worker thread gets its own
+        self._local = threading.local()
+    
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session bound to the calling thread"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.HEADERS)
+            self._local.session = session
+        return session
     
     def get_tradable_tickers(self) -> List[str]:
         """
@@ -70,83 +273,211 @@ class FinancialGroupScraper:
         logger.info(f"Fetched {len(tickers)} tickers from database (all companies)")
         return tickers
     
+    def load_known_groups(self) -> int:
+        """
+        Load stored groups with their card validators for conditional requests.
+        
+        Returns:
+            Number of tickers loaded
+        """
+        with self._connection().cursor() as cursor:
+            cursor.execute("""
+                SELECT ticker, "financialGroup", "displayName", etag, "lastModified", "contentHash"
+                FROM company_financial_groups
+            """)
+            self._known = {
+                ticker: {
+                    'value': value,
+                    'display': display,
+                    'etag': etag,
+                    'lastModified': last_modified,
+                    'contentHash': content_hash,
+                }
+                for ticker, value, display, etag, last_modified, content_hash in cursor.fetchall()
+            }
+        self._conn.commit()
+        return len(self._known)
+    
     def scrape_financial_group(self, ticker: str) -> Optional[Dict[str, str]]:
         """
         Scrape financial group for a single company.
         
+        Known tickers are requested with If-None-Match / If-Modified-Since,
+        and the select is only parsed when its markup hash changed.
+        
         Args:
             ticker: Company ticker symbol
             
         Returns:
-            Dict with 'value' and 'display' keys, or None if failed
+            Dict with 'value' and 'display' keys plus the card's 'etag',
+            'lastModified', 'contentHash' and 'status' ('not_modified',
+            'unchanged' or 'parsed'), or None if failed
         """
         url = f"{self.BASE_URL}?hisse={ticker}"
+        known = self._known.get(ticker)
+        headers = {}
+        if known and known['etag']:
+            headers['If-None-Match'] = known['etag']
+        if known and known['lastModified']:
+            headers['If-Modified-Since'] = known['lastModified']
         
         try:
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
+            self.rate_limiter.acquire()
+            started = time.monotonic()
+            try:
+                response = self.session.get(url, timeout=15, stream=True, headers=headers)
+            except requests.RequestException:
+                self.rate_limiter.record_response(None, time.monotonic() - started)
+                raise
+            self.rate_limiter.record_response(response.status_code, time.monotonic() - started)
+            with response:
+                validators = {
+                    'etag': response.headers.get('ETag'),
+                    'lastModified': response.headers.get('Last-Modified'),
+                }
+                if response.status_code == 304 and known:
+                    logger.info(f"✅ {ticker}: {known['display']} -> {known['value']}")
+                    logger.debug(f"{ticker}: not modified (304)")
+                    return {
+                        **known,
+                        'etag': validators['etag'] or known['etag'],
+                        'lastModified': validators['lastModified'] or known['lastModified'],
+                        'status': 'not_modified',
+                    }
+                response.raise_for_status()
+                markup = read_group_select(
+                    response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE),
+                    response.encoding or 'utf-8'
+                )
+                self._release(response)
             
-            # Find select element
-            select = soup.find('select', id='ddlMaliTabloGroup')
-            if not select:
-                # Try alternative selector
-                select = soup.find('select', attrs={'name': lambda x: x and 'ddlMaliTabloGroup' in x})
-            
-            if not select:
+            if markup is None:
                 logger.warning(f"{ticker}: ddlMaliTabloGroup select not found")
                 return None
             
-            # Find selected option
-            selected_option = select.find('option', selected=True)
-            if not selected_option:
-                # If no selected, take first option
-                selected_option = select.find('option')
+            content_hash = hashlib.sha256(markup.encode('utf-8')).hexdigest()
+            if known and known['contentHash'] == content_hash:
+                logger.info(f"✅ {ticker}: {known['display']} -> {known['value']}")
+                logger.debug(f"{ticker}: select markup unchanged")
+                return {**known, **validators, 'contentHash': content_hash, 'status': 'unchanged'}
+            
+            options = parse_group_select(markup)
+            
+            # Find selected option; if none is selected, take the first one
+            selected_option = next((option for option in options if option[2]), options[0] if options else None)
             
             if not selected_option:
                 logger.warning(f"{ticker}: No options found in select")
                 return None
             
-            value = selected_option.get('value')
-            display = selected_option.get_text(strip=True)
+            value, display, _ = selected_option
             
             if not value:
                 logger.warning(f"{ticker}: Option has no value attribute")
                 return None
             
             logger.info(f"✅ {ticker}: {display} -> {value}")
-            return {'value': value, 'display': display}
+            return {'value': value, 'display': display, **validators, 'contentHash': content_hash, 'status': 'parsed'}
         
         except Exception as e:
             logger.error(f"❌ {ticker}: {str(e)}")
             return None
     
-    def upsert_financial_group(self, ticker: str, financial_group: str, display_name: str):
+    def _connection(self):
         """
-        Upsert financial group to database.
+        Single connection reused for every batch, with its session staging table.
         
-        Args:
-            ticker: Company ticker
-            financial_group: API value (e.g., 'UFRS_K')
-            display_name: Display text (e.g., 'Konsolide UFRS')
+        Reconnects if the previous connection was lost.
         """
-        conn = psycopg2.connect(self.database_url)
-        cursor = conn.cursor()
+        if self._conn is None or self._conn.closed:
+            self._conn = psycopg2.connect(self.database_url)
+            with self._conn.cursor() as cursor:
+                cursor.execute(f"""
+                    CREATE TEMP TABLE {self.STAGING_TABLE} (
+                        ticker VARCHAR(16),
+                        "financialGroup" VARCHAR(32),
+                        "displayName" VARCHAR(128),
+                        etag VARCHAR(256),
+                        "lastModified" VARCHAR(64),
+                        "contentHash" VARCHAR(64)
+                    ) ON COMMIT DELETE ROWS
+                """)
+            self._conn.commit()
+        return self._conn
+    
+    def _release(self, response: requests.Response):
+        """
+        Finish a response whose body was read only partially.
         
-        cursor.execute("""
-            INSERT INTO company_financial_groups (ticker, "financialGroup", "displayName", "createdAt", "updatedAt")
-            VALUES (%s, %s, %s, NOW(), NOW())
-            ON CONFLICT (ticker)
-            DO UPDATE SET
-                "financialGroup" = EXCLUDED."financialGroup",
-                "displayName" = EXCLUDED."displayName",
-                "updatedAt" = NOW()
-        """, (ticker, financial_group, display_name))
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
+        A short unread tail is drained so the keep-alive connection goes
+        back to the pool; a long one is dropped with the connection.
+        """
+        length = response.headers.get('Content-Length')
+        if length is None or not length.isdigit():
+            return
+        if int(length) - response.raw.tell() <= self.DRAIN_LIMIT:
+            for _ in response.iter_content(chunk_size=self.DRAIN_LIMIT):
+                pass
+    
+    def upsert_financial_groups(self, rows: List[Tuple[str, str, str, Optional[str], Optional[str], Optional[str]]]):
+        """
+        Upsert a batch of financial groups in one transaction.
+        
+        Rows are loaded into the staging table with execute_values and merged
+        with a single INSERT ... ON CONFLICT. Every row counts as verified now;
+        "lastChangedAt" only moves when the group or display name differs.
+        
+        Args:
+            rows: (ticker, financial_group, display_name, etag, last_modified, content_hash) tuples,
+                e.g. ('AGESA', 'UFRS_K', 'Konsolide UFRS', '"5d1f..."', None, '9b0c...')
+        """
+        conn = self._connection()
+        try:
+            with conn.cursor() as cursor:
+                execute_values(
+                    cursor,
+                    f'INSERT INTO {self.STAGING_TABLE} '
+                    f'(ticker, "financialGroup", "displayName", etag, "lastModified", "contentHash") VALUES %s',
+                    rows,
+                    page_size=len(rows)
+                )
+                cursor.execute(f"""
+                    INSERT INTO company_financial_groups AS cfg (
+                        ticker, "financialGroup", "displayName", etag, "lastModified", "contentHash",
+                        "lastVerifiedAt", "lastChangedAt", "createdAt", "updatedAt"
+                    )
+                    SELECT DISTINCT ON (ticker)
+                        ticker, "financialGroup", "displayName", etag, "lastModified", "contentHash",
+                        NOW(), NOW(), NOW(), NOW()
+                    FROM {self.STAGING_TABLE}
+                    ORDER BY ticker
+                    ON CONFLICT (ticker)
+                    DO UPDATE SET
+                        "financialGroup" = EXCLUDED."financialGroup",
+                        "displayName" = EXCLUDED."displayName",
+                        etag = EXCLUDED.etag,
+                        "lastModified" = EXCLUDED."lastModified",
+                        "contentHash" = EXCLUDED."contentHash",
+                        "lastVerifiedAt" = NOW(),
+                        "lastChangedAt" = CASE
+                            WHEN (cfg."financialGroup", cfg."displayName")
+                                IS DISTINCT FROM (EXCLUDED."financialGroup", EXCLUDED."displayName")
+                            THEN NOW()
+                            ELSE cfg."lastChangedAt"
+                        END,
+                        "updatedAt" = NOW()
+                """)
+            conn.commit()
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+    
+    def close(self):
+        """Close the database connection"""
+        if self._conn is not None and not self._conn.closed:
+            self._conn.close()
+        self._conn = None
     
     def scrape_all_companies(self, tickers: List[str]) -> Dict[str, Optional[Dict]]:
         """
@@ -158,50 +489,124 @@ class FinancialGroupScraper:
         Returns:
             Dictionary mapping ticker to financial group info
         """
-        results = {}
         total = len(tickers)
         success_count = 0
         failed_count = 0
+        pending: Dict[str, Tuple[str, str, str, Optional[str], Optional[str], Optional[str]]] = {}
+        statuses = {'not_modified': 0, 'unchanged': 0, 'parsed': 0}
+        last_flush = time.monotonic()
         
         logger.info("=" * 80)
         logger.info("Starting financial group scraping...")
         logger.info(f"Total companies: {total}")
+        logger.debug(f"Workers: {self.workers}, max {self.rate_limiter.max_rps:g} req/s")
         logger.info("=" * 80)
         
-        for i, ticker in enumerate(tickers, 1):
+        def scrape(i: int, ticker: str) -> Optional[Dict[str, str]]:
             logger.info(f"[{i}/{total}] Processing {ticker}...")
-            
-            financial_group_info = self.scrape_financial_group(ticker)
-            results[ticker] = financial_group_info
-            
-            if financial_group_info:
-                # Upsert to database
-                try:
-                    self.upsert_financial_group(
-                        ticker,
-                        financial_group_info['value'],
-                        financial_group_info['display']
-                    )
-                    success_count += 1
-                except Exception as e:
+            return self.scrape_financial_group(ticker)
+        
+        def flush():
+            nonlocal success_count, failed_count, last_flush
+            last_flush = time.monotonic()
+            if not pending:
+                return
+            rows = list(pending.values())
+            pending.clear()
+            try:
+                self.upsert_financial_groups(rows)
+                success_count += len(rows)
+            except Exception as e:
+                for ticker, *_ in rows:
                     logger.error(f"Failed to upsert {ticker}: {e}")
-                    failed_count += 1
-            else:
-                failed_count += 1
-            
-            # Polite scraping: small delay
-            time.sleep(0.5)
+                failed_count += len(rows)
+        
+        # Keep the input order in the results whatever order pages complete in
+        results = dict.fromkeys(tickers)
+        try:
+            if self.conditional:
+                logger.debug(f"Stored groups for conditional requests: {self.load_known_groups()}")
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="card") as executor:
+                futures = {
+                    executor.submit(scrape, i, ticker): ticker
+                    for i, ticker in enumerate(tickers, 1)
+                }
+                # Upserts stay on this thread, batched over one connection
+                for future in as_completed(futures):
+                    ticker = futures[future]
+                    financial_group_info = future.result()
+                    results[ticker] = financial_group_info
+                    
+                    if financial_group_info:
+                        statuses[financial_group_info['status']] += 1
+                        pending[ticker] = (
+                            ticker,
+                            financial_group_info['value'],
+                            financial_group_info['display'],
+                            financial_group_info['etag'],
+                            financial_group_info['lastModified'],
+                            financial_group_info['contentHash'],
+                        )
+                    else:
+                        failed_count += 1
+                    
+                    if len(pending) >= self.batch_size or time.monotonic() - last_flush >= self.flush_seconds:
+                        flush()
+            flush()
+        finally:
+            self.close()
         
         logger.info("=" * 80)
         logger.info(f"Scraping completed!")
         logger.info(f"Success: {success_count}/{total}")
         logger.info(f"Failed: {failed_count}/{total}")
+        logger.debug(
+            f"Not modified (304): {statuses['not_modified']}, "
+            f"unchanged card: {statuses['unchanged']}, parsed: {statuses['parsed']}"
+        )
         logger.info("=" * 80)
         
         return results
 
 def main():
     """Main function to scrape financial groups for all tradable companies."""
+    parser = argparse.ArgumentParser(description="Scrape each company's financial group from Is Yatirim")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("FINANCIAL_GROUPS_WORKERS", FinancialGroupScraper.DEFAULT_WORKERS)),
+        help="Company cards fetched concurrently (env: FINANCIAL_GROUPS_WORKERS)"
+    )
+    parser.add_argument(
+        "--max-rps",
+        type=float,
+        default=float(os.getenv("FINANCIAL_GROUPS_MAX_RPS", FinancialGroupScraper.DEFAULT_MAX_RPS)),
+        help="Global request budget towards Is Yatirim, requests/sec (env: FINANCIAL_GROUPS_MAX_RPS)"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=FinancialGroupScraper.DEFAULT_BATCH_SIZE,
+        help="Results written per upsert transaction (default: 100)"
+    )
+    parser.add_argument(
+        "--flush-seconds",
+        type=float,
+        default=FinancialGroupScraper.DEFAULT_FLUSH_SECONDS,
+        help="Maximum time a scraped result waits before being written (default: 10)"
+    )
+    parser.add_argument(
+        "--full-refresh",
+        action="store_true",
+        help="Ignore stored ETag/Last-Modified and content hashes; download and parse every card"
+    )
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.max_rps <= 0:
+        parser.error("--max-rps must be positive")
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
     
     # Get DATABASE_URL from environment
     database_url = os.getenv("DATABASE_URL")
@@ -209,7 +614,16 @@ def main():
         logger.error("DATABASE_URL environment variable not set")
         sys.exit(1)
     
-    scraper = FinancialGroupScraper(database_url)
+    # ISYATIRIM_BASE_URL points the scraper at another host (e.g. scripts/isyatirim_stub_server.py)
+    scraper = FinancialGroupScraper(
+        database_url,
+        host=os.getenv("ISYATIRIM_BASE_URL"),
+        workers=args.workers,
+        rate_limiter=RateLimiter(max_rps=args.max_rps, burst=2),
+        batch_size=args.batch_size,
+        flush_seconds=args.flush_seconds,
+        conditional=not args.full_refresh
+    )
     
     # Get all tradable tickers from DB
     tickers = scraper.get_tradable_tickers()
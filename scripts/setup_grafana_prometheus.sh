@@ -98,6 +98,12 @@ sudo tee -a /etc/prometheus/prometheus.yml > /dev/null << EOF
   - job_name: 'node'
     static_configs:
       - targets: ['localhost:9100']
+
+  # financial_scraper_v2.py --metrics-port 9464 (only up while a run is in progress;
+  # PM2/cron runs can use --metrics-textfile via node_exporter instead)
+  - job_name: 'financial_scraper'
+    static_configs:
+      - targets: ['localhost:9464']
 EOF
 
 # Restart Prometheus
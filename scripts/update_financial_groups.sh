@@ -45,13 +45,14 @@ echo -e "${GREEN}📊 Updated database records: $AFTER_COUNT${NC}"
 
 # Export to CSV for Git tracking
 echo -e "${YELLOW}📤 Exporting to CSV for version control...${NC}"
-psql "$DATABASE_URL" -c "COPY (SELECT * FROM company_financial_groups ORDER BY ticker) TO STDOUT WITH CSV HEADER" > "$PROJECT_DIR/data/company_financial_groups.csv"
+# Card validators (etag, contentHash, ...) are scraper state, not versioned data
+psql "$DATABASE_URL" -c "COPY (SELECT id, ticker, \"financialGroup\", \"displayName\", \"createdAt\", \"updatedAt\" FROM company_financial_groups ORDER BY ticker) TO STDOUT WITH CSV HEADER" > "$PROJECT_DIR/data/company_financial_groups.csv"
 
 CSV_ROWS=$(tail -n +2 "$PROJECT_DIR/data/company_financial_groups.csv" | wc -l | tr -d ' ')
 echo -e "${GREEN}✅ Exported $CSV_ROWS companies to CSV${NC}"
 
 # Show any changes in financial groups
-echo -e "${YELLOW}📋 Recent updates (last 24 hours):${NC}"
-psql "$DATABASE_URL" -c "SELECT ticker, \"financialGroup\", \"displayName\", \"updatedAt\" FROM company_financial_groups WHERE \"updatedAt\" > NOW() - INTERVAL '24 hours' ORDER BY \"updatedAt\" DESC LIMIT 10;"
+echo -e "${YELLOW}📋 Recent changes (last 24 hours):${NC}"
+psql "$DATABASE_URL" -c "SELECT ticker, \"financialGroup\", \"displayName\", \"lastChangedAt\" FROM company_financial_groups WHERE \"lastChangedAt\" > NOW() - INTERVAL '24 hours' ORDER BY \"lastChangedAt\" DESC LIMIT 10;"
 
 echo -e "${GREEN}✨ Done! Consider committing the updated CSV to Git.${NC}"